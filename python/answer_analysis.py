@@ -0,0 +1,272 @@
+"""
+Local answer analysis for Mock Interview AI
+
+Each answer is tokenized in one streaming pass. The tokens are fed through
+a token-level Aho-Corasick automaton holding the skill's concept phrases
+(unigrams and adjacent bigrams taken from the text and follow-ups of the
+skill's questions) together with STAR cue phrases (Situation, Task, Action,
+Result). At the same time the answer's own phrases are collected, to measure
+how much of its question it covers.
+
+The resulting quality in [0, 1] is averaged per skill and turned into a
+per-skill score adjustment, which replaces the random skill jitter wherever
+answer text is available.
+"""
+
+import re
+import threading
+import weakref
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from mock_interview_ai import Question, QuestionBank
+
+# Quality weights (they sum to 1) and the amounts that count as full marks
+QUESTION_COVERAGE_WEIGHT = 0.35
+CONCEPT_WEIGHT = 0.25
+STAR_WEIGHT = 0.2
+DEPTH_WEIGHT = 0.2
+QUESTION_COVERAGE_TARGET = 6  # question phrases mentioned
+CONCEPT_TARGET = 8  # distinct skill concepts mentioned
+DEPTH_TARGET = 60  # tokens
+
+# Skill scores move by at most this much around the overall score
+SKILL_ADJUSTMENT_RANGE = 15
+
+# Questions indexed per skill; larger skills are sampled evenly
+MAX_INDEXED_QUESTIONS = 5000
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:['+#][a-z0-9+#]*)*")
+
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just me more most my no nor not now of off on once only or
+other our ours out over own same she should so some such than that the their them then there these they
+this those through to too under until up very was we were what when where which while who whom why will
+with would you your yours yourself explain describe walk tell give example examples approach use using
+used way ways think thought process let like make sure one two thing things get got
+""".split())
+
+# STAR cue phrases, matched on the raw token stream (stop words included)
+STAR_CUES: Dict[str, Tuple[str, ...]] = {
+    "situation": ("when i was", "at my previous", "at my last", "in my last", "in my previous", "we had a",
+                  "our team", "the situation", "the context", "the project", "last year", "in a previous role"),
+    "task": ("my task", "i was responsible", "i was asked", "the goal was", "our goal", "the challenge was",
+             "i needed to", "we needed to", "my role", "the requirement"),
+    "action": ("i decided", "i implemented", "i built", "i designed", "i wrote", "i led", "i introduced",
+               "i proposed", "i set up", "i created", "i refactored", "i added", "i started by", "we implemented",
+               "first i", "then i"),
+    "result": ("as a result", "the result", "resulted in", "which reduced", "which improved", "we reduced",
+               "we improved", "we increased", "i reduced", "i improved", "the outcome", "in the end",
+               "percent", "led to"),
+}
+STAR_COMPONENTS = tuple(STAR_CUES)
+
+def normalize(token: str) -> str:
+    """Fold simple plural forms so "queues" matches "queue" """
+    if token.endswith("'s"):
+        token = token[:-2]
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+def tokenize(text: str) -> Iterator[str]:
+    """Stream the normalized tokens of a text"""
+    for match in _TOKEN.finditer(text.lower()):
+        yield normalize(match.group())
+
+def _is_content(token: str) -> bool:
+    return len(token) > 2 and token not in STOP_WORDS and not token.isdigit()
+
+def phrases(text: str) -> Set[Tuple[str, ...]]:
+    """Content unigrams and adjacent content bigrams of a text"""
+    found: Set[Tuple[str, ...]] = set()
+    previous = None
+    for token in tokenize(text):
+        if _is_content(token):
+            found.add((token,))
+            if previous is not None:
+                found.add((previous, token))
+            previous = token
+        else:
+            previous = None
+    return found
+
+def question_phrases(question: Question) -> FrozenSet[Tuple[str, ...]]:
+    """Phrases of a question's text and follow-ups"""
+    return _question_phrases(question.text, tuple(question.follow_ups))
+
+@lru_cache(maxsize=65536)
+def _question_phrases(text: str, follow_ups: Tuple[str, ...]) -> FrozenSet[Tuple[str, ...]]:
+    found = phrases(text)
+    for follow_up in follow_ups:
+        found |= phrases(follow_up)
+    return frozenset(found)
+
+class PhraseAutomaton:
+    """Aho-Corasick automaton over token sequences
+
+    Phrase ids are positions in ``phrases``. step() advances the state by
+    one token and outputs(state) gives the ids of every phrase ending there.
+    """
+
+    def __init__(self, phrase_list: Iterable[Tuple[str, ...]]):
+        self.phrases: List[Tuple[str, ...]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for phrase in dict.fromkeys(phrase_list):
+            state = 0
+            for token in phrase:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = self._goto[state][token] = len(self._goto)
+                    self._goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(len(self.phrases))
+            self.phrases.append(phrase)
+
+        # Breadth-first failure links, merging the outputs of each fallback state
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+                queue.append(child)
+        self._outputs: List[Tuple[int, ...]] = [tuple(output) for output in outputs]
+
+    def step(self, state: int, token: str) -> int:
+        goto = self._goto
+        while state and token not in goto[state]:
+            state = self._fail[state]
+        return goto[state].get(token, 0)
+
+    def outputs(self, state: int) -> Tuple[int, ...]:
+        return self._outputs[state]
+
+class AnswerAnalysis(NamedTuple):
+    """What one answer covers"""
+    tokens: int
+    question_coverage: float  # share of QUESTION_COVERAGE_TARGET question phrases mentioned
+    concepts: int  # distinct skill concepts mentioned
+    star: Tuple[bool, bool, bool, bool]  # situation, task, action, result
+    quality: float  # weighted combination in [0, 1]
+
+class SkillIndex:
+    """Concept phrases of one skill plus the STAR cues, in one automaton"""
+
+    def __init__(self, questions: Iterable[Question]):
+        concepts: Set[Tuple[str, ...]] = set()
+        for question in questions:
+            concepts |= question_phrases(question)
+        star_phrases = [(component, tuple(tokenize(cue))) for component, cues in STAR_CUES.items() for cue in cues]
+        self.automaton = PhraseAutomaton(list(concepts) + [phrase for _, phrase in star_phrases])
+        # Phrase id -> STAR component index, or -1 for a concept
+        by_phrase = {phrase: STAR_COMPONENTS.index(component) for component, phrase in star_phrases}
+        self.star_component = [by_phrase.get(phrase, -1) for phrase in self.automaton.phrases]
+
+    def analyze(self, text: str, question: Optional[Question] = None) -> AnswerAnalysis:
+        """Analyze an answer in one pass over its tokens"""
+        automaton = self.automaton
+        star_component = self.star_component
+        targets = question_phrases(question) if question is not None else frozenset()
+        concepts: Set[int] = set()
+        star = [False, False, False, False]
+        covered: Set[Tuple[str, ...]] = set()
+        state = 0
+        tokens = 0
+        previous = None
+        for token in tokenize(text):
+            tokens += 1
+            state = automaton.step(state, token)
+            for phrase_id in automaton.outputs(state):
+                component = star_component[phrase_id]
+                if component < 0:
+                    concepts.add(phrase_id)
+                else:
+                    star[component] = True
+            if targets:
+                if (token,) in targets:
+                    covered.add((token,))
+                if previous is not None and (previous, token) in targets:
+                    covered.add((previous, token))
+            previous = token
+
+        coverage = min(1.0, len(covered) / min(QUESTION_COVERAGE_TARGET, len(targets))) if targets else 0.0
+        quality = (QUESTION_COVERAGE_WEIGHT * coverage
+                   + CONCEPT_WEIGHT * min(1.0, len(concepts) / CONCEPT_TARGET)
+                   + STAR_WEIGHT * sum(star) / len(star)
+                   + DEPTH_WEIGHT * min(1.0, tokens / DEPTH_TARGET))
+        return AnswerAnalysis(tokens, coverage, len(concepts), tuple(star), quality)
+
+class AnswerAnalyzer:
+    """Per-skill indexes over a question bank, built lazily on first use"""
+
+    def __init__(self, question_bank: QuestionBank, max_indexed_questions: int = MAX_INDEXED_QUESTIONS):
+        self.question_bank = question_bank
+        self.max_indexed_questions = max_indexed_questions
+        self._indexes: Dict[str, SkillIndex] = {}
+        self._lock = threading.Lock()
+
+    def index(self, skill: str) -> SkillIndex:
+        """Get (building if needed) the index of a skill"""
+        skill_index = self._indexes.get(skill)
+        if skill_index is None:
+            with self._lock:
+                skill_index = self._indexes.get(skill)
+                if skill_index is None:
+                    skill_index = self._indexes[skill] = SkillIndex(self._indexed_questions(skill))
+        return skill_index
+
+    def build(self, skills: Optional[Iterable[str]] = None) -> None:
+        """Build the indexes up front (of every skill by default)"""
+        for skill in self.question_bank.skills() if skills is None else skills:
+            self.index(skill)
+
+    def analyze(self, question: Question, text: str) -> AnswerAnalysis:
+        """Analyze an answer to a question"""
+        return self.index(question.skill).analyze(text, question)
+
+    def _indexed_questions(self, skill: str) -> Iterator[Question]:
+        handles = [handle for handles in self.question_bank.buckets(skill) for handle in handles]
+        stride = max(1, -(-len(handles) // self.max_indexed_questions))
+        for handle in handles[::stride]:
+            yield self.question_bank.load(handle)
+
+_analyzers: "weakref.WeakKeyDictionary[QuestionBank, AnswerAnalyzer]" = weakref.WeakKeyDictionary()
+_analyzers_lock = threading.Lock()
+
+def analyzer_for(question_bank: QuestionBank) -> AnswerAnalyzer:
+    """Get the shared analyzer of a question bank"""
+    analyzer = _analyzers.get(question_bank)
+    if analyzer is None:
+        with _analyzers_lock:
+            analyzer = _analyzers.get(question_bank)
+            if analyzer is None:
+                analyzer = _analyzers[question_bank] = AnswerAnalyzer(question_bank)
+    return analyzer
+
+def skill_adjustment(quality_sum: float, answers: int) -> Optional[int]:
+    """Score adjustment of a skill from its answers' summed quality (None without answers)"""
+    if not answers:
+        return None
+    return round(SKILL_ADJUSTMENT_RANGE * (2 * quality_sum / answers - 1))
+
+def skill_adjustments(analyzer: AnswerAnalyzer, answers: Iterable, selected_skills: Sequence[str]) -> Tuple[Optional[int], ...]:
+    """Per-skill adjustments for a list of answers, aligned with selected_skills"""
+    totals = {skill: [0, 0.0] for skill in selected_skills}
+    for answer in answers:
+        tally = totals.get(answer.question.skill)
+        if tally is not None:
+            tally[0] += 1
+            tally[1] += analyzer.analyze(answer.question, answer.text).quality
+    return tuple(skill_adjustment(quality_sum, count) for count, quality_sum in
+                 (totals[skill] for skill in selected_skills))
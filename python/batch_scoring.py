@@ -0,0 +1,144 @@
+"""
+Batch scoring engine for Mock Interview AI
+
+Scores many sessions at once from columnar metrics (answer counts, answer
+length sums, follow-up counts, skill counts, session seeds and, optionally,
+per-skill adjustments from answer analysis). With NumPy
+the whole batch is scored in a few array operations; without it each session
+goes through the scalar rules. Both give exactly the scores that
+InterviewSession.generate_feedback gives for the same session seed.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from mock_interview_ai import (
+    BASE_SCORE, COMPLETION_BONUSES, EARLY_END_PENALTY, EARLY_END_RATIO, FOLLOW_UP_BONUS,
+    FOLLOW_UP_BONUS_CAP, LENGTH_BONUSES, MAX_SCORE, SKILL_JITTER, SKILL_SCORE_FLOOR,
+    CounterRandom, Feedback, InterviewDomain, MockInterviewAI, _counter_uniforms, _seed_key,
+    completion_ratio, np, score_metrics, skill_scores, stream_seed
+)
+
+@dataclass
+class BatchScores:
+    """Columnar scores of a batch of sessions
+
+    Rows of ``skill_scores`` are padded with -1 past each session's skill
+    count; sessions without answers score 0 and have no skill scores.
+    """
+    answer_counts: Sequence[int]
+    avg_lengths: Sequence[float]
+    follow_up_counts: Sequence[int]
+    scores: Sequence[int]
+    early_end_penalty: Sequence[bool]
+    skill_scores: Sequence[Sequence[int]]
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def skill_scores_for(self, index: int) -> List[int]:
+        """Get the skill scores of one session"""
+        return [int(score) for score in self.skill_scores[index] if score >= 0]
+
+    def feedback(self, index: int, domain: InterviewDomain, selected_skills: List[str],
+                 ai: Optional[MockInterviewAI] = None) -> Feedback:
+        """Build the full Feedback of one session"""
+        ai = ai or MockInterviewAI()
+        num_answers = int(self.answer_counts[index])
+        if not num_answers:
+            return ai.feedback_from_metrics(0, 0, 0, domain, selected_skills)
+        return ai.compose_feedback(
+            int(self.scores[index]), self.skill_scores_for(index), num_answers,
+            float(self.avg_lengths[index]), int(self.follow_up_counts[index]),
+            domain, selected_skills
+        )
+
+def feedback_key(seed) -> int:
+    """Stream key of the skill-score draws of a session seed"""
+    return _seed_key(stream_seed(seed, "feedback"))
+
+def score_sessions(answer_counts: Sequence[int], length_sums: Sequence[int],
+                   follow_up_counts: Sequence[int], skill_counts: Sequence[int],
+                   seeds: Sequence, vectorized: Optional[bool] = None,
+                   skill_adjustments: Optional[Sequence[Sequence[Optional[int]]]] = None) -> BatchScores:
+    """Score a batch of sessions given one column per metric
+
+    ``seeds`` are session seeds (InterviewSession.seed). ``skill_adjustments``
+    holds one row per session (InterviewSession.skill_adjustments()); skills
+    without an adjustment, or all of them when it is omitted, get random
+    jitter. ``vectorized`` defaults to using NumPy when it is installed.
+    """
+    if skill_adjustments is None:
+        skill_adjustments = [()] * len(seeds)
+    elif len(skill_adjustments) != len(seeds):
+        raise ValueError(f"Expected {len(seeds)} rows of skill adjustments, got {len(skill_adjustments)}")
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized:
+        return _score_sessions_numpy(answer_counts, length_sums, follow_up_counts, skill_counts, seeds,
+                                     skill_adjustments)
+    return _score_sessions_python(answer_counts, length_sums, follow_up_counts, skill_counts, seeds,
+                                  skill_adjustments)
+
+def _score_sessions_python(answer_counts, length_sums, follow_up_counts, skill_counts, seeds,
+                           skill_adjustments) -> BatchScores:
+    width = max(skill_counts, default=0)
+    avg_lengths, scores, penalties, per_skill = [], [], [], []
+    for num_answers, length_sum, follow_ups, num_skills, seed, adjustments in zip(
+            answer_counts, length_sums, follow_up_counts, skill_counts, seeds, skill_adjustments):
+        if not num_answers:
+            avg_lengths.append(0.0)
+            scores.append(0)
+            penalties.append(False)
+            per_skill.append([-1] * width)
+            continue
+        avg_length = length_sum / num_answers
+        score = score_metrics(num_answers, avg_length, follow_ups, num_skills)
+        rng = CounterRandom(stream_seed(seed, "feedback"))
+        avg_lengths.append(avg_length)
+        scores.append(score)
+        penalties.append(completion_ratio(num_answers, num_skills) < EARLY_END_RATIO)
+        per_skill.append(skill_scores(score, num_skills, rng.random, adjustments) + [-1] * (width - num_skills))
+    return BatchScores(list(answer_counts), avg_lengths, list(follow_up_counts), scores, penalties, per_skill)
+
+def _score_sessions_numpy(answer_counts, length_sums, follow_up_counts, skill_counts, seeds,
+                          skill_adjustments) -> BatchScores:
+    counts = np.asarray(answer_counts, dtype=np.int64)
+    sums = np.asarray(length_sums, dtype=np.int64)
+    follow_ups = np.asarray(follow_up_counts, dtype=np.int64)
+    num_skills = np.asarray(skill_counts, dtype=np.int64)
+    answered = counts > 0
+
+    avg_lengths = np.where(answered, sums / np.maximum(counts, 1), 0.0)
+    scores = np.full(len(counts), BASE_SCORE, dtype=np.int64)
+    for threshold, bonus in LENGTH_BONUSES:
+        scores += np.where(avg_lengths > threshold, bonus, 0)
+    for threshold, bonus in COMPLETION_BONUSES:
+        scores += np.where(counts >= threshold, bonus, 0)
+    scores += np.minimum(follow_ups * FOLLOW_UP_BONUS, FOLLOW_UP_BONUS_CAP)
+    penalties = answered & (counts / np.maximum(1, num_skills * 2) < EARLY_END_RATIO)
+    scores -= np.where(penalties, EARLY_END_PENALTY, 0)
+    scores = np.where(answered, np.minimum(scores, MAX_SCORE), 0)
+
+    width = int(num_skills.max()) if len(num_skills) else 0
+    keys = np.array([feedback_key(seed) for seed in seeds], dtype=np.uint64)
+    draws = _counter_uniforms(keys, 0, width)
+    span = 2 * SKILL_JITTER + 1
+    jitter = np.minimum(np.floor(draws * span), span - 1).astype(np.int64) - SKILL_JITTER
+    per_skill = np.maximum(SKILL_SCORE_FLOOR, scores[:, None] + jitter)
+
+    # Analysis adjustments replace the jitter where present
+    adjusted = np.zeros((len(counts), width), dtype=bool)
+    adjustment = np.zeros((len(counts), width), dtype=np.int64)
+    for row, adjustments in enumerate(skill_adjustments):
+        for column, value in enumerate(adjustments[:width]):
+            if value is not None:
+                adjusted[row, column] = True
+                adjustment[row, column] = value
+    if adjusted.any():
+        analyzed = np.clip(scores[:, None] + adjustment, SKILL_SCORE_FLOOR, MAX_SCORE)
+        per_skill = np.where(adjusted, analyzed, per_skill)
+    valid = answered[:, None] & (np.arange(width)[None, :] < num_skills[:, None])
+    per_skill = np.where(valid, per_skill, -1)
+
+    return BatchScores(counts, avg_lengths, follow_ups, scores, penalties, per_skill)
@@ -0,0 +1,5 @@
+"""Benchmarks for the Mock Interview AI Python engine
+
+Run from the ``python/`` directory, e.g. ``python -m benchmarks.bench_session_creation``.
+``python -m benchmarks.suite`` runs the end-to-end suite against a saved baseline.
+"""
@@ -0,0 +1,59 @@
+"""
+Adaptive session benchmark: fixed sessions (every question selected up
+front) against adaptive ones (each question picked when reached) over a
+synthetic bank. Reports creation latency, the cost of a whole session that
+ends early after a few answers, and the mean latency of picking a question.
+"""
+
+import argparse
+import random
+import time
+
+from mock_interview_ai import Difficulty, InterviewSession, InterviewSettings, MockInterviewAI
+
+from benchmarks.suite import answer_pool
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+def run(ai: MockInterviewAI, settings: InterviewSettings, sessions: int, answered: int, answers) -> dict:
+    domain = ai.domains[0]
+    clock = time.perf_counter
+    create = pick = 0.0
+    picks = 0
+    start_all = clock()
+    for i in range(sessions):
+        start = clock()
+        session = InterviewSession(domain, SKILLS[:3], settings, ai=ai, seed=i)
+        create += clock() - start
+        for j in range(answered):
+            start = clock()
+            session.get_current_question()
+            pick += clock() - start
+            picks += 1
+            session.submit_answer(answers[(i + j) % len(answers)])
+        session.end_interview_early()
+    return {
+        "create_us": create / sessions * 1e6,
+        "session_us": (clock() - start_all) / sessions * 1e6,
+        "pick_us": pick / max(1, picks) * 1e6,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bank-size", type=int, default=10 ** 6)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--answered", type=int, default=3, help="answers before each session ends early")
+    args = parser.parse_args()
+
+    ai = MockInterviewAI(registry=synthetic_registry(args.bank_size))
+    answers = answer_pool(200, random.Random(0))
+    print(f"{'mode':>9} {'create us':>10} {'pick us':>8} {'session us':>11}")
+    for adaptive in (False, True):
+        settings = InterviewSettings(number_of_questions=args.questions, difficulty=Difficulty.MIXED,
+                                     adaptive=adaptive)
+        result = run(ai, settings, args.sessions, args.answered, answers)
+        print(f"{'adaptive' if adaptive else 'fixed':>9} {result['create_us']:10.1f} {result['pick_us']:8.1f} "
+              f"{result['session_us']:11.1f}")
+
+if __name__ == "__main__":
+    main()
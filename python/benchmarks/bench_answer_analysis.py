@@ -0,0 +1,47 @@
+"""
+Answer analysis benchmark: answers analyzed per second on one core for
+answers of typical lengths, and the one-off cost of building a skill index
+over banks of growing size.
+"""
+
+import argparse
+import random
+import time
+
+from mock_interview_ai import get_registry
+
+from answer_analysis import AnswerAnalyzer, analyzer_for
+from benchmarks.suite import answer_pool
+from benchmarks.synthetic import SKILLS, SyntheticQuestionBank
+
+STAR_ANSWER = ("At my previous job our team needed a faster routing service. I decided to use Dijkstra's "
+               "algorithm with a priority queue over the graph and relaxed each edge once. As a result we "
+               "reduced latency by forty percent.")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--answers", type=int, default=20000)
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest bank is 10**max_exponent questions")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    analyzer = analyzer_for(registry.question_bank)
+    questions = [question for _, skill_questions in registry.question_bank.items() for question in skill_questions]
+    answers = answer_pool(1000, random.Random(0)) + [STAR_ANSWER] * 100
+    analyzer.build()
+
+    start = time.perf_counter()
+    for i in range(args.answers):
+        analyzer.analyze(questions[i % len(questions)], answers[i % len(answers)])
+    elapsed = time.perf_counter() - start
+    print(f"analysis: {args.answers / elapsed:10.0f} answers/s")
+
+    print(f"{'bank size':>10} {'index build s':>14}")
+    for exponent in range(2, args.max_exponent + 1):
+        bank = SyntheticQuestionBank(10 ** exponent)
+        start = time.perf_counter()
+        AnswerAnalyzer(bank).build(SKILLS)
+        print(f"{10 ** exponent:>10} {time.perf_counter() - start:14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Columnar export benchmark: export rate of completed sessions into chunked
+columns, and aggregation rate of columnar analytics against a pass over
+Feedback objects computing the same score histogram and per-skill means.
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from mock_interview_ai import MockInterviewAI, get_registry
+
+from columnar_export import ColumnarWriter, aggregate
+
+def feedback_pool(count: int, rng: random.Random):
+    ai = MockInterviewAI()
+    domain = get_registry().domains[0]
+    pool = []
+    for _ in range(count):
+        skills = rng.sample(domain.skills, rng.randint(1, len(domain.skills)))
+        answers = rng.randint(1, 8)
+        pool.append((ai.feedback_from_metrics(answers, answers * rng.randint(50, 400), rng.randint(0, 10),
+                                              domain, skills, random.Random(rng.random())), answers))
+    return domain, pool
+
+def object_pass(feedbacks, bins: int = 10):
+    """The per-object reporting loop the columnar path replaces"""
+    histogram = [0] * bins
+    sums, counts = {}, {}
+    for feedback in feedbacks:
+        histogram[min(feedback.score * bins // 100, bins - 1)] += 1
+        for skill_feedback in feedback.skill_breakdown:
+            sums[skill_feedback.skill] = sums.get(skill_feedback.skill, 0) + skill_feedback.score
+            counts[skill_feedback.skill] = counts.get(skill_feedback.skill, 0) + 1
+    return histogram, {skill: sums[skill] / counts[skill] for skill in sums}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10 ** 6)
+    parser.add_argument("--chunk-rows", type=int, default=65536)
+    parser.add_argument("--layout", choices=("npy", "arrow"), default="npy")
+    args = parser.parse_args()
+
+    domain, pool = feedback_pool(1000, random.Random(0))
+    feedbacks = [pool[i % len(pool)] for i in range(args.sessions)]
+    directory = tempfile.mkdtemp(prefix="columnar-")
+    try:
+        start = time.perf_counter()
+        with ColumnarWriter(directory, args.chunk_rows, args.layout) as writer:
+            for feedback, answers in feedbacks:
+                writer.add_feedback(domain.id, feedback, answers, 8, ended_early=answers < 8)
+        export = time.perf_counter() - start
+
+        start = time.perf_counter()
+        aggregates = aggregate(directory)
+        columnar = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    start = time.perf_counter()
+    histogram, _ = object_pass(feedback for feedback, _ in feedbacks)
+    objects = time.perf_counter() - start
+    assert histogram == aggregates.score_histogram
+
+    for label, seconds in (("export", export), ("columnar aggregate", columnar), ("object pass", objects)):
+        print(f"{label:>18}: {args.sessions / seconds:11.0f} sessions/s")
+
+if __name__ == "__main__":
+    main()
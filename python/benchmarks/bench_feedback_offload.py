@@ -0,0 +1,51 @@
+"""
+Feedback offload benchmark: throughput of end-of-session feedback generated
+in-thread, on a thread pool and on a process pool, for a burst of finished
+sessions such as a timed cohort ending at once.
+"""
+
+import argparse
+import os
+import time
+
+from mock_interview_ai import Difficulty, InterviewSession, InterviewSettings, get_registry
+
+from feedback_executor import MODES, FeedbackExecutor
+
+ANSWER = ("I would profile the slow path first, then cache the expensive lookups and "
+          "batch the writes, checking the p99 latency after every change.")
+
+def finished_sessions(count: int):
+    domain = get_registry().domains[0]
+    settings = InterviewSettings(number_of_questions=5, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    sessions = []
+    for seed in range(count):
+        session = InterviewSession(domain, ["Algorithms", "Data Structures", "Problem Solving"], settings, seed=seed)
+        while not session.is_complete():
+            follow_ups = session.get_follow_up_questions()
+            session.submit_answer(ANSWER * (1 + seed % 3), [{"question": q, "answer": ANSWER} for q in follow_ups])
+        sessions.append(session)
+    return sessions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    sessions = finished_sessions(args.sessions)
+    expected = None
+    for mode in MODES:
+        with FeedbackExecutor(mode, max_workers=args.workers) as executor:
+            executor.map(sessions[:args.workers])  # start the workers outside the measurement
+            start = time.perf_counter()
+            feedback = executor.map(sessions)
+            elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = feedback
+        elif feedback != expected:
+            raise SystemExit(f"{mode} feedback differs from inline feedback")
+        print(f"{mode:>8}: {args.sessions / elapsed:10.0f} sessions/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Feedback scoring benchmark: per-session throughput of the scalar scorer
+against the batch scorer (NumPy and pure Python), checking that all three
+produce identical scores.
+"""
+
+import argparse
+import random
+import time
+
+from mock_interview_ai import CounterRandom, get_registry, get_default_ai, stream_seed
+
+from batch_scoring import np, score_sessions
+
+def synthetic_metrics(count: int, seed: int = 0):
+    """Columns of realistic session metrics: lognormal answer lengths, 0-3 follow-ups per answer"""
+    rng = random.Random(seed)
+    columns = {"answer_counts": [], "length_sums": [], "follow_up_counts": [], "skill_counts": [], "seeds": []}
+    for i in range(count):
+        num_answers = rng.randint(0, 10)
+        columns["answer_counts"].append(num_answers)
+        columns["length_sums"].append(sum(int(rng.lognormvariate(5.3, 0.6)) for _ in range(num_answers)))
+        columns["follow_up_counts"].append(sum(rng.randint(0, 3) for _ in range(num_answers)))
+        columns["skill_counts"].append(rng.randint(1, 5))
+        columns["seeds"].append(i)
+    return columns
+
+def scalar_scores(columns, domain):
+    """Score each session with the scalar path, as InterviewSession.generate_feedback does"""
+    ai = get_default_ai()
+    results = []
+    for num_answers, length_sum, follow_ups, num_skills, seed in zip(*columns.values()):
+        skills = list(domain.skills[:num_skills])
+        rng = CounterRandom(stream_seed(seed, "feedback"))
+        feedback = ai.feedback_from_metrics(num_answers, length_sum, follow_ups, domain, skills, rng)
+        results.append((feedback.score, [s.score for s in feedback.skill_breakdown]))
+    return results
+
+def batch_results(batch):
+    return [(int(batch.scores[i]), batch.skill_scores_for(i) if batch.answer_counts[i] else [])
+            for i in range(len(batch))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=100000)
+    args = parser.parse_args()
+
+    domain = get_registry().domains[0]
+    columns = synthetic_metrics(args.sessions)
+
+    start = time.perf_counter()
+    expected = scalar_scores(columns, domain)
+    timings = {"scalar feedback": time.perf_counter() - start}
+
+    modes = [("batch, pure Python", False)] + ([("batch, NumPy", True)] if np is not None else [])
+    for label, vectorized in modes:
+        start = time.perf_counter()
+        batch = score_sessions(*columns.values(), vectorized=vectorized)
+        timings[label] = time.perf_counter() - start
+        if batch_results(batch) != expected:
+            raise SystemExit(f"{label} scores differ from the scalar path")
+
+    for label, elapsed in timings.items():
+        print(f"{label:>20}: {args.sessions / elapsed:12.0f} sessions/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Near-duplicate detection benchmark: time to cluster banks of 10^3-10^6
+questions with distinct generated texts and a known share of injected near
+duplicates (one word changed), plus the recall of those duplicates and the
+number of false merges.
+"""
+
+import argparse
+import random
+import time
+
+from mock_interview_ai import Question
+
+from benchmarks.synthetic import SyntheticQuestionBank
+from near_duplicates import find_duplicates
+
+VOCABULARY = [f"term{i}" for i in range(5000)]
+
+class GeneratedTextBank(SyntheticQuestionBank):
+    """Synthetic bank with random question texts; every dup_every-th question copies its predecessor"""
+
+    def __init__(self, size: int, dup_every: int = 20):
+        super().__init__(size)
+        self.dup_every = dup_every
+
+    def _words(self, handle: int):
+        rng = random.Random(handle)
+        return rng.choices(VOCABULARY, k=24)
+
+    def is_duplicate(self, handle: int) -> bool:
+        return handle % self.dup_every == self.dup_every - 1
+
+    def load(self, handle: int) -> Question:
+        question = super().load(handle)
+        if self.is_duplicate(handle):
+            words = self._words(handle - 1)
+            words[random.Random(handle).randrange(len(words))] = "changed"
+        else:
+            words = self._words(handle)
+        return Question(id=question.id, text=" ".join(words), type=question.type,
+                        difficulty=question.difficulty, skill=question.skill, follow_ups=())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest bank is 10**max_exponent questions")
+    args = parser.parse_args()
+
+    print(f"{'bank size':>10} {'seconds':>9} {'questions/s':>12} {'recall':>7} {'false merges':>13}")
+    for exponent in range(3, args.max_exponent + 1):
+        bank = GeneratedTextBank(10 ** exponent)
+        start = time.perf_counter()
+        duplicates = find_duplicates(bank)
+        elapsed = time.perf_counter() - start
+        expected = [handle for handle in range(bank.size) if bank.is_duplicate(handle)]
+        found = sum(duplicates.get(handle) == duplicates.get(handle - 1) is not None for handle in expected)
+        false_merges = sum(1 for handle in duplicates if not bank.is_duplicate(handle)
+                           and not bank.is_duplicate(handle + 1))
+        print(f"{bank.size:>10} {elapsed:9.2f} {bank.size / elapsed:12.0f} "
+              f"{found / max(1, len(expected)):7.1%} {false_merges:13d}")
+
+if __name__ == "__main__":
+    main()
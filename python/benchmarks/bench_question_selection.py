@@ -0,0 +1,58 @@
+"""
+Question selection scaling benchmark: generate_questions latency as the bank
+grows, against a reference full-shuffle selection over the same candidates.
+"""
+
+import argparse
+import random
+import time
+
+from mock_interview_ai import Difficulty, InterviewSettings, MockInterviewAI
+
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+def full_shuffle_select(ai: MockInterviewAI, skills, settings: InterviewSettings):
+    """Reference selection that materializes and shuffles the whole pool"""
+    difficulty = None if settings.difficulty == Difficulty.MIXED else settings.difficulty
+    pool = [(skill, handle) for skill in skills
+            for handles in ai.question_bank.buckets(skill, difficulty) for handle in handles]
+    random.shuffle(pool)
+    selected, used_skills = [], set()
+    for skill, handle in pool:
+        if len(selected) >= settings.number_of_questions:
+            break
+        if skill not in used_skills or len(used_skills) >= len(skills):
+            selected.append(handle)
+            used_skills.add(skill)
+    return [ai.question_bank.load(handle) for handle in selected]
+
+def time_per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest bank is 10**max_exponent questions")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--reference-max-exponent", type=int, default=5,
+                        help="skip the full-shuffle reference above this bank size")
+    args = parser.parse_args()
+    
+    skills = SKILLS[:3]
+    settings = InterviewSettings(number_of_questions=8, difficulty=Difficulty.MIXED)
+    print(f"{'bank size':>10} {'indexed us/call':>16} {'full shuffle us/call':>21}")
+    for exponent in range(2, args.max_exponent + 1):
+        ai = MockInterviewAI(registry=synthetic_registry(10 ** exponent))
+        domain = ai.domains[0]
+        indexed = time_per_call(lambda: ai.generate_questions(domain, skills, settings), args.calls)
+        if exponent <= args.reference_max_exponent:
+            reference_calls = max(1, args.calls // 10 ** max(0, exponent - 3))
+            reference = f"{time_per_call(lambda: full_shuffle_select(ai, skills, settings), reference_calls):21.1f}"
+        else:
+            reference = f"{'skipped':>21}"
+        print(f"{10 ** exponent:>10} {indexed:16.1f} {reference}")
+
+if __name__ == "__main__":
+    main()
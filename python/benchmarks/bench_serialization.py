@@ -0,0 +1,76 @@
+"""
+Serialization benchmark: round trips per second and encoded size of the
+binary format against dataclasses.asdict + json for sessions, answers and
+feedback.
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+
+from mock_interview_ai import (
+    Answer, Difficulty, Feedback, InterviewSession, InterviewSettings, get_registry
+)
+
+ANSWER = ("I would put a consistent-hashing layer in front of the cache nodes, replicate "
+          "each key to the next two nodes on the ring and read from the nearest replica.")
+
+def plain(value):
+    """asdict for dataclasses, InterviewSession slots and containers of them"""
+    if isinstance(value, InterviewSession):
+        return {name: plain(getattr(value, name)) for name in InterviewSession.__slots__ if name != "ai"}
+    if hasattr(value, "__dataclass_fields__"):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+def json_round_trip(value) -> int:
+    """Encode and parse only; the baseline does not rebuild objects"""
+    data = json.dumps(plain(value), default=str).encode("utf-8")
+    json.loads(data)
+    return len(data)
+
+def measure(name: str, values, encode, decode, rounds: int) -> None:
+    size = len(encode(values[0]))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            decode(encode(value))
+    binary = rounds * len(values) / (time.perf_counter() - start)
+
+    json_size = json_round_trip(values[0])
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            json_round_trip(value)
+    baseline = rounds * len(values) / (time.perf_counter() - start)
+
+    print(f"{name:>8}: binary {binary:9.0f}/s {size:5d} B | asdict+json {baseline:9.0f}/s {json_size:5d} B "
+          f"| {binary / baseline:4.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    domain = get_registry().domains[0]
+    settings = InterviewSettings(number_of_questions=5, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    sessions = []
+    for seed in range(args.sessions):
+        session = InterviewSession(domain, ["Algorithms", "Data Structures"], settings, seed=seed)
+        while session.get_current_question() is not None:
+            follow_ups = session.get_follow_up_questions()
+            session.submit_answer(ANSWER, [{"question": q, "answer": ANSWER} for q in follow_ups])
+        sessions.append(session)
+    answers = [session.answers[0] for session in sessions]
+    feedback = [session.generate_feedback() for session in sessions]
+
+    measure("answer", answers, Answer.to_bytes, Answer.from_bytes, args.rounds)
+    measure("feedback", feedback, Feedback.to_bytes, Feedback.from_bytes, args.rounds)
+    measure("session", sessions, InterviewSession.to_bytes, InterviewSession.from_bytes, args.rounds)
+
+if __name__ == "__main__":
+    main()
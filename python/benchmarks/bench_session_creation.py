@@ -0,0 +1,60 @@
+"""
+Session creation benchmark: latency and retained memory per InterviewSession,
+comparing a registry rebuilt for every session (the old behaviour) with the
+shared process-wide registry.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mock_interview_ai import (
+    Difficulty, InterviewSession, InterviewSettings, MockInterviewAI,
+    _initialize_domains, _initialize_question_bank, build_registry, get_registry
+)
+
+SKILLS = ["Algorithms", "Data Structures", "Problem Solving"]
+SETTINGS = InterviewSettings(number_of_questions=5, include_follow_ups=True, difficulty=Difficulty.MIXED)
+
+def _rebuilt_session(domain):
+    """Create a session the way it used to be done, rebuilding the whole bank"""
+    ai = MockInterviewAI(registry=build_registry(_initialize_domains(), _initialize_question_bank()))
+    return InterviewSession(domain, SKILLS, SETTINGS, ai=ai)
+
+def _shared_session(domain):
+    """Create a session against the shared registry"""
+    return InterviewSession(domain, SKILLS, SETTINGS)
+
+def measure(factory, domain, count: int) -> dict:
+    """Measure mean creation latency and retained bytes per session"""
+    start = time.perf_counter()
+    for _ in range(count):
+        factory(domain)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    sessions = [factory(domain) for _ in range(count)]
+    retained = tracemalloc.take_snapshot().compare_to(baseline, "filename")
+    tracemalloc.stop()
+    retained_bytes = sum(stat.size_diff for stat in retained)
+    del sessions
+    
+    return {
+        "latency_us": elapsed / count * 1e6,
+        "bytes_per_session": retained_bytes / count,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10000)
+    args = parser.parse_args()
+    
+    domain = get_registry().domains[0]
+    for label, factory in (("rebuilt registry", _rebuilt_session), ("shared registry", _shared_session)):
+        result = measure(factory, domain, args.sessions)
+        print(f"{label:>18}: {result['latency_us']:8.2f} us/session, "
+              f"{result['bytes_per_session']:8.0f} bytes/session")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Session log benchmark: event writes per second with batched fsync, snapshot
+time, and recovery time (snapshot plus tail replay) for many sessions.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from mock_interview_ai import Difficulty, InterviewSession, InterviewSettings, get_registry
+
+from session_log import SessionLog, recover
+
+ANSWER = "I would shard by tenant id, keep a write-ahead log and replay it on failover."
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--fsync-every", type=int, default=4096)
+    args = parser.parse_args()
+
+    domain = get_registry().domains[0]
+    settings = InterviewSettings(number_of_questions=args.answers, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    skills = ["Algorithms", "Data Structures"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = SessionLog(directory, fsync_every=args.fsync_every)
+        sessions = [InterviewSession(domain, skills, settings, seed=seed) for seed in range(args.sessions)]
+
+        start = time.perf_counter()
+        events = 0
+        for session in sessions:
+            log.record_start(session)
+            events += 1
+        for _ in range(args.answers - 1):
+            for session in sessions:
+                events += log.submit_answer(session, ANSWER, [{"question": "Why?", "answer": ANSWER}])
+        log.sync()
+        elapsed = time.perf_counter() - start
+        print(f"writes:   {events / elapsed:10.0f} events/s ({events} events)")
+
+        start = time.perf_counter()
+        log.snapshot(sessions)
+        print(f"snapshot: {time.perf_counter() - start:10.2f} s, "
+              f"{os.path.getsize(os.path.join(directory, 'snapshot.log')) / 2 ** 20:.1f} MiB")
+
+        # Events after the snapshot are replayed from the tail segment
+        for session in sessions:
+            log.submit_answer(session, ANSWER)
+        log.close()
+
+        start = time.perf_counter()
+        recovered = recover(directory)
+        print(f"recovery: {time.perf_counter() - start:10.2f} s for {len(recovered)} sessions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Session memory benchmark: retained bytes per InterviewSession for 1k, 10k
+and 100k concurrent sessions, each fully answered with follow-ups and with
+its feedback generated. Answer texts are shared between sessions so that
+the figures measure per-object overhead rather than text size.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from mock_interview_ai import Difficulty, InterviewSession, InterviewSettings, get_registry
+
+ANSWER = ("I would start by clarifying the requirements, then compare a hash map with a "
+          "balanced tree, measure both under realistic load and pick the simpler one.")
+FOLLOW_UP_ANSWER = "I would profile it first and then optimize the hot path."
+
+def run_session(domain, skills, settings, seed: int):
+    session = InterviewSession(domain, skills, settings, seed=seed)
+    while not session.is_complete():
+        follow_ups = session.get_follow_up_questions()
+        session.submit_answer(ANSWER, [{"question": q, "answer": FOLLOW_UP_ANSWER} for q in follow_ups])
+    return session, session.generate_feedback()
+
+def bytes_per_session(count: int) -> float:
+    domain = get_registry().domains[0]
+    skills = ["Algorithms", "Data Structures"]
+    settings = InterviewSettings(number_of_questions=3, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    run_session(domain, skills, settings, -1)  # warm caches outside the measurement
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [run_session(domain, skills, settings, seed) for seed in range(count)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del sessions
+    return retained / count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+    for count in args.counts:
+        print(f"{count:>8} sessions: {bytes_per_session(count):8.0f} bytes/session")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+In-process load generator for AsyncSessionManager: simulated candidates
+create a session, answer every question (with follow-ups) and request
+feedback, with a bounded number of candidates in flight. Reports p50/p99
+latency per operation and completed sessions per second.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from mock_interview_ai import Difficulty, InterviewSettings, get_registry
+
+from session_service import AsyncSessionManager
+
+ANSWER = ("I would use a priority queue keyed on tentative distance, relax each edge once "
+          "and stop as soon as the target node is settled.")
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def candidate(manager: AsyncSessionManager, seed: int, latencies: Dict[str, List[float]]) -> None:
+    domain = get_registry().domains[0]
+    settings = InterviewSettings(number_of_questions=5, include_follow_ups=True, difficulty=Difficulty.MIXED)
+
+    start = time.perf_counter()
+    session_id = await manager.create_session(domain, ["Algorithms", "Data Structures"], settings, seed=seed)
+    latencies["create"].append(time.perf_counter() - start)
+
+    while await manager.get_current_question(session_id) is not None:
+        follow_ups = await manager.get_follow_up_questions(session_id)
+        start = time.perf_counter()
+        await manager.submit_answer(session_id, ANSWER, [{"question": q, "answer": ANSWER} for q in follow_ups])
+        latencies["submit"].append(time.perf_counter() - start)
+        await asyncio.sleep(0)  # yield like a real client round trip would
+
+    start = time.perf_counter()
+    await manager.generate_feedback(session_id)
+    latencies["feedback"].append(time.perf_counter() - start)
+    await manager.close_session(session_id)
+
+async def run(sessions: int, concurrency: int) -> None:
+    latencies: Dict[str, List[float]] = {"create": [], "submit": [], "feedback": []}
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def limited(seed: int) -> None:
+        async with in_flight:
+            await candidate(manager, seed, latencies)
+
+    async with AsyncSessionManager(max_sessions=concurrency * 2) as manager:
+        start = time.perf_counter()
+        await asyncio.gather(*(limited(seed) for seed in range(sessions)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{sessions} sessions, {concurrency} concurrent: {sessions / elapsed:.0f} sessions/s")
+    for operation, samples in latencies.items():
+        print(f"  {operation:>8}: p50 {percentile(samples, 0.5) * 1e3:8.3f} ms, "
+              f"p99 {percentile(samples, 0.99) * 1e3:8.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.concurrency))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Multi-process load test for the sharded session stores: 1..N worker
+processes each run complete sessions (create, answer every question,
+feedback) against one DiskSessionStore directory shared by all workers, or
+against a per-worker InMemorySessionStore (each worker owning its own
+partition of sessions). Reports operations per second and the scaling
+efficiency relative to one worker.
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from typing import List, Tuple
+
+from mock_interview_ai import Difficulty, InterviewSettings, get_registry
+
+from session_store import DiskSessionStore, InMemorySessionStore
+
+ANSWER = ("I would use a priority queue keyed on tentative distance, relax each edge once "
+          "and stop as soon as the target node is settled.")
+
+def worker(args: Tuple[str, str, int, int, int]) -> int:
+    """Run sessions in one process and return the number of store operations"""
+    backend, directory, shards, sessions, offset = args
+    store = DiskSessionStore(directory, shards) if backend == "disk" else InMemorySessionStore(shards)
+    domain = get_registry().domains[0]
+    settings = InterviewSettings(number_of_questions=5, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    operations = 0
+    for i in range(sessions):
+        session_id = store.create(domain, ["Algorithms", "Data Structures"], settings, seed=offset + i)
+        operations += 1
+        while store.get_current_question(session_id) is not None:
+            store.submit_answer(session_id, ANSWER)
+            operations += 2
+        store.generate_feedback(session_id)
+        operations += 2
+    return operations
+
+def run(backend: str, processes: int, sessions: int, shards: int) -> float:
+    directory = tempfile.mkdtemp(prefix="session-store-")
+    try:
+        tasks = [(backend, directory, shards, sessions, p * sessions) for p in range(processes)]
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            pool.map(worker, [(backend, directory, shards, 1, -1 - p) for p in range(processes)])  # warm up
+            start = time.perf_counter()
+            operations = sum(pool.map(worker, tasks))
+            elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return operations / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", choices=("disk", "memory"), default="disk")
+    parser.add_argument("--sessions", type=int, default=500, help="sessions per worker")
+    parser.add_argument("--shards", type=int, default=64)
+    parser.add_argument("--processes", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    results: List[Tuple[int, float]] = []
+    print(f"{'processes':>9} {'ops/s':>10} {'efficiency':>11}")
+    for processes in args.processes:
+        throughput = run(args.backend, processes, args.sessions, args.shards)
+        results.append((processes, throughput))
+        base = results[0][1] / results[0][0]
+        print(f"{processes:>9} {throughput:10.0f} {throughput / (base * processes):11.0%}")
+    print(f"({os.cpu_count()} CPUs available)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Benchmark suite with baselines: drives MockInterviewAI and InterviewSession
+over synthetic banks of 10^2-10^6 questions with 1-100k live sessions and
+log-normally distributed answer lengths. Reports session creation, question
+selection, answer submission and feedback latency (p50/p99), end-to-end
+throughput and peak RSS per case; each case runs in a fresh process so peak
+RSS is its own.
+
+Save a baseline with --save PATH and compare a later run against it with
+--baseline PATH; the run exits with status 1 when any gated metric regresses
+by more than --threshold.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from mock_interview_ai import Difficulty, InterviewSession, InterviewSettings, MockInterviewAI
+
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+QUICK_CASES = [(100, 1), (10 ** 4, 1000), (10 ** 6, 1000)]
+# Fewest sessions timed per case; smaller cases repeat their sessions to reach it
+MIN_SAMPLES = 1000
+FULL_CASES = [(size, sessions) for size in (10 ** 2, 10 ** 4, 10 ** 6) for sessions in (1, 1000, 100000)]
+
+# Metric name -> True when higher is better; only these fail a comparison
+GATED_METRICS = {
+    "create_p50_us": False,
+    "select_p50_us": False,
+    "submit_p50_us": False,
+    "feedback_p50_us": False,
+    "throughput_sessions_per_s": True,
+    "peak_rss_mb": False,
+}
+
+ANSWER_WORDS = ("latency", "cache", "index", "queue", "trade-off", "replica", "shard", "profile",
+                "measure", "bottleneck", "throughput", "consistency", "rollback", "deploy")
+
+def answer_pool(count: int, rng: random.Random, median_length: int = 220, sigma: float = 0.6) -> List[str]:
+    """Answers with log-normally distributed lengths around a median"""
+    answers = []
+    for _ in range(count):
+        length = min(3000, max(1, int(rng.lognormvariate(math.log(median_length), sigma))))
+        words = []
+        size = 0
+        while size < length:
+            word = rng.choice(ANSWER_WORDS)
+            words.append(word)
+            size += len(word) + 1
+        answers.append(" ".join(words)[:length])
+    return answers
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def run_case(bank_size: int, sessions: int, questions: int = 8, seed: int = 0) -> Dict[str, float]:
+    """Run one case in this process and return its metrics
+
+    Cases with fewer than MIN_SAMPLES sessions run their sessions repeatedly
+    (each round with new seeds) until the latencies have MIN_SAMPLES samples,
+    so their p50 is stable enough to gate on.
+    """
+    rng = random.Random(seed)
+    ai = MockInterviewAI(registry=synthetic_registry(bank_size))
+    domain = ai.domains[0]
+    skills = SKILLS[:3]
+    settings = InterviewSettings(number_of_questions=questions, include_follow_ups=True, difficulty=Difficulty.MIXED)
+    answers = answer_pool(1000, rng)
+    rounds = -(-MIN_SAMPLES // sessions)
+    clock = time.perf_counter
+    start_all = clock()
+
+    select: List[float] = []
+    for i in range(min(max(sessions, MIN_SAMPLES), 2000)):
+        start = clock()
+        ai.generate_questions(domain, skills, settings, seed=i)
+        select.append(clock() - start)
+
+    create: List[float] = []
+    submit: List[float] = []
+    feedback: List[float] = []
+    for round_index in range(rounds):
+        live = []
+        for i in range(sessions):
+            start = clock()
+            live.append(InterviewSession(domain, skills, settings, ai=ai,
+                                         seed=(seed * 1000003 + i) * rounds + round_index))
+            create.append(clock() - start)
+
+        # Sessions advance round-robin, as concurrent candidates would
+        for _ in range(questions):
+            for session in live:
+                if session.get_current_question() is None:
+                    continue
+                follow_ups = session.get_follow_up_questions()
+                follow_up_answers = [{"question": q, "answer": rng.choice(answers)} for q in follow_ups]
+                text = rng.choice(answers)
+                start = clock()
+                session.submit_answer(text, follow_up_answers)
+                submit.append(clock() - start)
+
+        for session in live:
+            start = clock()
+            session.generate_feedback()
+            feedback.append(clock() - start)
+    elapsed = clock() - start_all
+
+    results = {"bank_size": bank_size, "sessions": sessions, "rounds": rounds}
+    for name, samples in (("create", create), ("select", select), ("submit", submit), ("feedback", feedback)):
+        results[f"{name}_p50_us"] = percentile(samples, 0.5) * 1e6
+        results[f"{name}_p99_us"] = percentile(samples, 0.99) * 1e6
+    results["throughput_sessions_per_s"] = sessions * rounds / elapsed
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results["peak_rss_mb"] = rss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+    return results
+
+def _run_case_in_child(args: Tuple[int, int]) -> Dict[str, float]:
+    return run_case(*args)
+
+def case_name(bank_size: int, sessions: int) -> str:
+    return f"bank={bank_size},sessions={sessions}"
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Regressions of the gated metrics beyond threshold (a fraction, e.g. 0.2)"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric, higher_is_better in GATED_METRICS.items():
+            if metric not in previous or not previous[metric]:
+                continue
+            change = current[metric] / previous[metric] - 1
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{name} {metric}: {previous[metric]:.1f} -> {current[metric]:.1f} "
+                                   f"({change:+.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full", action="store_true", help="run every bank size with 1, 1k and 100k sessions")
+    parser.add_argument("--case", nargs=2, type=int, action="append", metavar=("BANK_SIZE", "SESSIONS"),
+                        help="run only the given case (repeatable)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline JSON file")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative regression of a gated metric (default 0.2)")
+    args = parser.parse_args()
+
+    cases = [tuple(case) for case in args.case] if args.case else FULL_CASES if args.full else QUICK_CASES
+    results: Dict[str, Dict] = {}
+    print(f"{'case':>28} {'create':>9} {'select':>9} {'submit':>9} {'feedback':>9} {'sessions/s':>11} {'RSS MiB':>8}")
+    for bank_size, sessions in cases:
+        # A fresh process per case keeps peak RSS per case
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            result = pool.apply(_run_case_in_child, ((bank_size, sessions),))
+        name = case_name(bank_size, sessions)
+        results[name] = result
+        print(f"{name:>28} {result['create_p50_us']:9.1f} {result['select_p50_us']:9.1f} "
+              f"{result['submit_p50_us']:9.1f} {result['feedback_p50_us']:9.1f} "
+              f"{result['throughput_sessions_per_s']:11.0f} {result['peak_rss_mb']:8.1f}")
+    print("(latencies are p50 in microseconds)")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "cases": results}, f, indent=2)
+        print(f"Saved baseline to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["cases"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
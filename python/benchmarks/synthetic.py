@@ -0,0 +1,66 @@
+"""
+Synthetic workloads shared by the benchmarks
+"""
+
+from bisect import bisect_right
+from typing import List, Sequence
+
+from mock_interview_ai import (
+    Difficulty, InterviewDomain, Question, QuestionBank, QuestionType, build_registry
+)
+
+SKILLS = ["Algorithms", "Data Structures", "System Design", "Object-Oriented Programming", "Problem Solving"]
+DIFFICULTIES = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD]
+QUESTION_TYPES = list(QuestionType)
+
+FOLLOW_UPS = (
+    "How would this change at ten times the scale?",
+    "What trade-offs did you consider?",
+    "Can you give a concrete example from your experience?"
+)
+
+class SyntheticQuestionBank(QuestionBank):
+    """Bank of generated questions indexed by ranges, so it costs O(1) memory at any size"""
+    
+    def __init__(self, size: int, skills: Sequence[str] = SKILLS):
+        super().__init__()
+        self.size = size
+        keys = [(skill, d, t) for skill in skills for d in DIFFICULTIES for t in QUESTION_TYPES]
+        self._starts: List[int] = []
+        self._keys = keys
+        start = 0
+        for i, (skill, difficulty, question_type) in enumerate(keys):
+            count = size // len(keys) + (1 if i < size % len(keys) else 0)
+            self._starts.append(start)
+            self._index.setdefault(skill, {})[(difficulty, question_type)] = range(start, start + count)
+            start += count
+    
+    def load(self, handle: int) -> Question:
+        skill, difficulty, question_type = self._keys[bisect_right(self._starts, handle) - 1]
+        return Question(
+            id=f"syn-{handle}",
+            text=f"Synthetic {difficulty.value} {question_type.value} question #{handle} about {skill}.",
+            type=question_type,
+            difficulty=difficulty,
+            skill=skill,
+            follow_ups=FOLLOW_UPS
+        )
+    
+    def find(self, question_id: str) -> Question:
+        prefix, _, handle = question_id.partition("-")
+        if prefix != "syn" or not handle.isdigit() or int(handle) >= self.size:
+            raise KeyError(question_id)
+        return self.load(int(handle))
+
+def synthetic_domain(skills: Sequence[str] = SKILLS) -> InterviewDomain:
+    return InterviewDomain(
+        id="synthetic",
+        title="Synthetic Engineer",
+        description="Generated domain for benchmarks",
+        icon="Code",
+        skills=list(skills)
+    )
+
+def synthetic_registry(size: int, skills: Sequence[str] = SKILLS):
+    """Build a registry over a synthetic bank of the given size"""
+    return build_registry([synthetic_domain(skills)], SyntheticQuestionBank(size, skills))
@@ -0,0 +1,319 @@
+"""
+Binary serialization for Mock Interview AI
+
+A compact, versioned format for InterviewSession, Answer and Feedback:
+
+    magic "MI", format version (uint8), kind (uint8)
+    string table: uint32 count, the uint32 UTF-8 byte length of every string,
+                  then the strings back to back
+    body: fixed-width little-endian fields; every string, question id and
+          skill is a uint32 index into the string table
+
+Timestamps are int64 microseconds since the epoch. Since format version 2
+a session also stores the analyzed quality of each answer (float64), so it
+is restored without analyzing its answers again, and the near-duplicate
+clusters an adaptive session has asked (uint64 handles); version 1 data is
+still read, analyzing the answers. Decoding reads fields in
+place from a memoryview over the input, so the only copies made are the
+decoded strings themselves.
+"""
+
+import struct
+import sys
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from mock_interview_ai import (
+    Answer, Difficulty, Feedback, InterviewSession, InterviewSettings, MockInterviewAI, Question,
+    SkillFeedback, from_micros, get_default_ai, to_micros
+)
+
+MAGIC = b"MI"
+FORMAT_VERSION = 2
+MIN_FORMAT_VERSION = 1
+
+KIND_ANSWER = 1
+KIND_FEEDBACK = 2
+KIND_SESSION = 3
+
+_PREAMBLE = struct.Struct("<2sBB")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+
+_DIFFICULTIES = tuple(Difficulty)
+
+# Session settings flags
+_INCLUDE_FOLLOW_UPS = 1
+_ADAPTIVE = 2
+
+# Seeds are stored as uint64 when they fit, otherwise as int64
+_SEED_UNSIGNED = 0
+_SEED_SIGNED = 1
+
+QuestionLookup = Union[Mapping[str, Question], Callable[[str], Question]]
+
+class FormatError(ValueError):
+    """Raised for data that is not in a supported binary format"""
+
+class _Writer:
+    def __init__(self, kind: int):
+        self.kind = kind
+        self.strings: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def string(self, value: str) -> None:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        self.body += _U32.pack(index)
+
+    def strings_list(self, values: Sequence[str]) -> None:
+        strings = self.strings
+        indexes = [strings.setdefault(value, len(strings)) for value in values]
+        self.body += struct.pack(f"<I{len(indexes)}I", len(indexes), *indexes)
+
+    def u8(self, value: int) -> None:
+        self.body += _U8.pack(value)
+
+    def u32(self, value: int) -> None:
+        self.body += _U32.pack(value)
+
+    def i64(self, value: int) -> None:
+        self.body += _I64.pack(value)
+
+    def u64(self, value: int) -> None:
+        self.body += _U64.pack(value)
+
+    def u64_array(self, values: Sequence[int]) -> None:
+        self.body += struct.pack(f"<I{len(values)}Q", len(values), *values)
+
+    def f64_array(self, values: Sequence[float]) -> None:
+        self.body += struct.pack(f"<{len(values)}d", *values)
+
+    def finish(self) -> bytes:
+        out = bytearray(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, self.kind))
+        encoded = [value.encode("utf-8") for value in self.strings]
+        out += struct.pack(f"<I{len(encoded)}I", len(encoded), *map(len, encoded))
+        out += b"".join(encoded)
+        out += self.body
+        return bytes(out)
+
+class _Reader:
+    def __init__(self, data: Union[bytes, bytearray, memoryview], kind: int):
+        self.view = memoryview(data)
+        if len(self.view) < _PREAMBLE.size:
+            raise FormatError("Data is too short")
+        magic, version, data_kind = _PREAMBLE.unpack_from(self.view, 0)
+        if magic != MAGIC:
+            raise FormatError("Not Mock Interview AI binary data")
+        if not MIN_FORMAT_VERSION <= version <= FORMAT_VERSION:
+            raise FormatError(f"Unsupported format version {version}")
+        if data_kind != kind:
+            raise FormatError(f"Expected kind {kind}, got {data_kind}")
+        self.version = version
+        self.position = _PREAMBLE.size
+        lengths = self.u32_array()
+        position = self.position
+        self._require(sum(lengths))
+        strings = []
+        for length in lengths:
+            strings.append(str(self.view[position:position + length], "utf-8"))
+            position += length
+        self.position = position
+        self.strings = strings
+
+    def _require(self, size: int) -> None:
+        """Check that size more bytes follow, so truncated data fails as a FormatError"""
+        if self.position + size > len(self.view):
+            raise FormatError("Data is truncated")
+
+    def _unpack(self, fmt: struct.Struct) -> int:
+        self._require(fmt.size)
+        value, = fmt.unpack_from(self.view, self.position)
+        self.position += fmt.size
+        return value
+
+    def _unpack_array(self, code: str, size: int, count: int) -> Tuple:
+        self._require(size * count)
+        values = struct.unpack_from(f"<{count}{code}", self.view, self.position)
+        self.position += size * count
+        return values
+
+    def u8(self) -> int:
+        return self._unpack(_U8)
+
+    def u32(self) -> int:
+        return self._unpack(_U32)
+
+    def i64(self) -> int:
+        return self._unpack(_I64)
+
+    def u64(self) -> int:
+        return self._unpack(_U64)
+
+    def f64_array(self, count: int) -> Tuple[float, ...]:
+        return self._unpack_array("d", 8, count)
+
+    def u64_array(self) -> Tuple[int, ...]:
+        """A uint32 count followed by that many uint64 values"""
+        return self._unpack_array("Q", 8, self.u32())
+
+    def u32_array(self) -> Tuple[int, ...]:
+        """A uint32 count followed by that many uint32 values"""
+        return self._unpack_array("I", 4, self.u32())
+
+    def string(self) -> str:
+        return self.strings[self.u32()]
+
+    def strings_list(self) -> List[str]:
+        strings = self.strings
+        return [strings[index] for index in self.u32_array()]
+
+def _write_answer(writer: _Writer, answer: Answer) -> None:
+    writer.string(answer.question.id)
+    writer.string(answer.text)
+    writer.i64(to_micros(answer.timestamp))
+    writer.u32(len(answer.follow_ups))
+    for key, follow_up_answer in answer.follow_ups:
+        # Follow-up keys are indexes into question.follow_ups, or texts (flagged)
+        if isinstance(key, int):
+            writer.u8(0)
+            writer.u32(key)
+        else:
+            writer.u8(1)
+            writer.string(key)
+        writer.string(follow_up_answer)
+
+def _read_answer(reader: _Reader, lookup: Callable[[str], Question]) -> Answer:
+    question = lookup(reader.string())
+    text = reader.string()
+    timestamp = from_micros(reader.i64())
+    follow_ups = []
+    for _ in range(reader.u32()):
+        key = reader.u32() if reader.u8() == 0 else reader.string()
+        follow_ups.append((key, reader.string()))
+    return Answer(question=question, text=text, timestamp=timestamp, follow_ups=tuple(follow_ups))
+
+def _lookup_function(questions: Optional[QuestionLookup], ai: Optional[MockInterviewAI]) -> Callable[[str], Question]:
+    if questions is None:
+        ai = ai or get_default_ai()
+        return ai.find_question
+    if callable(questions):
+        return questions
+    return questions.__getitem__
+
+def answer_to_bytes(answer: Answer) -> bytes:
+    writer = _Writer(KIND_ANSWER)
+    _write_answer(writer, answer)
+    return writer.finish()
+
+def answer_from_bytes(data, questions: Optional[QuestionLookup] = None,
+                      ai: Optional[MockInterviewAI] = None) -> Answer:
+    """Decode an answer, resolving its question by id (from the registry by default)"""
+    return _read_answer(_Reader(data, KIND_ANSWER), _lookup_function(questions, ai))
+
+def feedback_to_bytes(feedback: Feedback) -> bytes:
+    writer = _Writer(KIND_FEEDBACK)
+    writer.u8(feedback.score)
+    writer.strings_list(feedback.strengths)
+    writer.strings_list(feedback.improvements)
+    writer.string(feedback.overall_feedback)
+    writer.strings_list(feedback.next_steps)
+    writer.u32(len(feedback.skill_breakdown))
+    for skill_feedback in feedback.skill_breakdown:
+        writer.string(skill_feedback.skill)
+        writer.u8(skill_feedback.score)
+        writer.string(skill_feedback.feedback)
+    return writer.finish()
+
+def feedback_from_bytes(data) -> Feedback:
+    reader = _Reader(data, KIND_FEEDBACK)
+    # Feedback text is interned so decoded objects share it with the template cache
+    reader.strings = [sys.intern(value) for value in reader.strings]
+    score = reader.u8()
+    strengths = tuple(reader.strings_list())
+    improvements = tuple(reader.strings_list())
+    overall_feedback = reader.string()
+    next_steps = tuple(reader.strings_list())
+    skill_breakdown = tuple(
+        SkillFeedback(skill=reader.string(), score=reader.u8(), feedback=reader.string())
+        for _ in range(reader.u32())
+    )
+    return Feedback(
+        score=score,
+        strengths=strengths,
+        improvements=improvements,
+        overall_feedback=overall_feedback,
+        next_steps=next_steps,
+        skill_breakdown=skill_breakdown
+    )
+
+def session_to_bytes(session: InterviewSession) -> bytes:
+    writer = _Writer(KIND_SESSION)
+    writer.string(session.session_id)
+    writer.string(session.domain.id)
+    writer.strings_list(session.skills)
+    writer.u32(session.settings.number_of_questions)
+    writer.u8(session.settings.include_follow_ups | session.settings.adaptive << 1)
+    writer.u8(_DIFFICULTIES.index(session.settings.difficulty))
+    if 0 <= session.seed < 1 << 64:
+        writer.u8(_SEED_UNSIGNED)
+        writer.u64(session.seed)
+    else:
+        writer.u8(_SEED_SIGNED)
+        writer.i64(session.seed)
+    writer.i64(to_micros(session.start_time))
+    writer.u8(session.end_time is not None)
+    writer.i64(to_micros(session.end_time) if session.end_time is not None else 0)
+    writer.u8(session.is_ended_early)
+    writer.strings_list([question.id for question in session.questions])
+    writer.u32(len(session.answers))
+    for answer in session.answers:
+        _write_answer(writer, answer)
+    writer.f64_array(session.qualities)
+    writer.u64_array(sorted(session.adaptive.clusters) if session.adaptive is not None else ())
+    return writer.finish()
+
+def session_from_bytes(data, ai: Optional[MockInterviewAI] = None) -> InterviewSession:
+    """Decode a session, resolving its domain and questions against ai's registry"""
+    ai = ai or get_default_ai()
+    reader = _Reader(data, KIND_SESSION)
+    session_id = reader.string()
+    domain = ai.get_domain(reader.string())
+    skills = reader.strings_list()
+    number_of_questions = reader.u32()
+    flags = reader.u8()
+    settings = InterviewSettings(
+        number_of_questions=number_of_questions,
+        include_follow_ups=bool(flags & _INCLUDE_FOLLOW_UPS),
+        difficulty=_DIFFICULTIES[reader.u8()],
+        adaptive=bool(flags & _ADAPTIVE)
+    )
+    seed = reader.u64() if reader.u8() == _SEED_UNSIGNED else reader.i64()
+    start_time = from_micros(reader.i64())
+    has_end_time = reader.u8()
+    end_micros = reader.i64()
+    is_ended_early = bool(reader.u8())
+    questions = ai.resolve_questions(domain, skills, settings, seed, reader.strings_list())
+    by_id = {question.id: question for question in questions}
+    answers = [_read_answer(reader, by_id.__getitem__) for _ in range(reader.u32())]
+    qualities, clusters = None, ()
+    if reader.version >= 2:
+        qualities = reader.f64_array(len(answers))
+        clusters = reader.u64_array()
+    return InterviewSession.restore(
+        session_id=session_id,
+        domain=domain,
+        skills=skills,
+        settings=settings,
+        seed=seed,
+        questions=questions,
+        start_time=start_time,
+        answers=answers,
+        end_time=from_micros(end_micros) if has_end_time else None,
+        is_ended_early=is_ended_early,
+        ai=ai,
+        qualities=qualities,
+        clusters=clusters
+    )
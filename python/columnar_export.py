@@ -0,0 +1,383 @@
+"""
+Columnar export and analytics for completed Mock Interview AI sessions
+
+ColumnarWriter turns completed sessions (and their Feedback) into two
+tables written in chunks of at most chunk_rows rows:
+
+    sessions  domain, score, answers, questions, ended_early, length_sum,
+              follow_ups, start (microseconds since the epoch)
+    skills    session (row in the sessions table), skill, score
+              (one row per SkillFeedback)
+
+Domains and skills are stored as integer codes into the dictionaries kept
+in manifest.json. The "npy" layout writes one .npy file per column and
+chunk (directory/chunk-NNNNN/<table>/<column>.npy, written without NumPy
+too); the "arrow" layout, available with pyarrow, writes one Arrow IPC file
+per table with a record batch per chunk.
+
+aggregate() streams the chunks one at a time through vectorized reductions
+(pure Python without NumPy), so memory stays bounded by the chunk size:
+
+    python columnar_export.py export session-log/ exported/
+    python columnar_export.py report exported/
+"""
+
+import argparse
+import array
+import ast
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from mock_interview_ai import Feedback, InterviewSession, np, to_micros
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # pyarrow is optional; the npy layout needs nothing else
+    pa = None
+
+FORMAT_VERSION = 1
+CHUNK_ROWS = 65536
+LAYOUTS = ("npy", "arrow")
+MANIFEST_NAME = "manifest.json"
+
+# Table -> (column, little-endian NumPy type) in file order
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "sessions": (
+        ("domain", "<i4"), ("score", "<i4"), ("answers", "<i4"), ("questions", "<i4"),
+        ("ended_early", "|u1"), ("length_sum", "<i8"), ("follow_ups", "<i4"), ("start", "<i8"),
+    ),
+    "skills": (("session", "<i8"), ("skill", "<i4"), ("score", "<i4")),
+}
+
+_TYPECODES = {"<i4": "i", "<i8": "q", "|u1": "B"}
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+def _arrow_type(dtype: str):
+    return {"<i4": pa.int32(), "<i8": pa.int64(), "|u1": pa.uint8()}[dtype]
+
+def _as_numpy(values: array.array, dtype: str):
+    """View a native-order array.array as a NumPy array of a little-endian type"""
+    return np.frombuffer(values, dtype=np.dtype(dtype).newbyteorder("=")).astype(dtype, copy=False)
+
+def write_npy(path: str, values: array.array, dtype: str) -> None:
+    """Write a 1-d array as a .npy file (format version 1.0)"""
+    if np is not None:
+        np.save(path, _as_numpy(values, dtype))
+        return
+    header = repr({"descr": dtype, "fortran_order": False, "shape": (len(values),)})
+    # The header is padded with spaces and a newline to a multiple of 64 bytes
+    padding = 64 - (len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + " " * (padding % 64) + "\n").encode("latin1")
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    with open(path, "wb") as f:
+        f.write(_NPY_MAGIC + len(header).to_bytes(2, "little") + header)
+        f.write(values.tobytes())
+
+def read_npy(path: str):
+    """Read a 1-d .npy file (memory-mapped with NumPy, as an array.array without)"""
+    if np is not None:
+        return np.load(path, mmap_mode="r")
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(_NPY_MAGIC):
+        raise ValueError(f"{path} is not a version 1.0 .npy file")
+    header_length = int.from_bytes(data[8:10], "little")
+    header = ast.literal_eval(data[10:10 + header_length].decode("latin1"))
+    values = array.array(_TYPECODES[header["descr"]])
+    values.frombytes(data[10 + header_length:])
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+class ColumnarWriter:
+    """Append completed sessions and write them out in chunks"""
+
+    def __init__(self, directory: str, chunk_rows: int = CHUNK_ROWS, layout: str = "npy"):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}, expected one of {LAYOUTS}")
+        if layout == "arrow" and pa is None:
+            raise RuntimeError("The arrow layout needs pyarrow")
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.layout = layout
+        self.rows = 0
+        self._domains: Dict[str, int] = {}
+        self._skills: Dict[str, int] = {}
+        self._chunks: List[Dict[str, int]] = []
+        self._arrow_writers: Dict[str, object] = {}
+        self._reset_buffers()
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, session: InterviewSession, feedback: Optional[Feedback] = None) -> None:
+        """Append a session, generating its feedback unless given"""
+        self.add_feedback(
+            session.domain.id,
+            feedback if feedback is not None else session.generate_feedback(),
+            answers=len(session.answers),
+            questions=session.total_questions(),
+            ended_early=session.is_ended_early,
+            length_sum=session.length_sum,
+            follow_ups=session.follow_up_sum,
+            start=to_micros(session.start_time)
+        )
+
+    def add_feedback(self, domain_id: str, feedback: Feedback, answers: int, questions: int,
+                     ended_early: bool = False, length_sum: int = 0, follow_ups: int = 0, start: int = 0) -> None:
+        """Append one session's row from its feedback and metrics"""
+        sessions = self._buffers["sessions"]
+        sessions["domain"].append(self._code(self._domains, domain_id))
+        sessions["score"].append(feedback.score)
+        sessions["answers"].append(answers)
+        sessions["questions"].append(questions)
+        sessions["ended_early"].append(ended_early)
+        sessions["length_sum"].append(length_sum)
+        sessions["follow_ups"].append(follow_ups)
+        sessions["start"].append(start)
+        skills = self._buffers["skills"]
+        for skill_feedback in feedback.skill_breakdown:
+            skills["session"].append(self.rows)
+            skills["skill"].append(self._code(self._skills, skill_feedback.skill))
+            skills["score"].append(skill_feedback.score)
+        self.rows += 1
+        if len(sessions["score"]) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as a chunk"""
+        count = len(self._buffers["sessions"]["score"])
+        if not count:
+            return
+        chunk = {table: len(columns[TABLES[table][0][0]]) for table, columns in self._buffers.items()}
+        if self.layout == "npy":
+            chunk_directory = os.path.join(self.directory, f"chunk-{len(self._chunks):05d}")
+            for table, columns in self._buffers.items():
+                os.makedirs(os.path.join(chunk_directory, table), exist_ok=True)
+                for name, dtype in TABLES[table]:
+                    write_npy(os.path.join(chunk_directory, table, name + ".npy"), columns[name], dtype)
+        else:
+            for table, columns in self._buffers.items():
+                arrays = [pa.array(_as_numpy(columns[name], dtype) if np is not None
+                                   else columns[name].tolist(), type=_arrow_type(dtype))
+                          for name, dtype in TABLES[table]]
+                self._arrow_writer(table).write_batch(
+                    pa.record_batch(arrays, names=[name for name, _ in TABLES[table]]))
+        self._chunks.append(chunk)
+        self._reset_buffers()
+
+    def close(self) -> None:
+        """Write the last chunk and the manifest"""
+        self.flush()
+        for writer in self._arrow_writers.values():
+            writer.close()
+        self._arrow_writers.clear()
+        manifest = {
+            "format": FORMAT_VERSION,
+            "layout": self.layout,
+            "rows": self.rows,
+            "domains": list(self._domains),
+            "skills": list(self._skills),
+            "chunks": self._chunks,
+        }
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _arrow_writer(self, table: str):
+        writer = self._arrow_writers.get(table)
+        if writer is None:
+            schema = pa.schema([(name, _arrow_type(dtype)) for name, dtype in TABLES[table]])
+            writer = self._arrow_writers[table] = pa.ipc.new_file(
+                os.path.join(self.directory, table + ".arrow"), schema)
+        return writer
+
+    def _reset_buffers(self) -> None:
+        self._buffers = {table: {name: array.array(_TYPECODES[dtype]) for name, dtype in columns}
+                         for table, columns in TABLES.items()}
+
+    @staticmethod
+    def _code(codes: Dict[str, int], value: str) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+def export_sessions(sessions: Iterable[InterviewSession], directory: str, chunk_rows: int = CHUNK_ROWS,
+                    layout: str = "npy") -> int:
+    """Export the completed sessions among sessions and return how many were written"""
+    with ColumnarWriter(directory, chunk_rows, layout) as writer:
+        for session in sessions:
+            if session.is_complete():
+                writer.add(session)
+        return writer.rows
+
+class ColumnarReader:
+    """Chunk-at-a-time access to an exported directory"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        if manifest["format"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar format version {manifest['format']}")
+        self.layout: str = manifest["layout"]
+        self.domains: List[str] = manifest["domains"]
+        self.skills: List[str] = manifest["skills"]
+        self.chunk_sizes: List[Dict[str, int]] = manifest["chunks"]
+        self.rows: int = manifest["rows"]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def chunks(self, table: str = "sessions", columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Sequence[int]]]:
+        """Yield {column: values} per chunk of a table"""
+        names = list(columns) if columns is not None else [name for name, _ in TABLES[table]]
+        if self.layout == "npy":
+            for index in range(len(self.chunk_sizes)):
+                chunk_directory = os.path.join(self.directory, f"chunk-{index:05d}", table)
+                yield {name: read_npy(os.path.join(chunk_directory, name + ".npy")) for name in names}
+            return
+        if pa is None:
+            raise RuntimeError("Reading the arrow layout needs pyarrow")
+        with pa.memory_map(os.path.join(self.directory, table + ".arrow")) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index)
+                yield {name: (batch.column(name).to_numpy() if np is not None
+                              else array.array(_TYPECODES[dict(TABLES[table])[name]],
+                                               batch.column(name).to_pylist()))
+                       for name in names}
+
+@dataclass
+class SessionAggregates:
+    """Score distributions and rates over exported sessions
+
+    Histogram bins split [0, 100] into equal widths; a score of 100 falls in
+    the last bin.
+    """
+    sessions: int = 0
+    score_histogram: List[int] = field(default_factory=list)
+    domain_histograms: Dict[str, List[int]] = field(default_factory=dict)
+    skill_means: Dict[str, float] = field(default_factory=dict)
+    skill_counts: Dict[str, int] = field(default_factory=dict)
+    completion_ratio: float = 0.0  # mean share of its questions a session answered
+    early_end_rate: float = 0.0
+
+    def bin_edges(self) -> List[float]:
+        bins = len(self.score_histogram)
+        return [100 * i / bins for i in range(bins + 1)]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+def aggregate(directory: str, bins: int = 10, domain: Optional[str] = None) -> SessionAggregates:
+    """Aggregate an exported directory chunk by chunk (optionally one domain only)"""
+    reader = ColumnarReader(directory)
+    if domain is not None and domain not in reader.domains:
+        return SessionAggregates(score_histogram=[0] * bins)
+    domain_code = None if domain is None else reader.domains.index(domain)
+    num_domains, num_skills = len(reader.domains), len(reader.skills)
+    histograms = [[0] * bins for _ in range(num_domains)]
+    skill_sums = [0] * num_skills
+    skill_counts = [0] * num_skills
+    sessions = ended_early = ratio_count = 0
+    ratio_sum = 0.0
+    first_row = 0  # sessions-table row of the chunk's first session
+
+    session_columns = ("domain", "score", "answers", "questions", "ended_early")
+    for chunk, skill_chunk in zip(reader.chunks("sessions", session_columns), reader.chunks("skills")):
+        if np is not None:
+            domains = np.asarray(chunk["domain"])
+            rows = skill_chunk["session"]
+            skills = np.asarray(skill_chunk["skill"])
+            skill_scores = np.asarray(skill_chunk["score"])
+            keep = slice(None) if domain_code is None else domains == domain_code
+            if domain_code is not None:
+                skill_keep = domains[np.asarray(rows) - first_row] == domain_code
+                skills, skill_scores = skills[skill_keep], skill_scores[skill_keep]
+            scores = np.clip(np.asarray(chunk["score"])[keep], 0, 100)
+            answers = np.asarray(chunk["answers"])[keep].astype(np.float64)
+            questions = np.asarray(chunk["questions"])[keep]
+            score_bins = np.minimum(scores * bins // 100, bins - 1)
+            counts = np.bincount(domains[keep] * bins + score_bins, minlength=num_domains * bins).tolist()
+            for code in range(num_domains):
+                histogram = histograms[code]
+                for i in range(bins):
+                    histogram[i] += counts[code * bins + i]
+            sessions += len(scores)
+            ended_early += int(np.count_nonzero(np.asarray(chunk["ended_early"])[keep]))
+            asked = questions > 0
+            ratio_sum += float((answers[asked] / questions[asked]).sum())
+            ratio_count += int(np.count_nonzero(asked))
+            sums = np.bincount(skills, weights=skill_scores, minlength=num_skills).tolist()
+            counts = np.bincount(skills, minlength=num_skills).tolist()
+            for code in range(num_skills):
+                skill_sums[code] += sums[code]
+                skill_counts[code] += counts[code]
+        else:
+            domains = chunk["domain"]
+            for code, score, answered, asked, early in zip(*(chunk[name] for name in session_columns)):
+                if domain_code is not None and code != domain_code:
+                    continue
+                histograms[code][min(max(0, min(score, 100)) * bins // 100, bins - 1)] += 1
+                sessions += 1
+                ended_early += early
+                if asked:
+                    ratio_sum += answered / asked
+                    ratio_count += 1
+            for row, skill, score in zip(skill_chunk["session"], skill_chunk["skill"], skill_chunk["score"]):
+                if domain_code is None or domains[row - first_row] == domain_code:
+                    skill_sums[skill] += score
+                    skill_counts[skill] += 1
+        first_row += len(chunk["domain"])
+
+    domain_histograms = {name: histograms[code] for code, name in enumerate(reader.domains)
+                         if domain_code is None or code == domain_code}
+    return SessionAggregates(
+        sessions=sessions,
+        score_histogram=[sum(column) for column in zip(*domain_histograms.values())] or [0] * bins,
+        domain_histograms=domain_histograms,
+        skill_means={name: skill_sums[code] / skill_counts[code]
+                     for code, name in enumerate(reader.skills) if skill_counts[code]},
+        skill_counts={name: skill_counts[code] for code, name in enumerate(reader.skills) if skill_counts[code]},
+        completion_ratio=ratio_sum / ratio_count if ratio_count else 0.0,
+        early_end_rate=ended_early / sessions if sessions else 0.0
+    )
+
+def main():
+    """Export sessions recovered from a session log, or report on an export"""
+    parser = argparse.ArgumentParser(description="Columnar export and analytics of completed sessions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="export the completed sessions of a session log directory")
+    export.add_argument("log_directory")
+    export.add_argument("directory")
+    export.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    export.add_argument("--layout", choices=LAYOUTS, default="npy")
+    report = commands.add_parser("report", help="print the aggregates of an export as JSON")
+    report.add_argument("directory")
+    report.add_argument("--bins", type=int, default=10)
+    report.add_argument("--domain", help="aggregate one domain only")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        from session_log import recover
+        sessions = recover(args.log_directory).values()
+        count = export_sessions(sessions, args.directory, args.chunk_rows, args.layout)
+        print(f"Exported {count} completed sessions to {args.directory}")
+    else:
+        print(json.dumps(aggregate(args.directory, args.bins, args.domain).to_dict(), indent=2))
+
+if __name__ == "__main__":
+    main()
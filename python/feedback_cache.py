@@ -0,0 +1,152 @@
+"""
+Feedback result cache for Mock Interview AI
+
+FeedbackCache keeps recently generated Feedback in a bounded in-process LRU
+and, optionally, in an on-disk tier (one file per session fingerprint in the
+binary format). Keys are InterviewSession.fingerprint() digests, which
+include SCORING_VERSION, and the disk tier lives in a per-version directory,
+so bumping the version invalidates everything cached before it. The disk
+tier is bounded too: past max_disk_entries files, the least recently used
+ones (as seen by this process, starting from file modification times) are
+deleted.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from mock_interview_ai import SCORING_VERSION, Feedback
+
+from binary_format import FormatError
+
+class FeedbackCache:
+    """Bounded LRU of feedback by session fingerprint, with an optional disk tier"""
+
+    def __init__(self, max_entries: int = 10000, directory: Optional[str] = None,
+                 max_disk_entries: int = 1000000):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.directory = os.path.join(directory, f"v{SCORING_VERSION}") if directory else None
+        self._entries: "OrderedDict[str, Feedback]" = OrderedDict()
+        self._disk_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._scan_disk()
+
+    def get(self, key: str) -> Optional[Feedback]:
+        """Get cached feedback, promoting disk entries into memory"""
+        with self._lock:
+            feedback = self._entries.get(key)
+            if feedback is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return feedback
+        feedback = self._read(key) if self.directory else None
+        with self._lock:
+            if feedback is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, feedback)
+            if key in self._disk_keys:
+                self._disk_keys.move_to_end(key)
+        return feedback
+
+    def put(self, key: str, feedback: Feedback) -> None:
+        """Cache feedback in memory and, if configured, on disk"""
+        with self._lock:
+            self._remember(key, feedback)
+        if self.directory:
+            self._write(key, feedback)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Feedback]) -> Feedback:
+        """Get cached feedback or compute and cache it"""
+        feedback = self.get(key)
+        if feedback is None:
+            feedback = compute()
+            self.put(key, feedback)
+        return feedback
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the disk tier is kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for sizing the cache"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "disk_entries": len(self._disk_keys),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, feedback: Feedback) -> None:
+        self._entries[key] = feedback
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _scan_disk(self) -> None:
+        """Order the entries already on disk from least to most recently written"""
+        found = []
+        for prefix in os.scandir(self.directory):
+            if prefix.is_dir():
+                for entry in os.scandir(prefix.path):
+                    if entry.name.endswith(".bin"):
+                        found.append((entry.stat().st_mtime_ns, entry.name[:-len(".bin")]))
+        for _, key in sorted(found):
+            self._disk_keys[key] = None
+        for key in self._evict_disk():
+            self._remove(key)
+
+    def _evict_disk(self) -> List[str]:
+        """Drop the least recently used disk keys past the cap, returning them for removal"""
+        evicted = []
+        while len(self._disk_keys) > self.max_disk_entries:
+            evicted.append(self._disk_keys.popitem(last=False)[0])
+            self.evictions += 1
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:  # another process evicted it first
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".bin")
+
+    def _read(self, key: str) -> Optional[Feedback]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return Feedback.from_bytes(f.read())
+        except (OSError, FormatError):
+            return None
+
+    def _write(self, key: str, feedback: Feedback) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(feedback.to_bytes())
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._disk_keys[key] = None
+            self._disk_keys.move_to_end(key)
+            evicted = self._evict_disk()
+        for evicted_key in evicted:
+            self._remove(evicted_key)
@@ -0,0 +1,141 @@
+"""
+Feedback offload for Mock Interview AI
+
+FeedbackExecutor scores finished sessions inline, in a thread pool or in a
+process pool. In process mode only a SessionSummary (domain id, skills,
+answer count, total answer length, follow-up count and seed) crosses the
+process boundary; the worker scores it against a copy of the caller's domains
+(installed by the pool initializer) and sends back the Feedback, so
+end-of-interview spikes are spread over all cores. Feedback already in a
+session's feedback cache is returned without a round trip, and feedback
+computed by the workers is added to it.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from mock_interview_ai import (
+    Feedback, InterviewDomain, InterviewSession, MockInterviewAI, SessionSummary, build_registry, get_default_ai
+)
+
+MODES = ("inline", "thread", "process")
+
+# Set in process pool workers by _initialize_worker
+_worker_ai: Optional[MockInterviewAI] = None
+
+def _initialize_worker(domains: Sequence[InterviewDomain], version: int, initializer, initargs: tuple) -> None:
+    """Process pool initializer: score against the caller's domains after any user initializer"""
+    global _worker_ai
+    if initializer is not None:
+        initializer(*initargs)
+    # Scoring resolves only the domain, so the worker needs no question bank
+    _worker_ai = MockInterviewAI(registry=build_registry(domains, {}, version=version))
+
+def score_summary(summary: SessionSummary) -> Feedback:
+    """Score a session summary (process pool entry point)
+
+    Uses the domains installed by the FeedbackExecutor initializer, or the
+    process-wide registry in a pool started without it.
+    """
+    return (_worker_ai or get_default_ai()).feedback_from_summary(summary)
+
+def score_summaries(summaries: List[SessionSummary]) -> List[Feedback]:
+    """Score a chunk of summaries in one task"""
+    ai = _worker_ai or get_default_ai()
+    return [ai.feedback_from_summary(summary) for summary in summaries]
+
+def _cache_result(cache, fingerprint: str, future: "Future[Feedback]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        cache.put(fingerprint, future.result())
+
+class FeedbackExecutor:
+    """Generates session feedback inline, on a thread pool or on a process pool
+
+    Process workers resolve domains by id against the domains of ai's
+    registry (the default AI's unless given) as they were when the executor
+    was created; a given initializer runs in each worker before they are
+    installed.
+    """
+
+    def __init__(self, mode: str = "process", max_workers: Optional[int] = None,
+                 initializer=None, initargs: tuple = (), ai: Optional[MockInterviewAI] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self.ai = ai or get_default_ai()
+        self._pool: Optional[Executor] = None
+        if mode == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+        elif mode == "process":
+            registry = self.ai.registry
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_initialize_worker,
+                initargs=(registry.domains, registry.version, initializer, initargs))
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """The underlying pool, or None in inline mode"""
+        return self._pool
+
+    def submit(self, session: InterviewSession) -> "Future[Feedback]":
+        """Schedule the feedback of one session"""
+        if self.mode == "process":
+            cache = session.ai.feedback_cache
+            if cache is None:
+                return self._pool.submit(score_summary, session.summary())
+            fingerprint = session.fingerprint()
+            feedback = cache.get(fingerprint)
+            if feedback is not None:
+                future: "Future[Feedback]" = Future()
+                future.set_result(feedback)
+                return future
+            future = self._pool.submit(score_summary, session.summary())
+            future.add_done_callback(lambda done: _cache_result(cache, fingerprint, done))
+            return future
+        if self.mode == "thread":
+            return self._pool.submit(session.generate_feedback)
+        future: "Future[Feedback]" = Future()
+        try:
+            future.set_result(session.generate_feedback())
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def map(self, sessions: Iterable[InterviewSession], chunk_size: int = 256) -> List[Feedback]:
+        """Generate the feedback of many sessions, in order"""
+        sessions = list(sessions)
+        if self.mode == "inline":
+            return [session.generate_feedback() for session in sessions]
+        if self.mode == "thread":
+            return list(self._pool.map(InterviewSession.generate_feedback, sessions))
+        # Only sessions missing from their feedback cache go to the workers
+        results: List[Optional[Feedback]] = [None] * len(sessions)
+        fingerprints: Dict[int, str] = {}
+        pending: List[int] = []
+        for index, session in enumerate(sessions):
+            cache = session.ai.feedback_cache
+            if cache is not None:
+                fingerprints[index] = session.fingerprint()
+                results[index] = cache.get(fingerprints[index])
+            if results[index] is None:
+                pending.append(index)
+        chunks = [
+            [sessions[index].summary() for index in pending[start:start + chunk_size]]
+            for start in range(0, len(pending), chunk_size)
+        ]
+        computed = (feedback for chunk in self._pool.map(score_summaries, chunks) for feedback in chunk)
+        for index, feedback in zip(pending, computed):
+            results[index] = feedback
+            if index in fingerprints:
+                sessions[index].ai.feedback_cache.put(fingerprints[index], feedback)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "FeedbackExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
@@ -0,0 +1,157 @@
+"""
+Similarity-based follow-up selection for Mock Interview AI
+
+FollowUpIndex holds hashed TF-IDF vectors of follow-up questions. Features
+are the content unigrams and adjacent bigrams of answer_analysis, hashed
+(with CRC32, so vectors agree across processes) into a sparse space and
+weighted by inverse document frequency over the bank's follow-ups. Rows are
+L2-normalized and stored as a CSR matrix, so ranking candidates against an
+answer is one vectorized sparse cosine computation.
+
+Strategies:
+    most_relevant  the follow-ups closest to what the candidate said
+    least_covered  the follow-ups the answer touched least
+"""
+
+import math
+import threading
+import weakref
+import zlib
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from mock_interview_ai import QuestionBank, np
+
+from answer_analysis import phrases
+
+STRATEGIES = ("most_relevant", "least_covered")
+
+# Size of the hashed feature space
+FEATURE_BITS = 20
+
+# Questions whose follow-ups are indexed up front (and used for IDF); larger
+# banks are sampled evenly and other follow-ups are vectorized on first use
+MAX_INDEXED_QUESTIONS = 20000
+
+Vector = Tuple[List[int], List[float]]  # sorted feature ids, L2-normalized weights
+
+def _feature(phrase: Tuple[str, ...]) -> int:
+    return zlib.crc32(" ".join(phrase).encode("utf-8")) & ((1 << FEATURE_BITS) - 1)
+
+def features(text: str) -> List[int]:
+    """Sorted distinct hashed features of a text"""
+    return sorted({_feature(phrase) for phrase in phrases(text)})
+
+class FollowUpIndex:
+    """Hashed TF-IDF matrix over a bank's follow-ups"""
+
+    def __init__(self, texts: Iterable[str]):
+        texts = list(dict.fromkeys(texts))
+        rows = [features(text) for text in texts]
+        document_frequency: Dict[int, int] = {}
+        for row in rows:
+            for feature in row:
+                document_frequency[feature] = document_frequency.get(feature, 0) + 1
+        self._documents = len(rows)
+        self._document_frequency = document_frequency
+        self._lock = threading.Lock()
+
+        self._rows: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for text, row in zip(texts, rows):
+            row_indices, row_data = self._weigh(row)
+            indices.extend(row_indices)
+            data.extend(row_data)
+            indptr.append(len(indices))
+            self._rows[text] = len(self._rows)
+        self._extra: Dict[str, Vector] = {}
+        if np is not None:
+            self._indptr = np.asarray(indptr, dtype=np.int64)
+            self._indices = np.asarray(indices, dtype=np.int64)
+            self._data = np.asarray(data, dtype=np.float64)
+        else:
+            self._indptr, self._indices, self._data = indptr, indices, data
+
+    @classmethod
+    def from_bank(cls, question_bank: QuestionBank,
+                  max_indexed_questions: int = MAX_INDEXED_QUESTIONS) -> "FollowUpIndex":
+        """Index the follow-ups of a bank, sampling evenly above max_indexed_questions"""
+        handles = [handle for skill in question_bank.skills()
+                   for handles in question_bank.buckets(skill) for handle in handles]
+        stride = max(1, -(-len(handles) // max_indexed_questions))
+        return cls(follow_up for handle in handles[::stride]
+                   for follow_up in question_bank.load(handle).follow_ups)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def idf(self, feature: int) -> float:
+        return math.log((1 + self._documents) / (1 + self._document_frequency.get(feature, 0))) + 1
+
+    def vectorize(self, text: str) -> Vector:
+        """TF-IDF vector of a text (binary term frequency)"""
+        return self._weigh(features(text))
+
+    def _weigh(self, row: List[int]) -> Vector:
+        weights = [self.idf(feature) for feature in row]
+        norm = math.sqrt(sum(weight * weight for weight in weights)) or 1.0
+        return row, [weight / norm for weight in weights]
+
+    def _row(self, text: str) -> Vector:
+        row = self._rows.get(text)
+        if row is not None:
+            start, end = self._indptr[row], self._indptr[row + 1]
+            return self._indices[start:end], self._data[start:end]
+        vector = self._extra.get(text)
+        if vector is None:
+            vector = self.vectorize(text)
+            with self._lock:
+                self._extra[text] = vector
+        return vector
+
+    def similarities(self, answer_text: str, candidates: Sequence[str]) -> List[float]:
+        """Cosine similarity of the answer to each candidate follow-up"""
+        query_indices, query_data = self.vectorize(answer_text)
+        if not candidates:
+            return []
+        if np is None:
+            query = dict(zip(query_indices, query_data))
+            return [sum(query.get(feature, 0.0) * weight for feature, weight in zip(*self._row(text)))
+                    for text in candidates]
+
+        rows = [self._row(text) for text in candidates]
+        lengths = np.array([len(indices) for indices, _ in rows], dtype=np.int64)
+        indices = np.concatenate([np.asarray(indices, dtype=np.int64) for indices, _ in rows])
+        data = np.concatenate([np.asarray(weights, dtype=np.float64) for _, weights in rows])
+        query_indices = np.asarray(query_indices, dtype=np.int64)
+        query_data = np.asarray(query_data, dtype=np.float64)
+        if not len(query_indices) or not len(indices):
+            return [0.0] * len(candidates)
+        positions = np.minimum(np.searchsorted(query_indices, indices), len(query_indices) - 1)
+        products = np.where(query_indices[positions] == indices, data * query_data[positions], 0.0)
+        row_ids = np.repeat(np.arange(len(candidates)), lengths)
+        return np.bincount(row_ids, weights=products, minlength=len(candidates)).tolist()
+
+    def rank(self, answer_text: str, candidates: Sequence[str], k: int,
+             strategy: str = "most_relevant") -> List[str]:
+        """The top k candidates for an answer under a strategy (ties keep candidate order)"""
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}, expected one of {STRATEGIES}")
+        scores = self.similarities(answer_text, candidates)
+        sign = -1 if strategy == "most_relevant" else 1
+        order = sorted(range(len(candidates)), key=lambda i: (sign * scores[i], i))
+        return [candidates[i] for i in order[:k]]
+
+_indexes: "weakref.WeakKeyDictionary[QuestionBank, FollowUpIndex]" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+def follow_up_index_for(question_bank: QuestionBank) -> FollowUpIndex:
+    """Get the shared follow-up index of a question bank"""
+    index = _indexes.get(question_bank)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(question_bank)
+            if index is None:
+                index = _indexes[question_bank] = FollowUpIndex.from_bank(question_bank)
+    return index
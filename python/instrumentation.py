@@ -0,0 +1,336 @@
+"""
+Hot-path instrumentation for Mock Interview AI
+
+enable() wraps session creation, question selection, follow-up selection,
+answer submission and feedback generation (both through the feedback cache
+and the direct compute_feedback and feedback_from_summary) with timing
+wrappers that record per-call latency histograms and counters (sessions
+created, candidates filtered, questions selected, random draws the sampler
+made and how many of them it rejected, feedback cache hits and misses). disable()
+puts the original methods back, so disabled instrumentation costs nothing.
+
+Metrics export as a Prometheus text snapshot or as JSON. For one session at
+a time, Metrics.profile_session() samples the stacks of the threads working
+on that session and reports them as collapsed stacks (flame graph input).
+"""
+
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+import mock_interview_ai
+from mock_interview_ai import InterviewSession, MockInterviewAI, template_cache_info
+
+from feedback_cache import FeedbackCache
+
+METRIC_PREFIX = "mock_interview"
+
+# Latency histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (
+    5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+class Histogram:
+    """Fixed-bucket histogram of observed values"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile"""
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target and seen:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip([str(bound) for bound in self.bounds] + ["+Inf"], self.counts)),
+        }
+
+class SamplingProfiler:
+    """Samples the stacks of threads while they work on one session"""
+
+    def __init__(self, session_id: str, interval: float = 0.001):
+        self.session_id = session_id
+        self.interval = interval
+        self.samples: "Counter[str]" = Counter()
+        self._active: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"profile-{session_id}", daemon=True)
+        self._thread.start()
+
+    def enter(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            self._active[ident] = self._active.get(ident, 0) + 1
+
+    def exit(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            depth = self._active[ident] - 1
+            if depth:
+                self._active[ident] = depth
+            else:
+                del self._active[ident]
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Samples as "frame;frame;frame count" lines, outermost frame first"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                active = list(self._active)
+            if not active:
+                continue
+            frames = sys._current_frames()
+            for ident in active:
+                frame = frames.get(ident)
+                stack: List[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                    frame = frame.f_back
+                if stack:
+                    self.samples[";".join(reversed(stack))] += 1
+
+class Metrics:
+    """Counters, latency histograms and an optional per-session profiler"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, Histogram] = {}
+        self.profiler: Optional[SamplingProfiler] = None
+        self._collectors: Dict[str, Callable[[], Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, call: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.timings.get(call)
+            if histogram is None:
+                histogram = self.timings[call] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def add_collector(self, name: str, collect: Callable[[], Dict[str, int]]) -> None:
+        """Report collect()'s values as gauges named <name>_<key> at export time
+        (e.g. add_collector("feedback_cache", cache.stats))"""
+        self._collectors[name] = collect
+
+    def profile_session(self, session_id: str, interval: float = 0.001) -> SamplingProfiler:
+        """Start sampling the stacks of calls on one session (replacing any running profiler)"""
+        self.stop_profiling()
+        self.profiler = SamplingProfiler(session_id, interval)
+        return self.profiler
+
+    def stop_profiling(self) -> Optional[SamplingProfiler]:
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+
+    def gauges(self) -> Dict[str, int]:
+        """Values of the template caches and of the registered collectors"""
+        values = {}
+        for name, info in template_cache_info().items():
+            values[f"{name}_template_cache_hits"] = info.hits
+            values[f"{name}_template_cache_misses"] = info.misses
+            values[f"{name}_template_cache_size"] = info.currsize
+        for name, collect in self._collectors.items():
+            for key, value in collect().items():
+                values[f"{name}_{key}"] = value
+        return values
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timings": {call: histogram.to_dict() for call, histogram in self.timings.items()},
+                "gauges": self.gauges(),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Snapshot in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+            lines.append(f"{METRIC_PREFIX}_{name}_total {value}")
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+            lines.append(f"{METRIC_PREFIX}_{name} {value}")
+        family = f"{METRIC_PREFIX}_call_seconds"
+        if snapshot["timings"]:
+            lines.append(f"# TYPE {family} histogram")
+        for call, histogram in sorted(snapshot["timings"].items()):
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                lines.append(f'{family}_bucket{{call="{call}",le="{bound}"}} {cumulative}')
+            lines.append(f'{family}_sum{{call="{call}"}} {histogram["sum"]}')
+            lines.append(f'{family}_count{{call="{call}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+def _timed(metrics: Metrics, call: str, method: Callable, count: Optional[Callable] = None) -> Callable:
+    """Wrap a method to time it and, optionally, count something about its result"""
+    clock = time.perf_counter
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        result = method(*args, **kwargs)
+        metrics.observe(call, clock() - start)
+        if count is not None:
+            count(metrics, result)
+        return result
+    return wrapper
+
+def _profiled(metrics: Metrics, call: str, method: Callable) -> Callable:
+    """Time a session method and feed the profiler while it runs on the profiled session"""
+    clock = time.perf_counter
+
+    @wraps(method)
+    def wrapper(session, *args, **kwargs):
+        profiler = metrics.profiler
+        if profiler is None or profiler.session_id != session.session_id:
+            start = clock()
+            result = method(session, *args, **kwargs)
+            metrics.observe(call, clock() - start)
+            return result
+        profiler.enter()
+        try:
+            start = clock()
+            result = method(session, *args, **kwargs)
+            metrics.observe(call, clock() - start)
+            return result
+        finally:
+            profiler.exit()
+    return wrapper
+
+def _count_candidates(metrics: Metrics, pools) -> None:
+    metrics.increment("candidates_filtered", sum(pool.size for pool in pools))
+
+def _count_selected(metrics: Metrics, questions) -> None:
+    metrics.increment("questions_selected", len(questions))
+
+def _wrap_sampler(metrics: Metrics, function: Callable) -> Callable:
+    """Count the sampler's draws, and the draws rejected as repeats or cluster collisions"""
+
+    @wraps(function)
+    def wrapper(pools, num_selected_skills, count, draw, clusters=None):
+        draws = 0
+
+        def counted_draw():
+            nonlocal draws
+            draws += 1
+            return draw()
+        handles = function(pools, num_selected_skills, count, counted_draw, clusters)
+        # One draw orders each covered skill and one picks each question; the rest were rejected
+        metrics.increment("sampler_draws", draws)
+        metrics.increment("sampler_rejections", draws - min(len(pools), len(handles)) - len(handles))
+        return handles
+    return wrapper
+
+def _count_cache_lookup(metrics: Metrics, feedback) -> None:
+    metrics.increment("feedback_cache_misses" if feedback is None else "feedback_cache_hits")
+
+def _wrap_session_init(metrics: Metrics, method: Callable) -> Callable:
+    wrapped = _timed(metrics, "session_create", method)
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        wrapped(*args, **kwargs)
+        metrics.increment("sessions_created")
+    return wrapper
+
+# (class or module, attribute, wrapper factory)
+_HOOKS = (
+    (InterviewSession, "__init__", _wrap_session_init),
+    (InterviewSession, "get_follow_up_questions", lambda m, f: _profiled(m, "session_follow_ups", f)),
+    (InterviewSession, "submit_answer", lambda m, f: _profiled(m, "submit_answer", f)),
+    (InterviewSession, "generate_feedback", lambda m, f: _profiled(m, "session_feedback", f)),
+    (InterviewSession, "compute_feedback", lambda m, f: _profiled(m, "session_compute_feedback", f)),
+    (MockInterviewAI, "generate_questions", lambda m, f: _timed(m, "generate_questions", f, _count_selected)),
+    (mock_interview_ai, "_sample_handles", _wrap_sampler),
+    (MockInterviewAI, "_candidate_pools", lambda m, f: _timed(m, "filter_candidates", f, _count_candidates)),
+    (MockInterviewAI, "get_follow_up_questions", lambda m, f: _timed(m, "get_follow_up_questions", f)),
+    (MockInterviewAI, "generate_feedback", lambda m, f: _timed(m, "generate_feedback", f)),
+    (MockInterviewAI, "feedback_from_summary", lambda m, f: _timed(m, "feedback_from_summary", f)),
+    (FeedbackCache, "get", lambda m, f: _timed(m, "feedback_cache_get", f, _count_cache_lookup)),
+)
+
+_originals: Dict[Tuple[type, str], Callable] = {}
+_enabled: Optional[Metrics] = None
+_enable_lock = threading.Lock()
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """Install the instrumentation hooks process-wide and return the metrics they feed"""
+    global _enabled
+    with _enable_lock:
+        if _enabled is not None:
+            _restore()
+        metrics = metrics or Metrics()
+        for cls, name, wrap in _HOOKS:
+            original = cls.__dict__[name]
+            _originals[(cls, name)] = original
+            setattr(cls, name, wrap(metrics, original))
+        _enabled = metrics
+        return metrics
+
+def disable() -> Optional[Metrics]:
+    """Remove the hooks, stop any profiler and return the metrics collected"""
+    global _enabled
+    with _enable_lock:
+        metrics, _enabled = _enabled, None
+        _restore()
+        if metrics is not None:
+            metrics.stop_profiling()
+        return metrics
+
+def enabled() -> Optional[Metrics]:
+    """The metrics being collected, or None while disabled"""
+    return _enabled
+
+def _restore() -> None:
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
@@ -5,12 +5,25 @@ A comprehensive mock interview system with AI-powered feedback
 """
 
 import json
+import math
 import random
 import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import hashlib
+import sys
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
+from dataclasses import dataclass, asdict, field, replace
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch paths fall back to pure Python
+    np = None
+
 class QuestionType(Enum):
     TECHNICAL = "technical"
     BEHAVIORAL = "behavioral"
@@ -22,374 +35,1242 @@ class Difficulty(Enum):
     HARD = "hard"
     MIXED = "mixed"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Question:
     id: str
     text: str
     type: QuestionType
     difficulty: Difficulty
     skill: str
-    follow_ups: List[str]
+    follow_ups: Sequence[str]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InterviewDomain:
     id: str
     title: str
     description: str
     icon: str
-    skills: List[str]
+    skills: Sequence[str]
 
-@dataclass
+def _follow_up_pairs(question: Question, follow_up_answers: Iterable[Dict[str, str]]) -> Tuple[Tuple[Union[int, str], str], ...]:
+    """Follow-up {"question", "answer"} dicts as (key, answer text) pairs (see Answer)"""
+    follow_ups = []
+    for follow_up in follow_up_answers:
+        follow_up_text = follow_up.get("question", "")
+        try:
+            key = question.follow_ups.index(follow_up_text)
+        except ValueError:
+            key = follow_up_text
+        follow_ups.append((key, follow_up.get("answer", "")))
+    return tuple(follow_ups)
+
+@dataclass(frozen=True, slots=True)
 class Answer:
-    question_id: str
+    """An answer to a question
+
+    Follow-ups are stored as (key, answer text) pairs, where key is the index
+    of the follow-up in question.follow_ups, or the follow-up text itself
+    when it isn't one of them, so follow-up question texts are never copied.
+
+    The pre-slots form Answer(question_id, text, timestamp, follow_up_answers)
+    is still accepted: a question id is looked up in the default registry and
+    {"question", "answer"} dicts are converted to pairs.
+    """
+    question: Question
     text: str
     timestamp: datetime.datetime
-    follow_up_answers: List[Dict[str, str]]
+    follow_ups: Tuple[Tuple[Union[int, str], str], ...] = ()
+    
+    def __init__(self, question: Union[Question, str, None] = None, text: str = "",
+                 timestamp: Optional[datetime.datetime] = None,
+                 follow_ups: Union[Tuple[Tuple[Union[int, str], str], ...], List[Dict[str, str]]] = (), *,
+                 question_id: Optional[str] = None, follow_up_answers: Optional[List[Dict[str, str]]] = None):
+        if not isinstance(question, Question):
+            question = get_default_ai().find_question(question_id if question is None else question)
+        if follow_up_answers is not None or isinstance(follow_ups, list):
+            follow_ups = _follow_up_pairs(question, follow_up_answers if follow_up_answers is not None else follow_ups)
+        object.__setattr__(self, "question", question)
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "follow_ups", follow_ups)
+    
+    @classmethod
+    def create(cls, question: Question, text: str, timestamp: datetime.datetime,
+               follow_up_answers: Optional[List[Dict[str, str]]] = None) -> "Answer":
+        """Create an answer from follow-ups given as {"question", "answer"} dicts"""
+        return cls(question=question, text=text, timestamp=timestamp,
+                   follow_ups=_follow_up_pairs(question, follow_up_answers or ()))
+    
+    @property
+    def question_id(self) -> str:
+        return self.question.id
+    
+    @property
+    def follow_up_answers(self) -> List[Dict[str, str]]:
+        """Follow-ups as {"question", "answer"} dicts"""
+        return [
+            {"question": self.question.follow_ups[key] if isinstance(key, int) else key, "answer": answer}
+            for key, answer in self.follow_ups
+        ]
+    
+    def to_bytes(self) -> bytes:
+        """Encode the answer in the binary format (see binary_format)"""
+        from binary_format import answer_to_bytes
+        return answer_to_bytes(self)
+    
+    @classmethod
+    def from_bytes(cls, data, questions=None, ai: Optional["MockInterviewAI"] = None) -> "Answer":
+        """Decode an answer; its question is looked up in questions (a mapping or
+        callable by id) or, by default, in the registry"""
+        from binary_format import answer_from_bytes
+        return answer_from_bytes(data, questions, ai)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillFeedback:
     skill: str
     score: int
     feedback: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Feedback:
     score: int
-    strengths: List[str]
-    improvements: List[str]
+    strengths: Sequence[str]
+    improvements: Sequence[str]
     overall_feedback: str
-    next_steps: List[str]
-    skill_breakdown: List[SkillFeedback]
+    next_steps: Sequence[str]
+    skill_breakdown: Sequence[SkillFeedback]
+    
+    def to_bytes(self) -> bytes:
+        """Encode the feedback in the binary format (see binary_format)"""
+        from binary_format import feedback_to_bytes
+        return feedback_to_bytes(self)
+    
+    @classmethod
+    def from_bytes(cls, data) -> "Feedback":
+        from binary_format import feedback_from_bytes
+        return feedback_from_bytes(data)
+
+class SessionSummary(NamedTuple):
+    """Compact, picklable inputs to a session's feedback"""
+    domain_id: str
+    skills: Tuple[str, ...]
+    num_answers: int
+    length_sum: int
+    total_follow_ups: int
+    seed: int
+    skill_adjustments: Tuple[Optional[int], ...] = ()  # per skill, None where unanswered
 
 @dataclass
 class InterviewSettings:
     number_of_questions: int = 8
     include_follow_ups: bool = True
     difficulty: Difficulty = Difficulty.MIXED
+    # Pick each question when it is reached, following the candidate's ability
+    adaptive: bool = False
 
-class MockInterviewAI:
+def _initialize_domains() -> List[InterviewDomain]:
+    """Initialize interview domains"""
+    return [
+        InterviewDomain(
+            id="software-engineer",
+            title="Software Engineer",
+            description="Technical questions covering algorithms, data structures, system design, and coding best practices.",
+            icon="Code",
+            skills=["Algorithms", "Data Structures", "System Design", "Object-Oriented Programming", "Problem Solving"]
+        ),
+        InterviewDomain(
+            id="frontend-developer",
+            title="Frontend Developer",
+            description="Questions focused on React, JavaScript, CSS, web performance, and user experience.",
+            icon="Monitor",
+            skills=["React", "JavaScript", "HTML/CSS", "Web Performance", "Responsive Design"]
+        ),
+        InterviewDomain(
+            id="data-scientist",
+            title="Data Scientist",
+            description="Statistical analysis, machine learning, Python, data visualization, and business analytics.",
+            icon="BarChart3",
+            skills=["Machine Learning", "Statistics", "Python", "SQL", "Data Visualization"]
+        ),
+        InterviewDomain(
+            id="product-manager",
+            title="Product Manager",
+            description="Product strategy, user research, roadmap planning, stakeholder management, and metrics.",
+            icon="Target",
+            skills=["Product Strategy", "User Research", "Analytics", "Roadmap Planning", "Stakeholder Management"]
+        )
+    ]
+
+def _initialize_question_bank() -> Dict[str, List[Question]]:
+    """Initialize the question bank with sample questions"""
+    return {
+        "Algorithms": [
+            Question(
+                id="algo-1",
+                text="Explain how you would approach solving a problem where you need to find the shortest path between two nodes in a graph.",
+                type=QuestionType.TECHNICAL,
+                difficulty=Difficulty.MEDIUM,
+                skill="Algorithms",
+                follow_ups=[
+                    "What if the graph has negative edge weights?",
+                    "How would you optimize this for very large graphs?",
+                    "Can you implement Dijkstra's algorithm from scratch?"
+                ]
+            ),
+            Question(
+                id="algo-2",
+                text="Walk me through your thought process for optimizing a recursive solution that has overlapping subproblems.",
+                type=QuestionType.TECHNICAL,
+                difficulty=Difficulty.HARD,
+                skill="Algorithms",
+                follow_ups=[
+                    "What's the difference between memoization and tabulation?",
+                    "When would you choose one approach over the other?",
+                    "Can you give me a real-world example where you've used dynamic programming?"
+                ]
+            )
+        ],
+        "Data Structures": [
+            Question(
+                id="ds-1",
+                text="When would you choose a hash table over a binary search tree, and vice versa?",
+                type=QuestionType.TECHNICAL,
+                difficulty=Difficulty.MEDIUM,
+                skill="Data Structures",
+                follow_ups=[
+                    "How do you handle hash collisions?",
+                    "What's the worst-case time complexity for hash table operations?",
+                    "Can you implement a hash table from scratch?"
+                ]
+            )
+        ],
+        "Python": [
+            Question(
+                id="python-1",
+                text="Explain the difference between lists and tuples in Python, and when you'd use each.",
+                type=QuestionType.TECHNICAL,
+                difficulty=Difficulty.EASY,
+                skill="Python",
+                follow_ups=[
+                    "What are the performance implications of each?",
+                    "How do you handle large datasets efficiently in Python?",
+                    "When would you use a set instead of a list?"
+                ]
+            )
+        ],
+        "Machine Learning": [
+            Question(
+                id="ml-1",
+                text="Explain the bias-variance tradeoff and how it affects model performance.",
+                type=QuestionType.TECHNICAL,
+                difficulty=Difficulty.MEDIUM,
+                skill="Machine Learning",
+                follow_ups=[
+                    "How do you detect if your model is overfitting?",
+                    "What techniques can you use to reduce overfitting?",
+                    "When would you prefer a high-bias, low-variance model?"
+                ]
+            )
+        ]
+    }
+
+def _freeze_question(question: Question) -> Question:
+    """Return a copy of a question with interned strings and tuple follow-ups"""
+    return Question(
+        id=sys.intern(question.id),
+        text=question.text,
+        type=question.type,
+        difficulty=question.difficulty,
+        skill=sys.intern(question.skill),
+        follow_ups=tuple(question.follow_ups)
+    )
+
+def _freeze_domain(domain: InterviewDomain) -> InterviewDomain:
+    """Return a copy of a domain with interned skill names"""
+    return InterviewDomain(
+        id=sys.intern(domain.id),
+        title=domain.title,
+        description=domain.description,
+        icon=domain.icon,
+        skills=tuple(sys.intern(skill) for skill in domain.skills)
+    )
+
+class QuestionBank(ABC):
+    """Read-only question bank indexed by (skill, difficulty, type)
+
+    Questions are addressed by integer handles and only built by load(),
+    so a bank can be backed by memory or by a file on disk.
+    """
+    
     def __init__(self):
-        self.domains = self._initialize_domains()
-        self.question_bank = self._initialize_question_bank()
-        self.current_session = None
+        self._index: Dict[str, Dict[Tuple[Difficulty, QuestionType], Sequence[int]]] = {}
     
-    def _initialize_domains(self) -> List[InterviewDomain]:
-        """Initialize interview domains"""
+    def skills(self) -> Tuple[str, ...]:
+        """Get all skills that have questions"""
+        return tuple(self._index)
+    
+    def buckets(self, skill: str, difficulty: Optional[Difficulty] = None) -> List[Sequence[int]]:
+        """Get the question handles for a skill, one sequence per (difficulty, type) key"""
         return [
-            InterviewDomain(
-                id="software-engineer",
-                title="Software Engineer",
-                description="Technical questions covering algorithms, data structures, system design, and coding best practices.",
-                icon="Code",
-                skills=["Algorithms", "Data Structures", "System Design", "Object-Oriented Programming", "Problem Solving"]
-            ),
-            InterviewDomain(
-                id="frontend-developer",
-                title="Frontend Developer",
-                description="Questions focused on React, JavaScript, CSS, web performance, and user experience.",
-                icon="Monitor",
-                skills=["React", "JavaScript", "HTML/CSS", "Web Performance", "Responsive Design"]
-            ),
-            InterviewDomain(
-                id="data-scientist",
-                title="Data Scientist",
-                description="Statistical analysis, machine learning, Python, data visualization, and business analytics.",
-                icon="BarChart3",
-                skills=["Machine Learning", "Statistics", "Python", "SQL", "Data Visualization"]
-            ),
-            InterviewDomain(
-                id="product-manager",
-                title="Product Manager",
-                description="Product strategy, user research, roadmap planning, stakeholder management, and metrics.",
-                icon="Target",
-                skills=["Product Strategy", "User Research", "Analytics", "Roadmap Planning", "Stakeholder Management"]
-            )
+            handles for (bucket_difficulty, _), handles in self._index.get(skill, {}).items()
+            if difficulty is None or bucket_difficulty == difficulty
         ]
     
-    def _initialize_question_bank(self) -> Dict[str, List[Question]]:
-        """Initialize the question bank with sample questions"""
-        return {
-            "Algorithms": [
-                Question(
-                    id="algo-1",
-                    text="Explain how you would approach solving a problem where you need to find the shortest path between two nodes in a graph.",
-                    type=QuestionType.TECHNICAL,
-                    difficulty=Difficulty.MEDIUM,
-                    skill="Algorithms",
-                    follow_ups=[
-                        "What if the graph has negative edge weights?",
-                        "How would you optimize this for very large graphs?",
-                        "Can you implement Dijkstra's algorithm from scratch?"
-                    ]
-                ),
-                Question(
-                    id="algo-2",
-                    text="Walk me through your thought process for optimizing a recursive solution that has overlapping subproblems.",
-                    type=QuestionType.TECHNICAL,
-                    difficulty=Difficulty.HARD,
-                    skill="Algorithms",
-                    follow_ups=[
-                        "What's the difference between memoization and tabulation?",
-                        "When would you choose one approach over the other?",
-                        "Can you give me a real-world example where you've used dynamic programming?"
-                    ]
-                )
-            ],
-            "Data Structures": [
-                Question(
-                    id="ds-1",
-                    text="When would you choose a hash table over a binary search tree, and vice versa?",
-                    type=QuestionType.TECHNICAL,
-                    difficulty=Difficulty.MEDIUM,
-                    skill="Data Structures",
-                    follow_ups=[
-                        "How do you handle hash collisions?",
-                        "What's the worst-case time complexity for hash table operations?",
-                        "Can you implement a hash table from scratch?"
-                    ]
-                )
-            ],
-            "Python": [
-                Question(
-                    id="python-1",
-                    text="Explain the difference between lists and tuples in Python, and when you'd use each.",
-                    type=QuestionType.TECHNICAL,
-                    difficulty=Difficulty.EASY,
-                    skill="Python",
-                    follow_ups=[
-                        "What are the performance implications of each?",
-                        "How do you handle large datasets efficiently in Python?",
-                        "When would you use a set instead of a list?"
-                    ]
-                )
-            ],
-            "Machine Learning": [
-                Question(
-                    id="ml-1",
-                    text="Explain the bias-variance tradeoff and how it affects model performance.",
-                    type=QuestionType.TECHNICAL,
-                    difficulty=Difficulty.MEDIUM,
-                    skill="Machine Learning",
-                    follow_ups=[
-                        "How do you detect if your model is overfitting?",
-                        "What techniques can you use to reduce overfitting?",
-                        "When would you prefer a high-bias, low-variance model?"
-                    ]
-                )
-            ]
-        }
+    @abstractmethod
+    def load(self, handle: int) -> Question:
+        """Build the question stored under a handle"""
+        raise NotImplementedError
+    
+    def find(self, question_id: str) -> Question:
+        """Get a question by id (a scan of the whole bank unless overridden)"""
+        for keyed in self._index.values():
+            for handles in keyed.values():
+                for handle in handles:
+                    question = self.load(handle)
+                    if question.id == question_id:
+                        return question
+        raise KeyError(question_id)
+    
+    def __contains__(self, skill: object) -> bool:
+        return skill in self._index
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def __getitem__(self, skill: str) -> Tuple[Question, ...]:
+        if skill not in self._index:
+            raise KeyError(skill)
+        return tuple(self.load(handle) for handles in self.buckets(skill) for handle in handles)
+    
+    def items(self) -> Iterable[Tuple[str, Tuple[Question, ...]]]:
+        return ((skill, self[skill]) for skill in self._index)
+
+class InMemoryQuestionBank(QuestionBank):
+    """Question bank holding frozen Question records in memory"""
+    
+    def __init__(self, question_bank: Mapping[str, Iterable[Question]]):
+        super().__init__()
+        questions: List[Question] = []
+        by_skill: Dict[str, Tuple[Question, ...]] = {}
+        for skill, skill_questions in question_bank.items():
+            skill = sys.intern(skill)
+            frozen = tuple(_freeze_question(q) for q in skill_questions)
+            by_skill[skill] = frozen
+            keyed = self._index.setdefault(skill, {})
+            for question in frozen:
+                keyed.setdefault((question.difficulty, question.type), []).append(len(questions))
+                questions.append(question)
+        self._questions = tuple(questions)
+        self._by_skill = by_skill
+        self._by_id = {question.id: question for question in questions}
+        for keyed in self._index.values():
+            for key, handles in keyed.items():
+                keyed[key] = tuple(handles)
+    
+    def load(self, handle: int) -> Question:
+        return self._questions[handle]
+    
+    def find(self, question_id: str) -> Question:
+        return self._by_id[question_id]
+    
+    def __getitem__(self, skill: str) -> Tuple[Question, ...]:
+        return self._by_skill[skill]
+
+class CandidatePool:
+    """Candidate question handles of one skill, addressed by position without copying"""
+    __slots__ = ("skill", "buckets", "starts", "size")
+    
+    def __init__(self, skill: str, buckets: Iterable[Sequence[int]]):
+        self.skill = skill
+        self.buckets = [handles for handles in buckets if len(handles)]
+        self.starts = []
+        self.size = 0
+        for handles in self.buckets:
+            self.starts.append(self.size)
+            self.size += len(handles)
+    
+    def handle(self, position: int) -> int:
+        """Get the handle at a position in [0, size)"""
+        bucket = bisect_right(self.starts, position) - 1
+        return self.buckets[bucket][position - self.starts[bucket]]
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer"""
+    x = ((x ^ (x >> 30)) * _MIX_1) & _MASK64
+    x = ((x ^ (x >> 27)) * _MIX_2) & _MASK64
+    return x ^ (x >> 31)
+
+def _seed_key(seed) -> int:
+    """Map a seed (int, str or bytes) to a 64-bit stream key"""
+    if not isinstance(seed, int):
+        data = seed if isinstance(seed, bytes) else str(seed).encode("utf-8")
+        seed = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+    return _mix64(seed & _MASK64)
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+def to_micros(timestamp: datetime.datetime) -> int:
+    """Exact microseconds since the epoch of a naive (wall-clock) datetime"""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+def from_micros(micros: int) -> datetime.datetime:
+    """Inverse of to_micros"""
+    return _EPOCH + micros * _MICROSECOND
+
+_seed_source = random.SystemRandom()
+
+def new_seed() -> int:
+    """Get a fresh 64-bit seed from the OS entropy pool"""
+    return _seed_source.getrandbits(64)
+
+def stream_seed(seed, stream: str) -> int:
+    """Derive the seed of an independent named stream from a session seed"""
+    digest = hashlib.blake2b(f"{seed}:{stream}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+class CounterRandom(random.Random):
+    """Counter-based generator: the n-th draw is a pure function of (seed, n)
+
+    Because any draw can be computed without the ones before it, batches of
+    streams can be generated with NumPy and still match the scalar path.
+    """
+    
+    def __init__(self, seed=None):
+        super().__init__(seed)
+    
+    def seed(self, a=None, version=2) -> None:
+        if a is None:
+            a = new_seed()
+        self._key = _seed_key(a)
+        self.counter = 0
+        self.gauss_next = None
+    
+    def _next64(self) -> int:
+        self.counter += 1
+        return _mix64((self._key + self.counter * _GOLDEN_GAMMA) & _MASK64)
+    
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+    
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next64() << shift
+        return bits & ((1 << k) - 1)
+    
+    def getstate(self):
+        return (self._key, self.counter, self.gauss_next)
+    
+    def setstate(self, state) -> None:
+        self._key, self.counter, self.gauss_next = state
+
+def _counter_uniforms(keys, start: int, count: int):
+    """Vectorized CounterRandom.random(): draws start+1..start+count of each stream key"""
+    counters = np.arange(start + 1, start + count + 1, dtype=np.uint64) * np.uint64(_GOLDEN_GAMMA)
+    x = keys[:, None] + counters[None, :]
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(_MIX_1)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(_MIX_2)
+    x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+def _draw_index(draw, n: int) -> int:
+    """Draw an index in [0, n)"""
+    return min(int(draw() * n), n - 1)
+
+# Redraws allowed when a pick falls in an already picked near-duplicate cluster
+MAX_CLUSTER_REDRAWS = 32
+
+def _sample_handles(pools: List[CandidatePool], num_selected_skills: int, count: int,
+                    draw, clusters: Optional[Mapping[int, int]] = None) -> List[int]:
+    """Sample up to count distinct handles, drawing only O(count) random numbers
+
+    Follows the diversity rule of a shuffled scan over all candidates: every
+    skill with candidates is covered once, in the order its first question
+    would appear in a random permutation (weighted by pool size), and repeats
+    are only allowed once all selected skills are covered. ``draw`` returns
+    floats in [0, 1). ``clusters`` maps near-duplicate handles to their
+    cluster; a pick in an already picked cluster is redrawn.
+    """
+    total = sum(pool.size for pool in pools)
+    count = min(count, total)
+    order: List[int] = []
+    
+    # Skill order: weighted sampling without replacement by pool size
+    remaining = list(range(len(pools)))
+    remaining_total = total
+    while remaining and len(order) < count:
+        target = _draw_index(draw, remaining_total)
+        for i, pool_index in enumerate(remaining):
+            size = pools[pool_index].size
+            if target < size:
+                break
+            target -= size
+        del remaining[i]
+        remaining_total -= size
+        order.append(pool_index)
+    
+    # One uniformly chosen question per covered skill
+    if clusters:
+        picked = []
+        seen_clusters = set()
+        for pool_index in order:
+            pool = pools[pool_index]
+            position = _draw_index(draw, pool.size)
+            cluster = clusters.get(pool.handle(position))
+            for _ in range(MAX_CLUSTER_REDRAWS):
+                if cluster is None or cluster not in seen_clusters:
+                    break
+                position = _draw_index(draw, pool.size)
+                cluster = clusters.get(pool.handle(position))
+            seen_clusters.add(cluster)
+            picked.append((pool_index, position))
+    else:
+        picked = [(pool_index, _draw_index(draw, pools[pool_index].size)) for pool_index in order]
+    
+    if len(pools) >= num_selected_skills:
+        _fill_picks(pools, picked, count, draw, clusters)
+    return [pools[pool_index].handle(position) for pool_index, position in picked]
+
+def _fill_picks(pools: List[CandidatePool], picked: List[Tuple[int, int]], count: int, draw,
+                clusters: Optional[Mapping[int, int]] = None) -> None:
+    """Once every selected skill is covered, fill uniformly from the remaining candidates"""
+    if len(picked) >= count:
+        return
+    pool_starts = []
+    total = 0
+    for pool in pools:
+        pool_starts.append(total)
+        total += pool.size
+    seen = set(picked)
+    if clusters:
+        seen_clusters = {clusters.get(pools[pool_index].handle(position)) for pool_index, position in picked}
+        seen_clusters.discard(None)
+        redraws = 0
+    while len(picked) < count:
+        target = _draw_index(draw, total)
+        pool_index = bisect_right(pool_starts, target) - 1
+        key = (pool_index, target - pool_starts[pool_index])
+        if key in seen:
+            continue
+        if clusters:
+            cluster = clusters.get(pools[pool_index].handle(key[1]))
+            if cluster is not None:
+                # Give up on cluster diversity once the remaining picks keep colliding
+                if cluster in seen_clusters and redraws < MAX_CLUSTER_REDRAWS:
+                    redraws += 1
+                    continue
+                seen_clusters.add(cluster)
+            redraws = 0
+        seen.add(key)
+        picked.append(key)
+
+def _sample_handles_batch(pools: List[CandidatePool], num_selected_skills: int, count: int,
+                          seeds: Sequence, clusters: Optional[Mapping[int, int]] = None) -> List[List[int]]:
+    """Vectorized _sample_handles for many seeds, identical to CounterRandom(seed) per seed"""
+    n = len(seeds)
+    sizes = np.array([pool.size for pool in pools], dtype=np.int64)
+    count = min(count, int(sizes.sum()))
+    covered = min(count, len(pools))
+    can_fill = len(pools) >= num_selected_skills
+    fill_draws = 2 * (count - covered) if can_fill else 0
+    keys = np.array([_seed_key(seed) for seed in seeds], dtype=np.uint64)
+    draws = _counter_uniforms(keys, 0, 2 * covered + fill_draws)
+    
+    # Skill order, one weighted draw per step across all sessions at once
+    rows = np.arange(n)
+    remaining = np.ones((n, len(pools)), dtype=bool)
+    remaining_total = np.full(n, sizes.sum(), dtype=np.int64)
+    order = np.empty((n, covered), dtype=np.int64)
+    for step in range(covered):
+        target = np.minimum(np.floor(draws[:, step] * remaining_total), remaining_total - 1)
+        cumulative = np.cumsum(np.where(remaining, sizes, 0), axis=1)
+        chosen = np.argmax(cumulative > target[:, None], axis=1)
+        order[:, step] = chosen
+        remaining[rows, chosen] = False
+        remaining_total -= sizes[chosen]
+    
+    order_sizes = sizes[order]
+    positions = np.minimum(np.floor(draws[:, covered:2 * covered] * order_sizes), order_sizes - 1).astype(np.int64)
+    
+    results = []
+    for row in range(n):
+        picked = list(zip(order[row].tolist(), positions[row].tolist()))
+        if can_fill and covered < count:
+            _fill_picks(pools, picked, count, _continued_draw(draws[row, 2 * covered:].tolist(), seeds[row], 2 * covered))
+        handles = [pools[pool_index].handle(position) for pool_index, position in picked]
+        if clusters and _has_cluster_repeat(handles, clusters):
+            # Redraws would have changed this selection, so replay it exactly
+            handles = _sample_handles(pools, num_selected_skills, count, CounterRandom(seeds[row]).random, clusters)
+        results.append(handles)
+    return results
+
+def _has_cluster_repeat(handles: List[int], clusters: Mapping[int, int]) -> bool:
+    seen = set()
+    for handle in handles:
+        cluster = clusters.get(handle)
+        if cluster is not None:
+            if cluster in seen:
+                return True
+            seen.add(cluster)
+    return False
+
+def _continued_draw(values: List[float], seed, start: int):
+    """Replay precomputed draws of a stream, then continue it with CounterRandom"""
+    iterator = iter(values)
+    rng = CounterRandom(seed)
+    rng.counter = start + len(values)
+    
+    def draw() -> float:
+        value = next(iterator, None)
+        return rng.random() if value is None else value
+    return draw
+
+# Adaptive sessions: a Rasch (one-parameter IRT) model with an Elo-style
+# update. The chance of a good answer to an item of difficulty b is
+# 1 / (1 + exp(b - ability)), and each answer's quality in [0, 1] moves the
+# ability by ABILITY_STEP times the surprise.
+ITEM_DIFFICULTY = {Difficulty.EASY: -1.0, Difficulty.MEDIUM: 0.0, Difficulty.HARD: 1.0}
+ABILITY_STEP = 1.0
+
+def expected_outcome(ability: float, difficulty: Difficulty) -> float:
+    """Expected answer quality for a question of a difficulty"""
+    return 1.0 / (1.0 + math.exp(ITEM_DIFFICULTY[difficulty] - ability))
+
+def update_ability(ability: float, difficulty: Difficulty, outcome: float) -> float:
+    """Ability estimate after an answer of quality outcome, in O(1)"""
+    return ability + ABILITY_STEP * (outcome - expected_outcome(ability, difficulty))
+
+def difficulties_by_information(ability: float) -> List[Difficulty]:
+    """Difficulties ordered by how much an answer tells at an ability (closest item difficulty first)"""
+    return sorted(ITEM_DIFFICULTY, key=lambda difficulty: (abs(ITEM_DIFFICULTY[difficulty] - ability),
+                                                            ITEM_DIFFICULTY[difficulty]))
+
+class AdaptiveState:
+    """Ability estimate of an adaptive session and what it has asked"""
+    __slots__ = ("ability", "total", "clusters")
+    
+    def __init__(self, total: int):
+        self.ability = 0.0
+        self.total = total  # questions the session will ask
+        self.clusters: Set[int] = set()  # near-duplicate clusters asked
+
+@dataclass(frozen=True)
+class QuestionRegistry:
+    """Read-only snapshot of domains and questions shared by every session"""
+    version: int
+    domains: Tuple[InterviewDomain, ...]
+    question_bank: QuestionBank
+    # Near-duplicate question handle -> its cluster's representative handle
+    duplicates: Mapping[int, int] = field(default_factory=dict)
+
+def build_registry(domains: Iterable[InterviewDomain],
+                   question_bank: Union[QuestionBank, Mapping[str, Iterable[Question]]],
+                   version: int = 1, detect_duplicates: bool = False,
+                   duplicate_threshold: Optional[float] = None) -> QuestionRegistry:
+    """Build an immutable registry from domains and a question bank
+
+    The bank may be a QuestionBank (used as-is) or a skill -> questions mapping.
+    With detect_duplicates, near-duplicate questions are clustered (see
+    near_duplicates.py) and question selection treats each cluster as one question.
+    """
+    if not isinstance(question_bank, QuestionBank):
+        question_bank = InMemoryQuestionBank(question_bank)
+    duplicates: Mapping[int, int] = {}
+    if detect_duplicates:
+        # Imported lazily: near_duplicates imports this module
+        from near_duplicates import DEFAULT_THRESHOLD, find_duplicates
+        duplicates = find_duplicates(question_bank, DEFAULT_THRESHOLD if duplicate_threshold is None
+                                     else duplicate_threshold)
+    return QuestionRegistry(
+        version=version,
+        domains=tuple(_freeze_domain(d) for d in domains),
+        question_bank=question_bank,
+        duplicates=duplicates
+    )
+
+_registry: Optional[QuestionRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_registry() -> QuestionRegistry:
+    """Get the process-wide registry, building the built-in bank on first use"""
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _publish_registry(build_registry(_initialize_domains(), _initialize_question_bank()))
+            registry = _registry
+    return registry
+
+def reload_registry(domains: Optional[Iterable[InterviewDomain]] = None,
+                    question_bank: Optional[Union[QuestionBank, Mapping[str, Iterable[Question]]]] = None,
+                    detect_duplicates: bool = False,
+                    duplicate_threshold: Optional[float] = None) -> QuestionRegistry:
+    """Atomically replace the process-wide registry and bump its version
+
+    Sessions created before the reload keep the questions they already
+    selected; new sessions see the new snapshot. A reused bank keeps its
+    detected duplicates unless detect_duplicates asks to detect them again
+    (at duplicate_threshold, see build_registry).
+    """
+    with _registry_lock:
+        current = _registry
+        registry = build_registry(
+            domains if domains is not None else (current.domains if current else _initialize_domains()),
+            question_bank if question_bank is not None else (current.question_bank if current else _initialize_question_bank()),
+            version=(current.version + 1) if current else 1,
+            detect_duplicates=detect_duplicates,
+            duplicate_threshold=duplicate_threshold
+        )
+        if question_bank is None and current is not None and current.duplicates and not detect_duplicates:
+            registry = replace(registry, duplicates=current.duplicates)
+        _publish_registry(registry)
+    return registry
+
+def _publish_registry(registry: QuestionRegistry) -> None:
+    global _registry
+    _registry = registry
+
+# Feedback text depends only on a few thresholds of its inputs, so each
+# input is mapped to a representative value of its bucket and the text for
+# every bucket combination is built once and shared.
+FEEDBACK_TEMPLATE_CACHE_SIZE = 4096
+_SCORE_BUCKETS = (0, 55, 65, 70, 75, 80, 85)
+
+def _score_bucket(score: int) -> int:
+    """Lowest score of the bucket holding score"""
+    return _SCORE_BUCKETS[max(0, bisect_right(_SCORE_BUCKETS, score) - 1)]
+
+def _length_bucket(avg_length: float) -> float:
+    """Representative average length with the same feedback thresholds as avg_length"""
+    if avg_length < 150:
+        return 0
+    if avg_length < 200:
+        return 150
+    if avg_length == 200:
+        return 200
+    if avg_length <= 300:
+        return 250
+    return 301
+
+def _answer_count_bucket(num_answers: int) -> int:
+    """Representative answer count with the same feedback thresholds as num_answers"""
+    if num_answers < 3:
+        return num_answers
+    return 3 if num_answers < 5 else 5
+
+def _interned(texts: List[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(text) for text in texts)
+
+@lru_cache(maxsize=FEEDBACK_TEMPLATE_CACHE_SIZE)
+def _skill_feedback_template(skill: str, score: int) -> str:
+    """Skill feedback text for a score bucket"""
+    if score >= 80:
+        return sys.intern(f"Excellent demonstration of {skill} knowledge with clear examples and deep understanding.")
+    elif score >= 65:
+        return sys.intern(f"Good grasp of {skill} concepts with room for more specific examples and technical depth.")
+    else:
+        return sys.intern(f"Basic understanding of {skill} shown. Focus on building more hands-on experience and specific examples.")
+
+@lru_cache(maxsize=FEEDBACK_TEMPLATE_CACHE_SIZE)
+def _strengths_template(score: int, domain_title: str, follow_ups: int,
+                        avg_length: float, num_answers: int) -> Tuple[str, ...]:
+    """Strengths for a (score, domain, follow-ups, length, answer count) bucket"""
+    strengths = []
+    
+    if avg_length > 200:
+        strengths.append("Provided detailed and comprehensive answers")
+    
+    if follow_ups > 0:
+        strengths.append("Engaged well with follow-up questions, showing depth of knowledge")
+    
+    if score >= 75:
+        strengths.append(f"Demonstrated strong understanding of {domain_title} concepts")
+    
+    if num_answers >= 3:
+        strengths.append("Maintained professional communication throughout the interview")
+    
+    if avg_length > 300:
+        strengths.append("Showed ability to elaborate on complex topics with specific examples")
+    
+    if num_answers < 5:
+        strengths.append("Made efficient use of time by providing focused answers")
+    
+    return _interned(strengths[:4])
+
+@lru_cache(maxsize=FEEDBACK_TEMPLATE_CACHE_SIZE)
+def _improvements_template(score: int, avg_length: float, num_answers: int) -> Tuple[str, ...]:
+    """Improvements for a (score, length, answer count) bucket"""
+    improvements = []
+    
+    if avg_length < 150:
+        improvements.append("Provide more detailed explanations with specific examples")
+    
+    if score < 70:
+        improvements.append("Deepen technical knowledge in core areas")
+    
+    if num_answers < 5:
+        improvements.append("Consider completing more questions for comprehensive evaluation")
+    
+    improvements.append("Consider using the STAR method (Situation, Task, Action, Result) for behavioral questions")
+    
+    if avg_length < 200:
+        improvements.append("Include quantifiable results and metrics in your examples")
+    
+    improvements.append("Practice explaining complex concepts in simpler terms")
+    
+    return _interned(improvements[:3])
+
+@lru_cache(maxsize=FEEDBACK_TEMPLATE_CACHE_SIZE)
+def _overall_feedback_template(score: int, domain_title: str, follow_ups: int,
+                               avg_length: float, num_answers: int) -> str:
+    """Overall feedback for a (score, domain, follow-ups, length) bucket and answer count"""
+    completion_note = f" You completed {num_answers} questions" + (
+        " - consider completing more questions next time for a more comprehensive evaluation." 
+        if num_answers < 5 else " which provided a good assessment of your skills."
+    )
+    
+    if score >= 85:
+        return sys.intern(f"Excellent performance! You demonstrated strong expertise in {domain_title} with detailed, well-structured answers.{completion_note} {'Your engagement with follow-up questions showed impressive depth of knowledge. ' if follow_ups > 0 else ''}You're well-prepared for interviews in this domain.")
+    elif score >= 70:
+        return sys.intern(f"Good job! You showed solid understanding of {domain_title} concepts and provided thoughtful answers.{completion_note} {'Your detailed responses demonstrate good preparation. ' if avg_length > 200 else ''}With some additional practice on specific examples and technical depth, you'll be very competitive.")
+    elif score >= 55:
+        return sys.intern(f"You're on the right track! You have a foundation in {domain_title}, but there's room for improvement.{completion_note} Focus on providing more detailed examples and deepening your technical knowledge. {'Try to engage more with follow-up questions to show your thinking process. ' if follow_ups == 0 else ''}Keep practicing!")
+    else:
+        return sys.intern(f"This interview highlighted areas for growth in {domain_title}.{completion_note} Focus on building stronger foundational knowledge and preparing specific examples from your experience. Consider additional study and practice before your next interview.")
+
+@lru_cache(maxsize=FEEDBACK_TEMPLATE_CACHE_SIZE)
+def _next_steps_template(domain_id: str, skills: Tuple[str, ...], score: int) -> Tuple[str, ...]:
+    """Next steps for a (domain, leading skills, score) bucket"""
+    steps = []
+    
+    if score < 70:
+        steps.append(f"Review fundamental concepts in {skills[0]} and {skills[1] if len(skills) > 1 else 'core areas'}")
+    
+    steps.append("Practice more behavioral questions using structured frameworks")
+    steps.append("Prepare 3-5 detailed examples from your experience for different question types")
+    
+    if domain_id == "software-engineer":
+        steps.append("Practice coding problems and system design scenarios")
+    elif domain_id == "data-scientist":
+        steps.append("Work on explaining statistical concepts and ML algorithms clearly")
+    elif domain_id == "product-manager":
+        steps.append("Develop case studies showing product thinking and user empathy")
+    
+    steps.append("Record yourself answering questions to improve delivery and confidence")
+    steps.append("Try completing a full interview session for more comprehensive feedback")
+    
+    return _interned(steps[:5])
+
+def template_cache_info() -> Dict[str, Tuple[int, int, int, int]]:
+    """lru_cache statistics (hits, misses, maxsize, currsize) of each feedback template"""
+    return {
+        "skill_feedback": _skill_feedback_template.cache_info(),
+        "strengths": _strengths_template.cache_info(),
+        "improvements": _improvements_template.cache_info(),
+        "overall_feedback": _overall_feedback_template.cache_info(),
+        "next_steps": _next_steps_template.cache_info(),
+    }
+
+# Scoring rules, shared by the scalar scorer and the batch scorer.
+# Bump SCORING_VERSION whenever they change the feedback of a session, so
+# cached feedback is invalidated.
+SCORING_VERSION = 2
+BASE_SCORE = 50
+LENGTH_BONUSES = ((150, 15), (250, 10), (350, 5))  # (average length above, bonus)
+COMPLETION_BONUSES = ((5, 10), (8, 5))  # (answers at least, bonus)
+FOLLOW_UP_BONUS = 3
+FOLLOW_UP_BONUS_CAP = 15
+EARLY_END_RATIO = 0.5
+EARLY_END_PENALTY = 10
+MAX_SCORE = 100
+SKILL_JITTER = 10
+SKILL_SCORE_FLOOR = 40
+
+def completion_ratio(num_answers: int, num_skills: int) -> float:
+    """Rough share of the expected answers that were given"""
+    return num_answers / max(1, num_skills * 2)
+
+def score_metrics(num_answers: int, avg_length: float, total_follow_ups: int, num_skills: int) -> int:
+    """Score a non-empty set of answers from its metrics"""
+    score = BASE_SCORE
+    
+    # Answer quality scoring
+    for threshold, bonus in LENGTH_BONUSES:
+        if avg_length > threshold:
+            score += bonus
+    
+    # Completion bonus
+    for threshold, bonus in COMPLETION_BONUSES:
+        if num_answers >= threshold:
+            score += bonus
+    
+    # Follow-up engagement bonus
+    if total_follow_ups > 0:
+        score += min(total_follow_ups * FOLLOW_UP_BONUS, FOLLOW_UP_BONUS_CAP)
+    
+    # Early completion penalty (if ended early)
+    if completion_ratio(num_answers, num_skills) < EARLY_END_RATIO:
+        score -= EARLY_END_PENALTY
+    
+    # Cap at 100
+    return min(score, MAX_SCORE)
+
+def skill_scores(score: int, num_skills: int, draw,
+                 adjustments: Sequence[Optional[int]] = ()) -> List[int]:
+    """Derive one score per skill from the overall score
+    
+    A skill with an adjustment from answer analysis (see answer_analysis)
+    scores the overall score plus its adjustment; without one it falls back
+    to random jitter. One draw is made per skill either way, so the stream
+    stays aligned.
+    """
+    scores = []
+    for i in range(num_skills):
+        jitter = _draw_index(draw, 2 * SKILL_JITTER + 1) - SKILL_JITTER
+        adjustment = adjustments[i] if i < len(adjustments) else None
+        if adjustment is None:
+            scores.append(max(SKILL_SCORE_FLOOR, score + jitter))
+        else:
+            scores.append(max(SKILL_SCORE_FLOOR, min(MAX_SCORE, score + adjustment)))
+    return scores
+
+class MockInterviewAI:
+    def __init__(self, registry: Optional[QuestionRegistry] = None, feedback_cache=None):
+        # A pinned registry ignores reloads; by default follow the shared one
+        self._registry = registry
+        # Optional feedback_cache.FeedbackCache consulted by InterviewSession.generate_feedback
+        self.feedback_cache = feedback_cache
+        self.current_session = None
+    
+    @property
+    def registry(self) -> QuestionRegistry:
+        return self._registry or get_registry()
+    
+    @property
+    def analyzer(self):
+        """The shared answer_analysis.AnswerAnalyzer of the current question bank"""
+        from answer_analysis import analyzer_for
+        return analyzer_for(self.question_bank)
+    
+    @property
+    def follow_up_index(self):
+        """The shared follow_up_index.FollowUpIndex of the current question bank"""
+        from follow_up_index import follow_up_index_for
+        return follow_up_index_for(self.question_bank)
+    
+    @property
+    def domains(self) -> List[InterviewDomain]:
+        return list(self.registry.domains)
+    
+    @property
+    def question_bank(self) -> QuestionBank:
+        return self.registry.question_bank
     
     def get_domains(self) -> List[InterviewDomain]:
         """Get all available interview domains"""
         return self.domains
     
+    def get_domain(self, domain_id: str) -> InterviewDomain:
+        """Get a domain by id"""
+        for domain in self.registry.domains:
+            if domain.id == domain_id:
+                return domain
+        raise KeyError(domain_id)
+    
+    def find_question(self, question_id: str) -> Question:
+        """Get a question of the bank by id"""
+        return self.question_bank.find(question_id)
+    
     def generate_questions(self, domain: InterviewDomain, selected_skills: List[str], 
-                          settings: InterviewSettings) -> List[Question]:
-        """Generate questions based on domain, skills, and settings"""
-        available_questions = []
-        
-        # Collect questions for selected skills
-        for skill in selected_skills:
-            if skill in self.question_bank:
-                available_questions.extend(self.question_bank[skill])
-        
-        # Filter by difficulty if not mixed
-        if settings.difficulty != Difficulty.MIXED:
-            available_questions = [q for q in available_questions if q.difficulty == settings.difficulty]
+                          settings: InterviewSettings, seed=None,
+                          rng: Optional[random.Random] = None) -> List[Question]:
+        """Generate questions based on domain, skills, and settings
+
+        Pass a seed for a reproducible selection (the same one
+        generate_questions_batch makes), or an rng to draw from.
+        """
+        difficulty = None if settings.difficulty == Difficulty.MIXED else settings.difficulty
+        pools = self._candidate_pools(selected_skills, difficulty)
+        if rng is None:
+            rng = random if seed is None else CounterRandom(seed)
+        draw = rng.random
+        handles = _sample_handles(pools, len(selected_skills), settings.number_of_questions, draw,
+                                  self.registry.duplicates or None)
         
-        # Shuffle and select required number of questions
-        random.shuffle(available_questions)
+        # Only the selected questions are ever built
+        question_bank = self.question_bank
+        return [question_bank.load(handle) for handle in handles]
+    
+    def generate_questions_batch(self, domain: InterviewDomain, selected_skills: List[str],
+                                 settings: InterviewSettings, n: int,
+                                 seeds: Optional[Sequence] = None) -> List[List[Question]]:
+        """Generate n question lists at once
+
+        The candidate pool is filtered once and sampling is vectorized with
+        NumPy when available. Each list equals generate_questions(..., seed=seeds[i]).
+        """
+        if seeds is None:
+            seeds = [random.getrandbits(64) for _ in range(n)]
+        elif len(seeds) != n:
+            raise ValueError(f"Expected {n} seeds, got {len(seeds)}")
         
-        # Ensure diversity in skills and question types
-        selected_questions = []
-        used_skills = set()
+        difficulty = None if settings.difficulty == Difficulty.MIXED else settings.difficulty
+        pools = self._candidate_pools(selected_skills, difficulty)
+        count = settings.number_of_questions
+        clusters = self.registry.duplicates or None
+        if np is not None and pools and n:
+            handle_lists = _sample_handles_batch(pools, len(selected_skills), count, seeds, clusters)
+        else:
+            handle_lists = [
+                _sample_handles(pools, len(selected_skills), count, CounterRandom(seed).random, clusters)
+                for seed in seeds
+            ]
         
-        for question in available_questions:
-            if len(selected_questions) >= settings.number_of_questions:
-                break
-            
-            # Prefer questions from skills we haven't covered yet
-            if question.skill not in used_skills or len(used_skills) >= len(selected_skills):
-                selected_questions.append(question)
-                used_skills.add(question.skill)
+        # Each selected question is built once and shared across the batch
+        question_bank = self.question_bank
+        loaded: Dict[int, Question] = {}
+        batch = []
+        for handles in handle_lists:
+            questions = []
+            for handle in handles:
+                question = loaded.get(handle)
+                if question is None:
+                    question = loaded[handle] = question_bank.load(handle)
+                questions.append(question)
+            batch.append(questions)
+        return batch
+    
+    def resolve_questions(self, domain: InterviewDomain, selected_skills: List[str],
+                          settings: InterviewSettings, seed: int, question_ids: Sequence[str]) -> List[Question]:
+        """Find a saved session's questions by id
+
+        Reselects them from the seed when the bank is unchanged, and looks
+        each id up with find_question otherwise (always for adaptive
+        sessions, whose questions depend on their answers), so only the
+        session's own questions are loaded. Raises KeyError for an id the
+        bank no longer has.
+        """
+        if not question_ids:
+            return []
+        if not settings.adaptive:
+            questions = self.generate_questions(domain, selected_skills, settings, seed=seed)
+            if [question.id for question in questions] == list(question_ids):
+                return questions
+        return [self.find_question(question_id) for question_id in question_ids]
+    
+    def count_candidates(self, selected_skills: List[str], settings: InterviewSettings) -> int:
+        """Number of questions a session with these skills and settings can be asked"""
+        difficulty = None if settings.difficulty == Difficulty.MIXED else settings.difficulty
+        return min(settings.number_of_questions,
+                   sum(pool.size for pool in self._candidate_pools(selected_skills, difficulty)))
+    
+    def select_next_question(self, selected_skills: List[str], settings: InterviewSettings,
+                             asked: Sequence[Question], skill_counts: Mapping[str, int], ability: float,
+                             seed, asked_clusters: Set[int] = frozenset()) -> Optional[Tuple[Question, Optional[int]]]:
+        """Pick the next question of an adaptive session
+
+        The skill is the least asked selected skill (ties drawn at random) and
+        the difficulty the one closest to the ability estimate, where an answer
+        tells most about the candidate; a used-up pool falls back to the next
+        closest difficulty, then to the next skill. Returns the question and
+        its near-duplicate cluster, or None when no candidate is left.
+        """
+        rng = CounterRandom(seed)
+        question_bank = self.question_bank
+        clusters = self.registry.duplicates
+        asked_ids = {question.id for question in asked}
+        tie_breaks = {skill: rng.random() for skill in dict.fromkeys(selected_skills)}
+        skills = sorted(tie_breaks, key=lambda skill: (skill_counts.get(skill, 0), tie_breaks[skill]))
+        if settings.difficulty == Difficulty.MIXED:
+            difficulties = difficulties_by_information(ability)
+        else:
+            difficulties = [settings.difficulty]
         
-        return selected_questions[:settings.number_of_questions]
+        for skill in skills:
+            for difficulty in difficulties:
+                pool = CandidatePool(skill, question_bank.buckets(skill, difficulty))
+                if not pool.size:
+                    continue
+                # Random draws, avoiding asked questions and clusters, then a scan for any unasked question
+                for _ in range(MAX_CLUSTER_REDRAWS):
+                    handle = pool.handle(_draw_index(rng.random, pool.size))
+                    cluster = clusters.get(handle)
+                    if cluster is None or cluster not in asked_clusters:
+                        question = question_bank.load(handle)
+                        if question.id not in asked_ids:
+                            return question, cluster
+                for position in range(pool.size):
+                    handle = pool.handle(position)
+                    question = question_bank.load(handle)
+                    if question.id not in asked_ids:
+                        return question, clusters.get(handle)
+        return None
+    
+    def _candidate_pools(self, selected_skills: List[str],
+                         difficulty: Optional[Difficulty]) -> List["CandidatePool"]:
+        """Get the non-empty candidate pool of each selected skill, filtered by difficulty if given"""
+        question_bank = self.question_bank
+        pools = []
+        for skill in dict.fromkeys(selected_skills):
+            pool = CandidatePool(skill, question_bank.buckets(skill, difficulty))
+            if pool.size:
+                pools.append(pool)
+        return pools
     
-    def get_follow_up_questions(self, question: Question, include_follow_ups: bool) -> List[str]:
-        """Get follow-up questions for a given question"""
+    def get_follow_up_questions(self, question: Question, include_follow_ups: bool,
+                                rng: Optional[random.Random] = None, answer_text: Optional[str] = None,
+                                strategy: str = "most_relevant") -> List[str]:
+        """Get follow-up questions for a given question
+        
+        With the candidate's answer_text, the follow-ups are ranked by their
+        similarity to it (see follow_up_index): "most_relevant" picks the
+        closest ones, "least_covered" the ones the answer touched least.
+        Without it they are sampled at random.
+        """
         if not include_follow_ups or not question.follow_ups:
             return []
+        rng = rng or random
         
-        # Randomly select 1-2 follow-up questions
-        num_follow_ups = min(random.randint(1, 2), len(question.follow_ups))
-        return random.sample(question.follow_ups, num_follow_ups)
+        # Select 1-2 follow-up questions
+        num_follow_ups = min(rng.randint(1, 2), len(question.follow_ups))
+        if answer_text is None:
+            return rng.sample(question.follow_ups, num_follow_ups)
+        return self.follow_up_index.rank(answer_text, question.follow_ups, num_follow_ups, strategy)
     
     def generate_feedback(self, answers: List[Answer], domain: InterviewDomain, 
-                         selected_skills: List[str]) -> Feedback:
+                         selected_skills: List[str], rng: Optional[random.Random] = None) -> Feedback:
         """Generate comprehensive feedback based on answers"""
-        if not answers:
+        from answer_analysis import skill_adjustments
+        
+        # Calculate metrics
+        length_sum = sum(len(answer.text) for answer in answers)
+        total_follow_ups = sum(len(answer.follow_ups) for answer in answers)
+        adjustments = skill_adjustments(self.analyzer, answers, selected_skills)
+        return self.feedback_from_metrics(len(answers), length_sum, total_follow_ups,
+                                          domain, selected_skills, rng, adjustments)
+    
+    def feedback_from_summary(self, summary: SessionSummary) -> Feedback:
+        """Generate the feedback of a summarized session, as InterviewSession.generate_feedback would"""
+        rng = CounterRandom(stream_seed(summary.seed, "feedback"))
+        return self.feedback_from_metrics(summary.num_answers, summary.length_sum, summary.total_follow_ups,
+                                          self.get_domain(summary.domain_id), list(summary.skills), rng,
+                                          summary.skill_adjustments)
+    
+    def feedback_from_metrics(self, num_answers: int, length_sum: int, total_follow_ups: int,
+                              domain: InterviewDomain, selected_skills: List[str],
+                              rng: Optional[random.Random] = None,
+                              skill_adjustments: Sequence[Optional[int]] = ()) -> Feedback:
+        """Generate feedback from answer metrics (count, total length, follow-up count)
+        
+        skill_adjustments come from answer analysis, one per selected skill;
+        skills without one get random jitter instead.
+        """
+        if not num_answers:
             return Feedback(
                 score=0,
-                strengths=[],
-                improvements=["Complete the interview to receive feedback"],
+                strengths=(),
+                improvements=("Complete the interview to receive feedback",),
                 overall_feedback="No answers provided",
-                next_steps=["Start the interview"],
-                skill_breakdown=[]
+                next_steps=("Start the interview",),
+                skill_breakdown=()
             )
         
-        # Calculate metrics
-        answer_lengths = [len(answer.text) for answer in answers]
-        avg_length = sum(answer_lengths) / len(answer_lengths)
-        total_follow_ups = sum(len(answer.follow_up_answers) for answer in answers)
-        
-        # Base scoring algorithm
-        score = 50  # Base score
-        
-        # Answer quality scoring
-        if avg_length > 150:
-            score += 15
-        if avg_length > 250:
-            score += 10
-        if avg_length > 350:
-            score += 5
-        
-        # Completion bonus
-        if len(answers) >= 5:
-            score += 10
-        if len(answers) >= 8:
-            score += 5
-        
-        # Follow-up engagement bonus
-        if total_follow_ups > 0:
-            score += min(total_follow_ups * 3, 15)
-        
-        # Early completion penalty (if ended early)
-        completion_ratio = len(answers) / max(1, len(selected_skills) * 2)  # Rough estimate
-        if completion_ratio < 0.5:
-            score -= 10
-            
-        # Cap at 100
-        score = min(score, 100)
-        
-        # Generate skill breakdown
-        skill_breakdown = []
-        for skill in selected_skills:
-            skill_score = max(40, score + random.randint(-10, 10))
-            skill_breakdown.append(SkillFeedback(
+        avg_length = length_sum / num_answers
+        score = score_metrics(num_answers, avg_length, total_follow_ups, len(selected_skills))
+        per_skill = skill_scores(score, len(selected_skills), (rng or random).random, skill_adjustments)
+        return self.compose_feedback(score, per_skill, num_answers, avg_length, total_follow_ups,
+                                     domain, selected_skills)
+    
+    def compose_feedback(self, score: int, per_skill_scores: Sequence[int], num_answers: int,
+                         avg_length: float, total_follow_ups: int, domain: InterviewDomain,
+                         selected_skills: List[str]) -> Feedback:
+        """Build the Feedback text around already computed scores"""
+        skill_breakdown = tuple(
+            SkillFeedback(
                 skill=skill,
                 score=skill_score,
                 feedback=self._generate_skill_feedback(skill, skill_score)
-            ))
+            )
+            for skill, skill_score in zip(selected_skills, per_skill_scores)
+        )
         
         return Feedback(
             score=score,
-            strengths=self._generate_strengths(score, domain, total_follow_ups, avg_length, len(answers)),
-            improvements=self._generate_improvements(score, domain, avg_length, len(answers)),
-            overall_feedback=self._generate_overall_feedback(score, domain, total_follow_ups, avg_length, len(answers)),
+            strengths=self._generate_strengths(score, domain, total_follow_ups, avg_length, num_answers),
+            improvements=self._generate_improvements(score, domain, avg_length, num_answers),
+            overall_feedback=self._generate_overall_feedback(score, domain, total_follow_ups, avg_length, num_answers),
             next_steps=self._generate_next_steps(domain, selected_skills, score),
             skill_breakdown=skill_breakdown
         )
     
     def _generate_skill_feedback(self, skill: str, score: int) -> str:
         """Generate feedback for a specific skill"""
-        if score >= 80:
-            return f"Excellent demonstration of {skill} knowledge with clear examples and deep understanding."
-        elif score >= 65:
-            return f"Good grasp of {skill} concepts with room for more specific examples and technical depth."
-        else:
-            return f"Basic understanding of {skill} shown. Focus on building more hands-on experience and specific examples."
+        return _skill_feedback_template(skill, _score_bucket(score))
     
     def _generate_strengths(self, score: int, domain: InterviewDomain, 
-                           follow_ups: int, avg_length: float, num_answers: int) -> List[str]:
+                           follow_ups: int, avg_length: float, num_answers: int) -> Tuple[str, ...]:
         """Generate list of strengths"""
-        strengths = []
-        
-        if avg_length > 200:
-            strengths.append("Provided detailed and comprehensive answers")
-        
-        if follow_ups > 0:
-            strengths.append("Engaged well with follow-up questions, showing depth of knowledge")
-        
-        if score >= 75:
-            strengths.append(f"Demonstrated strong understanding of {domain.title} concepts")
-        
-        if num_answers >= 3:
-            strengths.append("Maintained professional communication throughout the interview")
-        
-        if avg_length > 300:
-            strengths.append("Showed ability to elaborate on complex topics with specific examples")
-        
-        if num_answers < 5:
-            strengths.append("Made efficient use of time by providing focused answers")
-        
-        return strengths[:4]
+        return _strengths_template(_score_bucket(score), domain.title, min(follow_ups, 1),
+                                   _length_bucket(avg_length), _answer_count_bucket(num_answers))
     
     def _generate_improvements(self, score: int, domain: InterviewDomain, 
-                              avg_length: float, num_answers: int) -> List[str]:
+                              avg_length: float, num_answers: int) -> Tuple[str, ...]:
         """Generate list of improvements"""
-        improvements = []
-        
-        if avg_length < 150:
-            improvements.append("Provide more detailed explanations with specific examples")
-        
-        if score < 70:
-            improvements.append("Deepen technical knowledge in core areas")
-        
-        if num_answers < 5:
-            improvements.append("Consider completing more questions for comprehensive evaluation")
-        
-        improvements.append("Consider using the STAR method (Situation, Task, Action, Result) for behavioral questions")
-        
-        if avg_length < 200:
-            improvements.append("Include quantifiable results and metrics in your examples")
-        
-        improvements.append("Practice explaining complex concepts in simpler terms")
-        
-        return improvements[:3]
+        return _improvements_template(_score_bucket(score), _length_bucket(avg_length),
+                                      _answer_count_bucket(num_answers))
     
     def _generate_overall_feedback(self, score: int, domain: InterviewDomain, 
                                   follow_ups: int, avg_length: float, num_answers: int) -> str:
         """Generate overall feedback"""
-        completion_note = f" You completed {num_answers} questions" + (
-            " - consider completing more questions next time for a more comprehensive evaluation." 
-            if num_answers < 5 else " which provided a good assessment of your skills."
-        )
-        
-        if score >= 85:
-            return f"Excellent performance! You demonstrated strong expertise in {domain.title} with detailed, well-structured answers.{completion_note} {'Your engagement with follow-up questions showed impressive depth of knowledge. ' if follow_ups > 0 else ''}You're well-prepared for interviews in this domain."
-        elif score >= 70:
-            return f"Good job! You showed solid understanding of {domain.title} concepts and provided thoughtful answers.{completion_note} {'Your detailed responses demonstrate good preparation. ' if avg_length > 200 else ''}With some additional practice on specific examples and technical depth, you'll be very competitive."
-        elif score >= 55:
-            return f"You're on the right track! You have a foundation in {domain.title}, but there's room for improvement.{completion_note} Focus on providing more detailed examples and deepening your technical knowledge. {'Try to engage more with follow-up questions to show your thinking process. ' if follow_ups == 0 else ''}Keep practicing!"
-        else:
-            return f"This interview highlighted areas for growth in {domain.title}.{completion_note} Focus on building stronger foundational knowledge and preparing specific examples from your experience. Consider additional study and practice before your next interview."
+        return _overall_feedback_template(_score_bucket(score), domain.title, min(follow_ups, 1),
+                                          _length_bucket(avg_length), num_answers)
     
-    def _generate_next_steps(self, domain: InterviewDomain, skills: List[str], score: int) -> List[str]:
+    def _generate_next_steps(self, domain: InterviewDomain, skills: List[str], score: int) -> Tuple[str, ...]:
         """Generate next steps recommendations"""
-        steps = []
-        
-        if score < 70:
-            steps.append(f"Review fundamental concepts in {skills[0]} and {skills[1] if len(skills) > 1 else 'core areas'}")
-        
-        steps.append("Practice more behavioral questions using structured frameworks")
-        steps.append("Prepare 3-5 detailed examples from your experience for different question types")
-        
-        if domain.id == "software-engineer":
-            steps.append("Practice coding problems and system design scenarios")
-        elif domain.id == "data-scientist":
-            steps.append("Work on explaining statistical concepts and ML algorithms clearly")
-        elif domain.id == "product-manager":
-            steps.append("Develop case studies showing product thinking and user empathy")
-        
-        steps.append("Record yourself answering questions to improve delivery and confidence")
-        steps.append("Try completing a full interview session for more comprehensive feedback")
-        
-        return steps[:5]
+        return _next_steps_template(domain.id, tuple(skills[:2]), _score_bucket(score))
+
+_default_ai: Optional[MockInterviewAI] = None
+
+def get_default_ai() -> MockInterviewAI:
+    """Get the shared MockInterviewAI used by sessions that don't pass one"""
+    global _default_ai
+    if _default_ai is None:
+        _default_ai = MockInterviewAI()
+    return _default_ai
+
+class SessionNotFound(KeyError):
+    """Raised for an unknown or expired session id"""
 
 class InterviewSession:
-    """Manages a single interview session"""
+    """Manages a single interview session
+
+    All randomness is drawn from streams derived from the session seed, so a
+    session created again with the same seed asks the same questions and
+    follow-ups and produces the same scores.
+
+    With settings.adaptive, no questions are selected up front: each one is
+    picked when it is reached, from the ability estimated on the answers so
+    far, so ``questions`` holds only the questions asked.
+    """
+    __slots__ = ("domain", "skills", "settings", "questions", "answers", "current_question_index",
+                 "start_time", "end_time", "ai", "registry_version", "is_ended_early", "seed",
+                 "session_id", "length_sum", "follow_up_sum", "skill_tallies", "qualities", "adaptive")
     
-    def __init__(self, domain: InterviewDomain, skills: List[str], settings: InterviewSettings):
+    def __init__(self, domain: InterviewDomain, skills: List[str], settings: InterviewSettings,
+                 ai: Optional[MockInterviewAI] = None, seed: Optional[int] = None,
+                 session_id: Optional[str] = None):
+        self.session_id = session_id or uuid.uuid4().hex
         self.domain = domain
         self.skills = skills
         self.settings = settings
@@ -398,34 +1279,161 @@ class InterviewSession:
         self.current_question_index = 0
         self.start_time = datetime.datetime.now()
         self.end_time = None
-        self.ai = MockInterviewAI()
+        self.ai = ai or get_default_ai()
+        self.registry_version = self.ai.registry.version
         self.is_ended_early = False
+        self.seed = new_seed() if seed is None else seed
+        self._reset_aggregates()
         
         # Generate questions
-        self.questions = self.ai.generate_questions(domain, skills, settings)
+        if settings.adaptive:
+            self.adaptive = AdaptiveState(self.ai.count_candidates(skills, settings))
+        else:
+            self.adaptive = None
+            self.questions = self.ai.generate_questions(domain, skills, settings, seed=self.seed)
+    
+    @classmethod
+    def restore(cls, session_id: str, domain: InterviewDomain, skills: List[str], settings: InterviewSettings,
+                seed: int, questions: List[Question], start_time: datetime.datetime,
+                answers: Iterable[Answer] = (), end_time: Optional[datetime.datetime] = None,
+                is_ended_early: bool = False, ai: Optional[MockInterviewAI] = None,
+                qualities: Optional[Sequence[float]] = None, clusters: Iterable[int] = ()) -> "InterviewSession":
+        """Rebuild a session from saved state without selecting questions again
+
+        Pass the saved answer qualities (see ``qualities``) to restore the
+        aggregates without analyzing every answer again, and for an adaptive
+        session the near-duplicate clusters it has asked (``adaptive.clusters``)
+        so later picks keep avoiding them.
+        """
+        session = cls.__new__(cls)
+        session.session_id = session_id
+        session.domain = domain
+        session.skills = skills
+        session.settings = settings
+        session.questions = list(questions)
+        session.answers = list(answers)
+        session.current_question_index = len(session.answers)
+        session.start_time = start_time
+        session.end_time = end_time
+        session.ai = ai or get_default_ai()
+        session.registry_version = session.ai.registry.version
+        session.is_ended_early = is_ended_early
+        session.seed = seed
+        session.adaptive = None
+        if settings.adaptive:
+            session.adaptive = AdaptiveState(session.ai.count_candidates(skills, settings))
+            session.adaptive.clusters.update(clusters)
+        session._reset_aggregates()
+        if qualities is None:
+            qualities = [None] * len(session.answers)
+        elif len(qualities) != len(session.answers):
+            raise ValueError("Expected one quality per answer")
+        for answer, quality in zip(session.answers, qualities):
+            session._tally(answer, quality)
+        return session
+    
+    def _reset_aggregates(self) -> None:
+        # Running aggregates over the answers, kept up to date by _tally
+        self.length_sum = 0
+        self.follow_up_sum = 0
+        # Answer count, length sum and answer quality sum per selected skill,
+        # flattened: [count 0, length 0, quality 0, count 1, ...]
+        self.skill_tallies = [0] * (3 * len(self.skills))
+        # Analyzed quality of each answer (0.0 for answers outside the selected
+        # skills), saved with the session so restoring it needs no analysis
+        self.qualities = []
+    
+    def _tally(self, answer: Answer, quality: Optional[float] = None) -> None:
+        length = len(answer.text)
+        self.length_sum += length
+        self.follow_up_sum += len(answer.follow_ups)
+        try:
+            position = 3 * self.skills.index(answer.question.skill)
+        except ValueError:
+            self.qualities.append(0.0)
+            return
+        if quality is None:
+            quality = self.ai.analyzer.analyze(answer.question, answer.text).quality
+        self.qualities.append(quality)
+        self.skill_tallies[position] += 1
+        self.skill_tallies[position + 1] += length
+        self.skill_tallies[position + 2] += quality
+        if self.adaptive is not None:
+            self.adaptive.ability = update_ability(self.adaptive.ability, answer.question.difficulty, quality)
+    
+    def skill_tally(self, skill: str) -> Tuple[int, int]:
+        """Answer count and total answer length so far for a selected skill"""
+        position = 3 * self.skills.index(skill)
+        return self.skill_tallies[position], self.skill_tallies[position + 1]
+    
+    def skill_adjustments(self) -> Tuple[Optional[int], ...]:
+        """Per-skill score adjustments from the analysis of the answers so far"""
+        from answer_analysis import skill_adjustment
+        tallies = self.skill_tallies
+        positions = (3 * self.skills.index(skill) for skill in self.skills)  # repeated skills share a tally
+        return tuple(skill_adjustment(tallies[i + 2], tallies[i]) for i in positions)
     
     def get_current_question(self) -> Optional[Question]:
-        """Get the current question"""
-        if self.current_question_index < len(self.questions):
-            return self.questions[self.current_question_index]
-        return None
+        """Get the current question (picking it now in an adaptive session)"""
+        index = self.current_question_index
+        if index < len(self.questions):
+            return self.questions[index]
+        adaptive = self.adaptive
+        if adaptive is None or index >= adaptive.total:
+            return None
+        
+        skill_counts = {skill: self.skill_tallies[3 * self.skills.index(skill)] for skill in self.skills}
+        picked = self.ai.select_next_question(self.skills, self.settings, self.questions, skill_counts,
+                                              adaptive.ability, stream_seed(self.seed, f"question:{index}"),
+                                              adaptive.clusters)
+        if picked is None:
+            adaptive.total = index
+            return None
+        question, cluster = picked
+        if cluster is not None:
+            adaptive.clusters.add(cluster)
+        self.questions.append(question)
+        return question
+    
+    def total_questions(self) -> int:
+        """Number of questions the session asks"""
+        return len(self.questions) if self.adaptive is None else self.adaptive.total
+    
+    def get_follow_up_questions(self, question_index: Optional[int] = None, answer_text: Optional[str] = None,
+                                strategy: str = "most_relevant") -> List[str]:
+        """Get follow-up questions for a question (the current one by default)
+
+        Each question has its own follow-up stream, so repeated calls agree.
+        Pass the candidate's answer_text to pick follow-ups by similarity.
+        """
+        if question_index is None or question_index == self.current_question_index:
+            question_index = self.current_question_index
+            question = self.get_current_question()
+        else:
+            question = self.questions[question_index] if question_index < len(self.questions) else None
+        if question is None:
+            return []
+        rng = CounterRandom(stream_seed(self.seed, f"follow-ups:{question_index}"))
+        return self.ai.get_follow_up_questions(question, self.settings.include_follow_ups,
+                                               rng, answer_text, strategy)
     
     def submit_answer(self, answer_text: str, follow_up_answers: List[Dict[str, str]] = None) -> bool:
         """Submit an answer and move to next question"""
-        if self.current_question_index >= len(self.questions):
+        current_question = self.get_current_question()
+        if current_question is None:
             return False
         
-        current_question = self.questions[self.current_question_index]
-        answer = Answer(
-            question_id=current_question.id,
-            text=answer_text,
-            timestamp=datetime.datetime.now(),
-            follow_up_answers=follow_up_answers or []
-        )
-        
+        self.append_answer(Answer.create(current_question, answer_text, datetime.datetime.now(), follow_up_answers))
+        return True
+    
+    def append_answer(self, answer: Answer, quality: Optional[float] = None) -> None:
+        """Record an answer to the current question (e.g. one replayed from a log)
+
+        A replayed answer may carry its saved quality, which skips the analysis.
+        """
         self.answers.append(answer)
         self.current_question_index += 1
-        return True
+        self._tally(answer, quality)
     
     def end_interview_early(self) -> bool:
         """End the interview early"""
@@ -437,11 +1445,11 @@ class InterviewSession:
     
     def is_complete(self) -> bool:
         """Check if interview is complete"""
-        return self.current_question_index >= len(self.questions) or self.is_ended_early
+        return self.current_question_index >= self.total_questions() or self.is_ended_early
     
     def get_progress(self) -> Tuple[int, int]:
         """Get current progress (current, total)"""
-        return (self.current_question_index, len(self.questions))
+        return (self.current_question_index, self.total_questions())
     
     def get_duration(self) -> int:
         """Get interview duration in minutes"""
@@ -450,8 +1458,71 @@ class InterviewSession:
         return int(duration)
     
     def generate_feedback(self) -> Feedback:
-        """Generate final feedback"""
-        return self.ai.generate_feedback(self.answers, self.domain, self.skills)
+        """Generate final feedback (through the AI's feedback cache, if it has one)"""
+        cache = self.ai.feedback_cache
+        if cache is None:
+            return self.compute_feedback()
+        return cache.get_or_compute(self.fingerprint(), self.compute_feedback)
+    
+    def compute_feedback(self) -> Feedback:
+        """Generate feedback on the answers so far, bypassing any feedback cache
+        
+        Built from the running aggregates, so it is cheap to call after every
+        answer; at the end of the session it is the final feedback.
+        """
+        rng = CounterRandom(stream_seed(self.seed, "feedback"))
+        return self.ai.feedback_from_metrics(len(self.answers), self.length_sum, self.follow_up_sum,
+                                             self.domain, self.skills, rng, self.skill_adjustments())
+    
+    def provisional_score(self) -> int:
+        """Overall score of the answers so far, in O(1)"""
+        if not self.answers:
+            return 0
+        return score_metrics(len(self.answers), self.length_sum / len(self.answers),
+                             self.follow_up_sum, len(self.skills))
+    
+    def fingerprint(self) -> str:
+        """Stable hex digest of everything the feedback depends on
+        
+        Covers the scoring version, registry version (so a reloaded bank that
+        changed a question's text under the same id gives new digests),
+        domain id, selected skills, seed and, per answer, the id of its
+        question, its text and follow-up count.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{SCORING_VERSION}\x1e{self.registry_version}\x1e{self.domain.id}\x1e{self.seed}\x1e"
+                      .encode("utf-8"))
+        digest.update("\x1f".join(self.skills).encode("utf-8", "surrogatepass"))
+        for answer in self.answers:
+            question_id = answer.question.id.encode("utf-8", "surrogatepass")
+            text = answer.text.encode("utf-8", "surrogatepass")
+            digest.update(b"\x1e%d:%d:%d:" % (len(answer.follow_ups), len(question_id), len(text)))
+            digest.update(question_id)
+            digest.update(text)
+        return digest.hexdigest()
+    
+    def summary(self) -> SessionSummary:
+        """Get the compact inputs to this session's feedback, e.g. to score it in another process"""
+        return SessionSummary(
+            domain_id=self.domain.id,
+            skills=tuple(self.skills),
+            num_answers=len(self.answers),
+            length_sum=self.length_sum,
+            total_follow_ups=self.follow_up_sum,
+            seed=self.seed,
+            skill_adjustments=self.skill_adjustments()
+        )
+    
+    def to_bytes(self) -> bytes:
+        """Encode the session in the binary format (see binary_format)"""
+        from binary_format import session_to_bytes
+        return session_to_bytes(self)
+    
+    @classmethod
+    def from_bytes(cls, data, ai: Optional[MockInterviewAI] = None) -> "InterviewSession":
+        """Decode a session, resolving its domain and questions against ai's registry"""
+        from binary_format import session_from_bytes
+        return session_from_bytes(data, ai)
 
 def main():
     """Example usage of the Mock Interview AI system with early ending capability"""
@@ -501,7 +1572,7 @@ def main():
             print(f"Answer: {answer_text}")
             
             # Get follow-up questions
-            follow_ups = ai.get_follow_up_questions(question, settings.include_follow_ups)
+            follow_ups = session.get_follow_up_questions(answer_text=answer_text)
             follow_up_answers = []
             
             if follow_ups:
@@ -0,0 +1,264 @@
+"""
+Near-duplicate question detection for Mock Interview AI
+
+Questions are reduced to word 3-shingles of their text and follow-ups, then
+to MinHash signatures (NUM_PERMUTATIONS multiply-shift hashes). Locality
+sensitive hashing over BANDS bands of ROWS_PER_BAND rows finds candidate
+pairs in one pass, and a pair is merged into a cluster when its estimated
+Jaccard similarity reaches the threshold. The whole job is linear in the
+bank size. With NumPy, signatures are computed a chunk of questions at a
+time into one preallocated uint32 matrix (256 bytes per question), and
+each band is hashed to a uint64 key and sorted to find the questions that
+share it, so no per-question Python objects are kept.
+
+find_duplicates() returns {handle: cluster representative} for every
+clustered question. build_registry(..., detect_duplicates=True) runs it at
+load time so question selection treats a cluster as a single question, and
+the command line tool reports clusters of a JSONL bank or writes a
+deduplicated copy:
+
+    python near_duplicates.py questions.jsonl --report clusters.json
+    python near_duplicates.py questions.jsonl --write-deduped deduped.jsonl
+"""
+
+import argparse
+import json
+import random
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+from mock_interview_ai import Question, QuestionBank, np
+
+from answer_analysis import _TOKEN, normalize
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+DEFAULT_THRESHOLD = 0.7
+SHINGLE_SIZE = 3
+CHUNK_SIZE = 1024
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = (1 << 32) - 1  # signature value of a question without shingles
+
+# Fixed multiply-shift hash parameters, so signatures agree across runs
+_parameters = random.Random(0x5EED)
+_MULTIPLIERS = [_parameters.getrandbits(64) | 1 for _ in range(NUM_PERMUTATIONS)]
+_INCREMENTS = [_parameters.getrandbits(64) for _ in range(NUM_PERMUTATIONS)]
+
+@lru_cache(maxsize=1 << 18)
+def _token_hash(token: str) -> int:
+    return zlib.crc32(normalize(token).encode("utf-8"))
+
+def shingles(question: Question) -> List[int]:
+    """Hashed word shingles of a question's text and follow-ups
+
+    A shingle's hash combines the hashes of its normalized tokens, which are
+    cached, so each text costs one regex scan and a few multiplications.
+    """
+    found = set()
+    for text in (question.text, *question.follow_ups):
+        hashes = [_token_hash(token) for token in _TOKEN.findall(text.lower())]
+        if 0 < len(hashes) < SHINGLE_SIZE:
+            hashes += [0] * (SHINGLE_SIZE - len(hashes))  # texts shorter than a shingle count as one shingle
+        found.update(((first * 0x9E3779B1) ^ (second * 0x85EBCA77) ^ third) & 0xFFFFFFFF
+                     for first, second, third in zip(hashes, hashes[1:], hashes[2:]))
+    return sorted(found)
+
+def signature(shingle_hashes: Sequence[int]) -> List[int]:
+    """MinHash signature of a shingle set"""
+    if not shingle_hashes:
+        return [_EMPTY] * NUM_PERMUTATIONS
+    return [min((((a * x + b) & _MASK64) >> 32) for x in shingle_hashes)
+            for a, b in zip(_MULTIPLIERS, _INCREMENTS)]
+
+def signatures(questions: Sequence[Question]) -> List[List[int]]:
+    """MinHash signatures of many questions (vectorized with NumPy when available)"""
+    if np is None:
+        return [signature(shingles(question)) for question in questions]
+    return _signature_array(questions).tolist()
+
+def _signature_array(questions: Sequence[Question]) -> "np.ndarray":
+    """MinHash signatures of many questions as a (questions, NUM_PERMUTATIONS) uint32 array
+
+    Equal to signature(shingles(question)) per question; the shingles of the
+    whole chunk are combined and hashed as arrays, and repeated shingles are
+    left in since they do not change a minimum.
+    """
+    token_hashes: List[int] = []
+    text_starts: List[int] = []
+    text_shingles: List[int] = []
+    shingle_counts = np.zeros(len(questions), dtype=np.int64)
+    for index, question in enumerate(questions):
+        for text in (question.text, *question.follow_ups):
+            hashes = [_token_hash(token) for token in _TOKEN.findall(text.lower())]
+            if not hashes:
+                continue
+            if len(hashes) < SHINGLE_SIZE:
+                hashes += [0] * (SHINGLE_SIZE - len(hashes))  # texts shorter than a shingle count as one shingle
+            text_starts.append(len(token_hashes))
+            text_shingles.append(len(hashes) - SHINGLE_SIZE + 1)
+            shingle_counts[index] += len(hashes) - SHINGLE_SIZE + 1
+            token_hashes.extend(hashes)
+
+    result = np.full((len(questions), NUM_PERMUTATIONS), _EMPTY, dtype=np.uint32)
+    if not text_starts:
+        return result
+    tokens = np.array(token_hashes, dtype=np.uint64)
+    counts = np.array(text_shingles, dtype=np.int64)
+    first_shingle = np.cumsum(counts) - counts
+    starts = np.repeat(np.array(text_starts, dtype=np.int64) - first_shingle, counts) + np.arange(int(counts.sum()))
+    values = ((tokens[starts] * np.uint64(0x9E3779B1)) ^ (tokens[starts + 1] * np.uint64(0x85EBCA77))
+              ^ tokens[starts + 2]) & np.uint64(0xFFFFFFFF)
+    multipliers = np.array(_MULTIPLIERS, dtype=np.uint64)[:, None]
+    increments = np.array(_INCREMENTS, dtype=np.uint64)[:, None]
+    hashed = (values[None, :] * multipliers + increments) >> np.uint64(32)  # wraps mod 2**64
+    non_empty = shingle_counts > 0
+    question_starts = (np.cumsum(shingle_counts) - shingle_counts)[non_empty]
+    result[non_empty] = np.minimum.reduceat(hashed, question_starts, axis=1).T
+    return result
+
+def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(a == b for a, b in zip(first, second)) / NUM_PERMUTATIONS
+
+class _Clusters:
+    """Union-find over handles, tracking only clustered ones"""
+
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+
+    def find(self, handle: int) -> int:
+        parent = self.parent
+        root = handle
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while handle != root:
+            handle, parent[handle] = parent[handle], root
+        return root
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            # The smaller handle represents the cluster
+            first, second = min(first, second), max(first, second)
+            self.parent[second] = first
+            self.parent.setdefault(first, first)
+
+def find_duplicates(question_bank: QuestionBank, threshold: float = DEFAULT_THRESHOLD,
+                    chunk_size: int = CHUNK_SIZE) -> Dict[int, int]:
+    """Map every near-duplicate question handle to its cluster's representative handle
+
+    A question is compared with the first question that shares one of its
+    bands, and merged with it at the threshold.
+    """
+    if np is None:
+        return _find_duplicates_python(question_bank, threshold, chunk_size)
+    count = sum(len(handles) for skill in question_bank.skills() for handles in question_bank.buckets(skill))
+    handles = np.empty(count, dtype=np.int64)
+    sigs = np.empty((count, NUM_PERMUTATIONS), dtype=np.uint32)
+    position = 0
+    chunk: List[int] = []
+    for skill in question_bank.skills():
+        for bucket in question_bank.buckets(skill):
+            for handle in bucket:
+                chunk.append(handle)
+                if len(chunk) == chunk_size:
+                    _fill_signatures(question_bank, chunk, handles, sigs, position)
+                    position += len(chunk)
+                    chunk = []
+    _fill_signatures(question_bank, chunk, handles, sigs, position)
+
+    clusters = _Clusters()
+    for band in range(BANDS):
+        keys = _band_keys(sigs[:, band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+        order = np.argsort(keys, kind="stable")
+        ordered = keys[order]
+        # Pair every row with the first row (in bank order) of its key's run
+        run_start = np.empty(count, dtype=bool)
+        run_start[:1] = True
+        np.not_equal(ordered[1:], ordered[:-1], out=run_start[1:])
+        owners = order[np.maximum.accumulate(np.where(run_start, np.arange(count), 0))]
+        members = order[~run_start]
+        owners = owners[~run_start]
+        for start in range(0, len(members), chunk_size * 16):
+            first, second = owners[start:start + chunk_size * 16], members[start:start + chunk_size * 16]
+            similar = (sigs[first] == sigs[second]).sum(axis=1) / NUM_PERMUTATIONS >= threshold
+            for owner, member in zip(handles[first[similar]].tolist(), handles[second[similar]].tolist()):
+                clusters.union(owner, member)
+    return {handle: clusters.find(handle) for handle in clusters.parent}
+
+def _fill_signatures(question_bank: QuestionBank, chunk: List[int], handles: "np.ndarray", sigs: "np.ndarray",
+                     position: int) -> None:
+    if chunk:
+        handles[position:position + len(chunk)] = chunk
+        sigs[position:position + len(chunk)] = _signature_array([question_bank.load(handle) for handle in chunk])
+
+def _band_keys(band: "np.ndarray") -> "np.ndarray":
+    """Hash each row of a band's uint32 columns to one uint64 key"""
+    keys = np.zeros(len(band), dtype=np.uint64)
+    for column in range(band.shape[1]):
+        keys ^= band[:, column].astype(np.uint64)
+        keys *= np.uint64(0x9E3779B97F4A7C15)  # wraps mod 2**64
+        keys ^= keys >> np.uint64(29)
+    return keys
+
+def _find_duplicates_python(question_bank: QuestionBank, threshold: float, chunk_size: int) -> Dict[int, int]:
+    handles = [handle for skill in question_bank.skills()
+               for handles in question_bank.buckets(skill) for handle in handles]
+    buckets: List[Dict[tuple, int]] = [{} for _ in range(BANDS)]
+    kept: Dict[int, List[int]] = {}  # signatures of questions that own a bucket
+    clusters = _Clusters()
+    for start in range(0, len(handles), chunk_size):
+        chunk = handles[start:start + chunk_size]
+        for handle, sig in zip(chunk, signatures([question_bank.load(handle) for handle in chunk])):
+            owner_of_any = False
+            for band in range(BANDS):
+                key = tuple(sig[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+                other = buckets[band].get(key)
+                if other is None:
+                    buckets[band][key] = handle
+                    owner_of_any = True
+                elif similarity(sig, kept[other]) >= threshold:
+                    clusters.union(other, handle)
+            if owner_of_any:
+                kept[handle] = sig
+    return {handle: clusters.find(handle) for handle in clusters.parent}
+
+def cluster_lists(duplicates: Dict[int, int]) -> List[List[int]]:
+    """Clusters as sorted handle lists, largest first"""
+    grouped: Dict[int, List[int]] = {}
+    for handle, representative in duplicates.items():
+        grouped.setdefault(representative, []).append(handle)
+    return sorted((sorted(members) for members in grouped.values()), key=lambda members: (-len(members), members))
+
+def main():
+    """Report the near-duplicate clusters of a JSONL bank or write a deduplicated copy"""
+    from question_bank_file import JsonlQuestionBank, write_question_bank
+
+    parser = argparse.ArgumentParser(description="Find near-duplicate questions in a JSONL question bank")
+    parser.add_argument("bank", help="JSONL question bank")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="estimated Jaccard similarity that counts as a duplicate")
+    parser.add_argument("--report", help="write the clusters (question ids) as JSON")
+    parser.add_argument("--write-deduped", metavar="PATH", help="write the bank keeping one question per cluster")
+    args = parser.parse_args()
+
+    with JsonlQuestionBank(args.bank) as bank:
+        duplicates = find_duplicates(bank, args.threshold)
+        clusters = cluster_lists(duplicates)
+        print(f"{len(clusters)} clusters covering {len(duplicates)} questions")
+        for members in clusters[:10]:
+            print("  " + ", ".join(bank.load(handle).id for handle in members))
+        if args.report:
+            with open(args.report, "w") as f:
+                json.dump([[bank.load(handle).id for handle in members] for members in clusters], f, indent=2)
+        if args.write_deduped:
+            deduped = [bank.load(handle) for skill in bank.skills() for handles in bank.buckets(skill)
+                       for handle in handles if duplicates.get(handle, handle) == handle]
+            write_question_bank(args.write_deduped, deduped)
+            print(f"Wrote {len(deduped)} questions to {args.write_deduped}")
+
+if __name__ == "__main__":
+    main()
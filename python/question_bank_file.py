@@ -0,0 +1,232 @@
+"""
+On-disk question bank for Mock Interview AI
+
+Questions are stored one JSON object per line. A binary sidecar index maps
+each (skill, difficulty, type) key to the byte offsets of its lines, and
+holds the sorted hashes of the question ids with their line offsets, so
+find() is a binary search. Both files are memory-mapped, so opening a bank
+costs only the size of the key table and a Question is parsed only when
+load() or find() is called for it.
+
+The index records the size, modification time and a digest of the head and
+tail of the data file it was built from, and is rebuilt when any of them
+no longer match (e.g. after lines were reordered in place).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from mock_interview_ai import (
+    Difficulty, Question, QuestionBank, QuestionType, _initialize_question_bank
+)
+
+INDEX_MAGIC = b"MQBIDX03"
+INDEX_SUFFIX = ".idx"
+# Bytes hashed at each end of the data file for the index's content digest
+DIGEST_SAMPLE = 64 * 1024
+
+# magic, data file size, data file mtime (ns), data digest, total offsets, number of keys
+_HEADER = struct.Struct("<8sQQ16sQI4x")
+# difficulty code, type code, skill length, first offset, offset count
+_KEY = struct.Struct("<BBHQQ")
+
+_DIFFICULTIES = tuple(Difficulty)
+_QUESTION_TYPES = tuple(QuestionType)
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+def question_to_record(question: Question) -> Dict:
+    """Convert a question to its JSON record"""
+    return {
+        "id": question.id,
+        "text": question.text,
+        "type": question.type.value,
+        "difficulty": question.difficulty.value,
+        "skill": question.skill,
+        "follow_ups": list(question.follow_ups)
+    }
+
+def question_from_record(record: Dict) -> Question:
+    """Build a question from its JSON record"""
+    return Question(
+        id=sys.intern(record["id"]),
+        text=record["text"],
+        type=QuestionType(record["type"]),
+        difficulty=Difficulty(record["difficulty"]),
+        skill=sys.intern(record["skill"]),
+        follow_ups=tuple(record.get("follow_ups", ()))
+    )
+
+def _id_hash(question_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(question_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+def _data_identity(f) -> Tuple[int, int, bytes]:
+    """Size, mtime in nanoseconds and head/tail digest of an open data file"""
+    stat = os.fstat(f.fileno())
+    digest = hashlib.blake2b(digest_size=16)
+    f.seek(0)
+    digest.update(f.read(DIGEST_SAMPLE))
+    if stat.st_size > DIGEST_SAMPLE:
+        f.seek(max(DIGEST_SAMPLE, stat.st_size - DIGEST_SAMPLE))
+        digest.update(f.read(DIGEST_SAMPLE))
+    f.seek(0)
+    return stat.st_size, stat.st_mtime_ns, digest.digest()
+
+def write_question_bank(path: str, questions: Iterable[Question]) -> None:
+    """Write questions to a JSONL bank file and build its index"""
+    with open(path, "w", encoding="utf-8") as f:
+        for question in questions:
+            f.write(json.dumps(question_to_record(question), ensure_ascii=False))
+            f.write("\n")
+    build_index(path)
+
+def build_index(path: str, index_path: Optional[str] = None) -> str:
+    """Scan a JSONL bank file once and write its (skill, difficulty, type) offset index"""
+    index_path = index_path or path + INDEX_SUFFIX
+    keyed: Dict[Tuple[str, int, int], List[int]] = {}
+    ids: List[Tuple[int, int]] = []
+
+    with open(path, "rb") as f:
+        data_size, data_mtime, data_digest = _data_identity(f)
+        offset = 0
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                key = (
+                    record["skill"],
+                    _DIFFICULTIES.index(Difficulty(record["difficulty"])),
+                    _QUESTION_TYPES.index(QuestionType(record["type"]))
+                )
+                keyed.setdefault(key, []).append(offset)
+                ids.append((_id_hash(record["id"]), offset))
+            offset += len(line)
+
+    total = sum(len(offsets) for offsets in keyed.values())
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, data_size, data_mtime, data_digest, total, len(keyed)))
+        start = 0
+        for (skill, difficulty, question_type), offsets in keyed.items():
+            encoded = skill.encode("utf-8")
+            f.write(_KEY.pack(difficulty, question_type, len(encoded), start, len(offsets)))
+            f.write(encoded)
+            start += len(offsets)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        for offsets in keyed.values():
+            f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        # Id table: sorted id hashes, then the offset of each one's line
+        ids.sort()
+        f.write(struct.pack(f"<{len(ids)}Q", *(id_hash for id_hash, _ in ids)))
+        f.write(struct.pack(f"<{len(ids)}Q", *(offset for _, offset in ids)))
+    os.replace(tmp_path, index_path)
+    return index_path
+
+class JsonlQuestionBank(QuestionBank):
+    """Question bank backed by a memory-mapped JSONL file and offset index"""
+
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        super().__init__()
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+
+        self._data_file = open(path, "rb")
+        data_size, data_mtime, data_digest = _data_identity(self._data_file)
+        if not self._index_is_current(data_size, data_mtime, data_digest):
+            build_index(path, self.index_path)
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ) if data_size else b""
+        self._index_file = open(self.index_path, "rb")
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._load_index()
+
+    def _index_is_current(self, data_size: int, data_mtime: int, data_digest: bytes) -> bool:
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, indexed_size, indexed_mtime, indexed_digest, _, _ = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return (magic == INDEX_MAGIC and indexed_size == data_size and indexed_mtime == data_mtime
+                and indexed_digest == data_digest)
+
+    def _load_index(self) -> None:
+        *_, total, num_keys = _HEADER.unpack_from(self._index_map, 0)
+        position = _HEADER.size
+        keys = []
+        for _ in range(num_keys):
+            difficulty, question_type, skill_length, start, count = _KEY.unpack_from(self._index_map, position)
+            position += _KEY.size
+            skill = sys.intern(bytes(self._index_map[position:position + skill_length]).decode("utf-8"))
+            position += skill_length
+            keys.append((skill, _DIFFICULTIES[difficulty], _QUESTION_TYPES[question_type], start, count))
+
+        # Offsets are read straight out of the mapped index, never copied
+        offsets_start = _align(position)
+        offsets = memoryview(self._index_map)[offsets_start:offsets_start + total * 8].cast("Q")
+        self._offsets = offsets
+        ids_start = offsets_start + total * 8
+        self._id_hashes = memoryview(self._index_map)[ids_start:ids_start + total * 8].cast("Q")
+        self._id_offsets = memoryview(self._index_map)[ids_start + total * 8:ids_start + total * 16].cast("Q")
+        for skill, difficulty, question_type, start, count in keys:
+            self._index.setdefault(skill, {})[(difficulty, question_type)] = offsets[start:start + count]
+
+    def load(self, handle: int) -> Question:
+        end = self._data.find(b"\n", handle)
+        line = self._data[handle:end if end >= 0 else len(self._data)]
+        return question_from_record(json.loads(line))
+
+    def find(self, question_id: str) -> Question:
+        """Get a question by id from the index's id table, parsing only its line"""
+        id_hash = _id_hash(question_id)
+        position = bisect_left(self._id_hashes, id_hash)
+        while position < len(self._id_hashes) and self._id_hashes[position] == id_hash:
+            question = self.load(self._id_offsets[position])
+            if question.id == question_id:
+                return question
+            position += 1
+        raise KeyError(question_id)
+
+    def close(self) -> None:
+        """Release the memory maps and file handles"""
+        self._index = {}
+        self._offsets.release()
+        self._id_hashes.release()
+        self._id_offsets.release()
+        self._index_map.close()
+        self._index_file.close()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data_file.close()
+
+    def __enter__(self) -> "JsonlQuestionBank":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def main():
+    """Export the built-in bank to JSONL or (re)build the index of a bank file"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage on-disk question banks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="write the built-in question bank to a JSONL file")
+    export_parser.add_argument("path")
+    index_parser = subparsers.add_parser("index", help="build the offset index for a JSONL bank file")
+    index_parser.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        questions = [q for skill_questions in _initialize_question_bank().values() for q in skill_questions]
+        write_question_bank(args.path, questions)
+        print(f"Wrote {len(questions)} questions to {args.path}")
+    else:
+        print(f"Wrote index {build_index(args.path)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""
+Append-only session persistence for Mock Interview AI
+
+SessionLog appends one length-prefixed, checksummed record per event
+(session started, answer submitted, ended early) to the current log segment
+and fsyncs in batches. snapshot() writes the live sessions as a compacted
+event stream, starts a new segment and deletes the old ones, so recovery
+replays the snapshot plus the events written since.
+
+Record layout: uint32 payload length, uint32 CRC32 of the payload, then the
+payload (one event type byte followed by a compact JSON body). A torn record
+at the tail of a segment ends its replay; reopening the log truncates the
+segment back to its last intact record before appending to it.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mock_interview_ai import (
+    Answer, Difficulty, InterviewSession, InterviewSettings, MockInterviewAI,
+    from_micros, get_default_ai, to_micros
+)
+
+SNAPSHOT_HEADER = 0
+SESSION_STARTED = 1
+ANSWER_SUBMITTED = 2
+ENDED_EARLY = 3
+
+_RECORD_HEADER = struct.Struct("<II")
+SNAPSHOT_NAME = "snapshot.log"
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".log"
+
+logger = logging.getLogger(__name__)
+
+def encode_record(event_type: int, body: Dict) -> bytes:
+    """Encode one event as a length-prefixed, checksummed record"""
+    payload = bytes((event_type,)) + json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def _intact_payloads(f: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """Yield (end offset, payload) for every record of a file before the first torn one"""
+    position = 0
+    while True:
+        header = f.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return
+        length, checksum = _RECORD_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return  # torn write at the tail
+        position += _RECORD_HEADER.size + length
+        yield position, payload
+
+def read_records(path: str) -> Iterator[Tuple[int, Dict]]:
+    """Yield (event type, body) for every intact record of a file"""
+    with open(path, "rb") as f:
+        for _, payload in _intact_payloads(f):
+            yield payload[0], json.loads(payload[1:])
+
+def _truncate_torn_tail(path: str) -> None:
+    """Cut a file back to the end of its last intact record"""
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        end = 0
+        for end, _ in _intact_payloads(f):
+            pass
+        if end < os.fstat(f.fileno()).st_size:
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+
+def started_body(session: InterviewSession) -> Dict:
+    body = {
+        "id": session.session_id,
+        "domain": session.domain.id,
+        "skills": list(session.skills),
+        "settings": [
+            session.settings.number_of_questions,
+            session.settings.include_follow_ups,
+            session.settings.difficulty.value,
+            session.settings.adaptive
+        ],
+        "seed": session.seed,
+        "questions": [question.id for question in session.questions],
+        "start": to_micros(session.start_time)
+    }
+    if session.adaptive is not None and session.adaptive.clusters:
+        # A snapshot restores questions already picked, which replay cannot tell the clusters of
+        body["clusters"] = sorted(session.adaptive.clusters)
+    return body
+
+def answer_body(session: InterviewSession, index: int) -> Dict:
+    answer = session.answers[index]
+    body = {
+        "id": session.session_id,
+        "text": answer.text,
+        "follow_ups": [list(follow_up) for follow_up in answer.follow_ups],
+        "at": to_micros(answer.timestamp),
+        # Saved so replaying the answer needs no analysis
+        "quality": session.qualities[index]
+    }
+    if session.settings.adaptive:
+        # Adaptive questions are picked on the fly, so record which one was answered
+        body["question"] = answer.question.id
+    return body
+
+def ended_body(session: InterviewSession) -> Dict:
+    return {"id": session.session_id, "at": to_micros(session.end_time)}
+
+class SessionLog:
+    """Append-only event log with batched fsync and compacting snapshots
+
+    Records are fsynced once fsync_every of them are buffered, and a
+    background thread fsyncs whatever is left fsync_interval seconds after
+    the last sync, so an idle log never holds unsynced records for long.
+    """
+
+    def __init__(self, directory: str, fsync_every: int = 1024, fsync_interval: float = 1.0):
+        self.directory = directory
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        os.makedirs(directory, exist_ok=True)
+        segments = _segment_numbers(directory)
+        self.segment = max(segments[-1] if segments else 0, _snapshot_segment(directory))
+        path = _segment_path(self.directory, self.segment)
+        # Records appended after a torn one would never be replayed
+        _truncate_torn_tail(path)
+        self._file = open(path, "ab")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="session-log-fsync", daemon=True)
+        self._flusher.start()
+
+    def _append(self, record: bytes) -> None:
+        with self._lock:
+            self._file.write(record)
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                if self._unsynced and not self._file.closed:
+                    self._sync()
+
+    def record_start(self, session: InterviewSession) -> None:
+        """Log a started session"""
+        self._append(encode_record(SESSION_STARTED, started_body(session)))
+
+    def record_answer(self, session: InterviewSession, answer: Optional[Answer] = None) -> None:
+        """Log an answer (the session's latest by default)"""
+        index = -1
+        if answer is not None:
+            index = next(i for i in range(len(session.answers) - 1, -1, -1) if session.answers[i] is answer)
+        self._append(encode_record(ANSWER_SUBMITTED, answer_body(session, index)))
+
+    def record_end(self, session: InterviewSession) -> None:
+        """Log a session ended early"""
+        self._append(encode_record(ENDED_EARLY, ended_body(session)))
+
+    def submit_answer(self, session: InterviewSession, answer_text: str,
+                      follow_up_answers: Optional[List[Dict[str, str]]] = None) -> bool:
+        """Submit an answer to a session and log it"""
+        submitted = session.submit_answer(answer_text, follow_up_answers)
+        if submitted:
+            self.record_answer(session)
+        return submitted
+
+    def end_interview_early(self, session: InterviewSession) -> bool:
+        """End a session early and log it"""
+        ended = session.end_interview_early()
+        if ended:
+            self.record_end(session)
+        return ended
+
+    def sync(self) -> None:
+        """Flush buffered records and fsync the current segment"""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def snapshot(self, sessions: Iterable[InterviewSession]) -> None:
+        """Write the given live sessions as a compacted snapshot and drop older segments
+
+        The sessions passed in must include every session whose events
+        should survive; anything else is compacted away.
+        """
+        with self._lock:
+            self._sync()
+            self._file.close()
+            try:
+                self._write_snapshot(sessions)
+            finally:
+                # Keep appending to the old segment if the snapshot failed
+                self._file = open(_segment_path(self.directory, self.segment), "ab")
+
+    def _write_snapshot(self, sessions: Iterable[InterviewSession]) -> None:
+        next_segment = self.segment + 1
+        tmp_path = os.path.join(self.directory, SNAPSHOT_NAME + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(encode_record(SNAPSHOT_HEADER, {"segment": next_segment}))
+            for session in sessions:
+                f.write(encode_record(SESSION_STARTED, started_body(session)))
+                for index in range(len(session.answers)):
+                    f.write(encode_record(ANSWER_SUBMITTED, answer_body(session, index)))
+                if session.is_ended_early:
+                    f.write(encode_record(ENDED_EARLY, ended_body(session)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(self.directory, SNAPSHOT_NAME))
+        self.segment = next_segment
+
+        for segment in _segment_numbers(self.directory):
+            if segment < next_segment:
+                os.remove(_segment_path(self.directory, segment))
+
+    def close(self) -> None:
+        self._closed.set()
+        self._flusher.join()
+        with self._lock:
+            self._sync()
+            self._file.close()
+
+    def __enter__(self) -> "SessionLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def _segment_path(directory: str, segment: int) -> str:
+    return os.path.join(directory, f"{SEGMENT_PREFIX}{segment:08d}{SEGMENT_SUFFIX}")
+
+def _snapshot_segment(directory: str) -> int:
+    """First segment not covered by the snapshot (0 without one)"""
+    try:
+        with open(os.path.join(directory, SNAPSHOT_NAME), "rb") as f:
+            length, checksum = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+            payload = f.read(length)
+    except (OSError, struct.error):
+        return 0
+    if len(payload) < length or zlib.crc32(payload) != checksum or payload[0] != SNAPSHOT_HEADER:
+        return 0
+    return json.loads(payload[1:])["segment"]
+
+def _segment_numbers(directory: str) -> List[int]:
+    return sorted(
+        int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+        for name in os.listdir(directory)
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+    )
+
+def _apply(sessions: Dict[str, InterviewSession], event_type: int, body: Dict, ai: MockInterviewAI,
+           skipped: Dict[str, str]) -> None:
+    """Apply one event to the sessions being recovered
+
+    A session whose domain or questions the current bank no longer has is
+    dropped and recorded in skipped (session id -> missing id), and its
+    later events are ignored.
+    """
+    if body["id"] in skipped:
+        return
+    if event_type == SESSION_STARTED:
+        number, follow_ups, difficulty, *adaptive = body["settings"]
+        settings = InterviewSettings(number, follow_ups, Difficulty(difficulty), bool(adaptive and adaptive[0]))
+        try:
+            domain = ai.get_domain(body["domain"])
+            questions = ai.resolve_questions(domain, body["skills"], settings, body["seed"], body["questions"])
+        except KeyError as error:
+            _skip(sessions, skipped, body["id"], error)
+            return
+        sessions[body["id"]] = InterviewSession.restore(
+            session_id=body["id"],
+            domain=domain,
+            skills=body["skills"],
+            settings=settings,
+            seed=body["seed"],
+            questions=questions,
+            start_time=from_micros(body["start"]),
+            ai=ai,
+            clusters=body.get("clusters", ())
+        )
+    elif event_type == ANSWER_SUBMITTED:
+        session = sessions.get(body["id"])
+        question = session.get_current_question() if session is not None else None
+        if question is not None and body.get("question", question.id) != question.id:
+            # The bank changed since this adaptive question was picked
+            try:
+                question = ai.find_question(body["question"])
+            except KeyError as error:
+                _skip(sessions, skipped, body["id"], error)
+                return
+            session.questions[session.current_question_index] = question
+        if question is not None:
+            session.append_answer(Answer(
+                question=question,
+                text=body["text"],
+                timestamp=from_micros(body["at"]),
+                follow_ups=tuple((key, answer) for key, answer in body["follow_ups"])
+            ), body.get("quality"))
+    elif event_type == ENDED_EARLY:
+        session = sessions.get(body["id"])
+        if session is not None:
+            session.is_ended_early = True
+            session.end_time = from_micros(body["at"])
+
+def _skip(sessions: Dict[str, InterviewSession], skipped: Dict[str, str], session_id: str, error: KeyError) -> None:
+    sessions.pop(session_id, None)
+    skipped[session_id] = error.args[0]
+    logger.warning("Skipping session %s on recovery: %r is not in the current question bank",
+                   session_id, error.args[0])
+
+def recover(directory: str, ai: Optional[MockInterviewAI] = None,
+            skipped: Optional[Dict[str, str]] = None) -> Dict[str, InterviewSession]:
+    """Rebuild sessions by replaying the snapshot and every later segment
+
+    Sessions referring to a domain or question the bank no longer has are
+    left out with a logged warning; pass a dict as skipped to collect their
+    ids (each mapped to the missing domain or question id).
+    """
+    ai = ai or get_default_ai()
+    if skipped is None:
+        skipped = {}
+    sessions: Dict[str, InterviewSession] = {}
+    if not os.path.isdir(directory):
+        return sessions
+
+    snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+    if os.path.exists(snapshot_path):
+        for event_type, body in read_records(snapshot_path):
+            if event_type != SNAPSHOT_HEADER:
+                _apply(sessions, event_type, body, ai, skipped)
+
+    # Segments older than the snapshot survive only if compaction was interrupted
+    first_segment = _snapshot_segment(directory)
+    for segment in _segment_numbers(directory):
+        if segment >= first_segment:
+            for event_type, body in read_records(_segment_path(directory, segment)):
+                _apply(sessions, event_type, body, ai, skipped)
+    return sessions
@@ -0,0 +1,171 @@
+"""
+Asyncio session service for Mock Interview AI
+
+AsyncSessionManager serves many InterviewSessions from one event loop.
+Answer submission runs inline: it analyzes the new answer, in time linear in
+its length, and updates the session's running aggregates. Feedback
+generation is offloaded to an executor and works on a summary of the
+session taken when it is requested (with a ProcessPoolExecutor only that
+summary is sent to the worker). The manager caps live sessions and queued
+feedback requests, and expires sessions that have been idle for too long.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from mock_interview_ai import (
+    Feedback, InterviewDomain, InterviewSession, InterviewSettings, MockInterviewAI,
+    Question, SessionNotFound, get_default_ai
+)
+
+from feedback_executor import score_summary
+
+class ServiceOverloaded(RuntimeError):
+    """Raised when a request would exceed a backpressure limit"""
+
+class _Entry:
+    __slots__ = ("session", "last_active")
+
+    def __init__(self, session: InterviewSession):
+        self.session = session
+        self.last_active = time.monotonic()
+
+class AsyncSessionManager:
+    """Manages concurrent interview sessions on one event loop"""
+
+    def __init__(self, ai: Optional[MockInterviewAI] = None, max_sessions: int = 100000,
+                 max_feedback_concurrency: int = 8, max_feedback_queue: int = 1000,
+                 idle_timeout: float = 1800.0, sweep_interval: float = 60.0,
+                 executor: Optional[Executor] = None):
+        self.ai = ai or get_default_ai()
+        self.max_sessions = max_sessions
+        self.max_feedback_queue = max_feedback_queue
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.executor = executor
+        self._sessions: Dict[str, _Entry] = {}
+        self._feedback_slots = asyncio.Semaphore(max_feedback_concurrency)
+        self._feedback_waiting = 0
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start expiring idle sessions in the background"""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def close(self) -> None:
+        """Stop the background sweeper and drop all sessions"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+        self._sessions.clear()
+
+    async def __aenter__(self) -> "AsyncSessionManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def create_session(self, domain: InterviewDomain, skills: List[str], settings: InterviewSettings,
+                             seed: Optional[int] = None) -> str:
+        """Start a session and return its id"""
+        if len(self._sessions) >= self.max_sessions:
+            self.expire_idle()
+            if len(self._sessions) >= self.max_sessions:
+                raise ServiceOverloaded(f"Session limit of {self.max_sessions} reached")
+        session = InterviewSession(domain, skills, settings, ai=self.ai, seed=seed)
+        self._sessions[session.session_id] = _Entry(session)
+        return session.session_id
+
+    def get_session(self, session_id: str) -> InterviewSession:
+        """Get a live session and mark it active"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            raise SessionNotFound(session_id)
+        entry.last_active = time.monotonic()
+        return entry.session
+
+    async def get_current_question(self, session_id: str) -> Optional[Question]:
+        """Get the current question of a session"""
+        return self.get_session(session_id).get_current_question()
+
+    async def get_follow_up_questions(self, session_id: str, answer_text: Optional[str] = None,
+                                      strategy: str = "most_relevant") -> List[str]:
+        """Get follow-up questions for the current question of a session"""
+        return self.get_session(session_id).get_follow_up_questions(answer_text=answer_text, strategy=strategy)
+
+    async def submit_answer(self, session_id: str, answer_text: str,
+                            follow_up_answers: Optional[List[Dict[str, str]]] = None) -> bool:
+        """Submit an answer without blocking the loop"""
+        return self.get_session(session_id).submit_answer(answer_text, follow_up_answers)
+
+    async def get_provisional_score(self, session_id: str) -> int:
+        """Score of a session's answers so far, in O(1)"""
+        return self.get_session(session_id).provisional_score()
+
+    async def end_interview_early(self, session_id: str) -> bool:
+        """End a session early"""
+        return self.get_session(session_id).end_interview_early()
+
+    async def generate_feedback(self, session_id: str) -> Feedback:
+        """Generate feedback in the executor, queueing behind a concurrency limit
+
+        Feedback already in the AI's feedback cache is returned without
+        queueing. The session is summarized (and fingerprinted) before
+        waiting, so answers submitted meanwhile neither change the feedback
+        nor get it cached under the wrong fingerprint.
+        """
+        session = self.get_session(session_id)
+        summary = session.summary()
+        cache = self.ai.feedback_cache
+        if cache is not None:
+            fingerprint = session.fingerprint()
+            feedback = cache.get(fingerprint)
+            if feedback is not None:
+                return feedback
+        if self._feedback_waiting >= self.max_feedback_queue:
+            raise ServiceOverloaded(f"Feedback queue of {self.max_feedback_queue} is full")
+        self._feedback_waiting += 1
+        try:
+            await self._feedback_slots.acquire()
+        finally:
+            self._feedback_waiting -= 1
+        try:
+            loop = asyncio.get_running_loop()
+            if isinstance(self.executor, ProcessPoolExecutor):
+                feedback = await loop.run_in_executor(self.executor, score_summary, summary)
+            else:
+                feedback = await loop.run_in_executor(self.executor, self.ai.feedback_from_summary, summary)
+        finally:
+            self._feedback_slots.release()
+        if cache is not None:
+            cache.put(fingerprint, feedback)
+        return feedback
+
+    async def close_session(self, session_id: str) -> None:
+        """Forget a session"""
+        if self._sessions.pop(session_id, None) is None:
+            raise SessionNotFound(session_id)
+
+    def expire_idle(self) -> int:
+        """Drop sessions idle for longer than idle_timeout and return how many were dropped"""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [session_id for session_id, entry in self._sessions.items() if entry.last_active < cutoff]
+        for session_id in expired:
+            del self._sessions[session_id]
+        return len(expired)
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.expire_idle()
@@ -0,0 +1,304 @@
+"""
+Sharded session stores for Mock Interview AI
+
+A SessionStore spreads sessions over N shards by consistent hashing of the
+session id (HashRing, with virtual nodes so adding a shard moves only about
+1/N of the sessions). Each shard has its own write lock, taken only to
+change a session (submitting an answer, ending early, picking an adaptive
+question) or to generate its feedback; reading a session or its question list takes no lock, as the
+questions already asked never change.
+
+InMemorySessionStore keeps the live sessions of one process.
+DiskSessionStore keeps every session as one file in the binary format under
+its shard's directory and can be shared by several worker processes: files
+are fsynced and replaced atomically, so readers never see a partial write,
+and writers serialize per shard with a lock file (flock) plus a thread lock.
+"""
+
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from mock_interview_ai import (
+    Feedback, InterviewDomain, InterviewSession, InterviewSettings, MockInterviewAI, Question, SessionNotFound,
+    get_default_ai
+)
+
+from binary_format import FormatError
+
+try:
+    import fcntl
+except ImportError:  # not POSIX: the disk store is then safe across threads only
+    fcntl = None
+
+DEFAULT_SHARDS = 16
+VIRTUAL_NODES = 64
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+class HashRing:
+    """Consistent hashing of keys onto named shards"""
+
+    def __init__(self, shards: Sequence[str], virtual_nodes: int = VIRTUAL_NODES):
+        if not shards:
+            raise ValueError("A hash ring needs at least one shard")
+        self.shards = list(shards)
+        points = sorted((_hash64(f"{shard}#{replica}"), index)
+                        for index, shard in enumerate(self.shards) for replica in range(virtual_nodes))
+        self._points = [point for point, _ in points]
+        self._owners = [index for _, index in points]
+
+    def shard_for(self, key: str) -> int:
+        """Index of the shard owning a key"""
+        position = bisect_right(self._points, _hash64(key))
+        return self._owners[position % len(self._points)]
+
+def shard_names(count: int) -> List[str]:
+    return [f"shard-{i:03d}" for i in range(count)]
+
+class SessionStore(ABC):
+    """Sessions sharded by id, with per-shard write locks and lock-free reads
+
+    Backends implement _load, _save, _delete and _session_ids per shard, and
+    may extend _write_lock.
+    """
+
+    def __init__(self, num_shards: int = DEFAULT_SHARDS, ai: Optional[MockInterviewAI] = None):
+        self.ai = ai or get_default_ai()
+        self.ring = HashRing(shard_names(num_shards))
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+
+    @property
+    def num_shards(self) -> int:
+        return len(self.ring.shards)
+
+    def shard_for(self, session_id: str) -> int:
+        return self.ring.shard_for(session_id)
+
+    def create(self, domain: InterviewDomain, skills: List[str], settings: InterviewSettings,
+               seed: Optional[int] = None, session_id: Optional[str] = None) -> str:
+        """Start a session and return its id"""
+        session = InterviewSession(domain, skills, settings, ai=self.ai, seed=seed, session_id=session_id)
+        self.add(session)
+        return session.session_id
+
+    def add(self, session: InterviewSession) -> None:
+        """Store an existing session (replacing any with the same id)"""
+        shard = self.shard_for(session.session_id)
+        with self._write_lock(shard):
+            self._save(shard, session)
+
+    def get(self, session_id: str) -> InterviewSession:
+        """Read a session without locking"""
+        session = self._load(self.shard_for(session_id), session_id)
+        if session is None:
+            raise SessionNotFound(session_id)
+        return session
+
+    def questions(self, session_id: str) -> Tuple[Question, ...]:
+        """The questions a session has selected so far, read without locking"""
+        return tuple(self.get(session_id).questions)
+
+    def get_current_question(self, session_id: str) -> Optional[Question]:
+        """The current question, read without locking unless an adaptive session has to pick it"""
+        session = self.get(session_id)
+        if session.current_question_index < len(session.questions) or session.adaptive is None:
+            return session.get_current_question()
+        return self._update(session_id, InterviewSession.get_current_question)
+
+    def submit_answer(self, session_id: str, answer_text: str,
+                      follow_up_answers: Optional[List[Dict[str, str]]] = None) -> bool:
+        """Submit an answer under the session's shard lock"""
+        return self._update(session_id, lambda session: session.submit_answer(answer_text, follow_up_answers))
+
+    def end_interview_early(self, session_id: str) -> bool:
+        return self._update(session_id, InterviewSession.end_interview_early)
+
+    def generate_feedback(self, session_id: str) -> Feedback:
+        """Generate a session's feedback under its shard lock, from a consistent view of its answers
+
+        The in-memory backend hands out the live session, so the feedback is
+        computed before the lock is released rather than from a session a
+        concurrent submit_answer may be changing.
+        """
+        shard = self.shard_for(session_id)
+        with self._write_lock(shard):
+            session = self._load(shard, session_id)
+            if session is None:
+                raise SessionNotFound(session_id)
+            return session.generate_feedback()
+
+    def delete(self, session_id: str) -> bool:
+        """Remove a session, returning whether it existed"""
+        shard = self.shard_for(session_id)
+        with self._write_lock(shard):
+            return self._delete(shard, session_id)
+
+    def session_ids(self) -> Iterator[str]:
+        for shard in range(self.num_shards):
+            yield from self._session_ids(shard)
+
+    def __contains__(self, session_id: str) -> bool:
+        return self._load(self.shard_for(session_id), session_id) is not None
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.session_ids())
+
+    def _update(self, session_id: str, change):
+        """Apply change(session) under the shard's write lock and save the session"""
+        shard = self.shard_for(session_id)
+        with self._write_lock(shard):
+            session = self._load(shard, session_id)
+            if session is None:
+                raise SessionNotFound(session_id)
+            result = change(session)
+            self._save(shard, session)
+        return result
+
+    @contextmanager
+    def _write_lock(self, shard: int) -> Iterator[None]:
+        with self._locks[shard]:
+            yield
+
+    @abstractmethod
+    def _load(self, shard: int, session_id: str) -> Optional[InterviewSession]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _save(self, shard: int, session: InterviewSession) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, shard: int, session_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _session_ids(self, shard: int) -> Iterator[str]:
+        raise NotImplementedError
+
+class InMemorySessionStore(SessionStore):
+    """Live session objects of one process, one dict per shard"""
+
+    def __init__(self, num_shards: int = DEFAULT_SHARDS, ai: Optional[MockInterviewAI] = None):
+        super().__init__(num_shards, ai)
+        self._shards: List[Dict[str, InterviewSession]] = [{} for _ in range(num_shards)]
+
+    def _load(self, shard: int, session_id: str) -> Optional[InterviewSession]:
+        return self._shards[shard].get(session_id)
+
+    def _save(self, shard: int, session: InterviewSession) -> None:
+        self._shards[shard][session.session_id] = session
+
+    def _delete(self, shard: int, session_id: str) -> bool:
+        return self._shards[shard].pop(session_id, None) is not None
+
+    def _session_ids(self, shard: int) -> Iterator[str]:
+        return iter(list(self._shards[shard]))
+
+class DiskSessionStore(SessionStore):
+    """Sessions as binary files under one directory per shard, shareable across processes
+
+    Layout: directory/shard-NNN/<session id>.bin plus a .lock file per shard.
+    Every read decodes the file, so each process sees the others' writes. A
+    file that fails to decode raises FormatError rather than reading as absent.
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(self, directory: str, num_shards: int = DEFAULT_SHARDS, ai: Optional[MockInterviewAI] = None):
+        super().__init__(num_shards, ai)
+        self.directory = directory
+        self._lock_files: Dict[int, int] = {}
+        for name in self.ring.shards:
+            os.makedirs(os.path.join(directory, name), exist_ok=True)
+
+    def close(self) -> None:
+        for fd in self._lock_files.values():
+            os.close(fd)
+        self._lock_files.clear()
+
+    def __enter__(self) -> "DiskSessionStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def rebalance(self) -> int:
+        """Move sessions left on another shard by a change of shard count; returns how many moved
+
+        Run it while no other process writes to the store.
+        """
+        moved = 0
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if not name.startswith("shard-") or not os.path.isdir(path):
+                continue
+            for file_name in os.listdir(path):
+                if not file_name.endswith(self.SUFFIX):
+                    continue
+                session_id = file_name[:-len(self.SUFFIX)]
+                target = self._path(self.shard_for(session_id), session_id)
+                if os.path.join(path, file_name) != target:
+                    os.replace(os.path.join(path, file_name), target)
+                    moved += 1
+        return moved
+
+    @contextmanager
+    def _write_lock(self, shard: int) -> Iterator[None]:
+        with self._locks[shard]:
+            if fcntl is None:
+                yield
+                return
+            fd = self._lock_files.get(shard)
+            if fd is None:
+                fd = self._lock_files[shard] = os.open(
+                    os.path.join(self.directory, self.ring.shards[shard], ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _path(self, shard: int, session_id: str) -> str:
+        if not session_id or os.sep in session_id or session_id.startswith("."):
+            raise SessionNotFound(session_id)
+        return os.path.join(self.directory, self.ring.shards[shard], session_id + self.SUFFIX)
+
+    def _load(self, shard: int, session_id: str) -> Optional[InterviewSession]:
+        path = self._path(shard, session_id)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            return InterviewSession.from_bytes(data, self.ai)
+        except FormatError as error:
+            # Reading a damaged file as absent would have callers recreate the session over it
+            raise FormatError(f"Corrupt session file {path}: {error}") from error
+
+    def _save(self, shard: int, session: InterviewSession) -> None:
+        path = self._path(shard, session.session_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(session.to_bytes())
+            f.flush()
+            os.fsync(f.fileno())  # so a crash after the replace never leaves an empty or partial file
+        os.replace(tmp_path, path)
+
+    def _delete(self, shard: int, session_id: str) -> bool:
+        try:
+            os.remove(self._path(shard, session_id))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _session_ids(self, shard: int) -> Iterator[str]:
+        for file_name in os.listdir(os.path.join(self.directory, self.ring.shards[shard])):
+            if file_name.endswith(self.SUFFIX):
+                yield file_name[:-len(self.SUFFIX)]
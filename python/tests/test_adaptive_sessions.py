@@ -0,0 +1,78 @@
+from mock_interview_ai import (
+    Difficulty, InterviewDomain, InterviewSession, InterviewSettings, MockInterviewAI, Question, QuestionType,
+    build_registry
+)
+
+import session_log
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+ANSWER = "I would put a read-through cache in front of the store and evict by recency"
+
+def _ai():
+    """A bank where every question has a near-duplicate"""
+    bank = {}
+    for skill in "AB":
+        bank[skill] = [
+            Question(f"{skill}-{i}", f"Explain how you would design the {skill} cache layer number {i % 5} for "
+                                     f"a service with heavy read traffic and eviction" + (" please" if i >= 5 else ""),
+                     QuestionType.TECHNICAL, Difficulty.MEDIUM, skill, ("Why?",))
+            for i in range(10)
+        ]
+    domain = InterviewDomain("caching", "Caching", "", "", ["A", "B"])
+    return MockInterviewAI(registry=build_registry([domain], bank, detect_duplicates=True))
+
+def _new_session(ai, seed):
+    settings = InterviewSettings(number_of_questions=8, difficulty=Difficulty.MIXED, adaptive=True)
+    return InterviewSession(ai.domains[0], ["A", "B"], settings, ai=ai, seed=seed)
+
+def _finish(session):
+    asked = []
+    while session.get_current_question() is not None:
+        asked.append(session.get_current_question().id)
+        session.submit_answer(ANSWER)
+    return asked
+
+def _asked_before(session, answers):
+    asked = []
+    for _ in range(answers):
+        asked.append(session.get_current_question().id)
+        session.submit_answer(ANSWER)
+    return asked
+
+def test_binary_round_trip_keeps_asked_clusters():
+    ai = _ai()
+    for seed in range(5):
+        expected = _finish(_new_session(ai, seed))
+        session = _new_session(ai, seed)
+        asked = _asked_before(session, 3)
+        restored = InterviewSession.from_bytes(session.to_bytes(), ai)
+        assert restored.adaptive.clusters == session.adaptive.clusters
+        assert asked + _finish(restored) == expected
+
+def test_log_snapshot_keeps_asked_clusters(tmp_path):
+    ai = _ai()
+    expected = _finish(_new_session(ai, 3))
+    session = _new_session(ai, 3)
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.record_start(session)
+        asked = []
+        for _ in range(3):
+            asked.append(session.get_current_question().id)
+            log.submit_answer(session, ANSWER)
+        log.snapshot([session])
+    recovered = session_log.recover(str(tmp_path), ai)[session.session_id]
+    assert asked + _finish(recovered) == expected
+
+def test_restore_loads_only_the_asked_questions(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(10 ** 4))
+    settings = InterviewSettings(number_of_questions=8, difficulty=Difficulty.MIXED, adaptive=True)
+    session = InterviewSession(ai.domains[0], SKILLS[:3], settings, ai=ai, seed=2)
+    _asked_before(session, 4)
+    data = session.to_bytes()
+
+    loaded = []
+    load = ai.question_bank.load
+    monkeypatch.setattr(ai.question_bank, "load", lambda handle: loaded.append(handle) or load(handle))
+    restored = InterviewSession.from_bytes(data, ai)
+    assert [question.id for question in restored.questions] == [question.id for question in session.questions]
+    assert len(loaded) == len(session.questions)
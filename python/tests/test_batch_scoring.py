@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from mock_interview_ai import CounterRandom, InterviewSession, InterviewSettings, MockInterviewAI, np, stream_seed
+
+from batch_scoring import score_sessions
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+WORDS = ("latency", "cache", "index", "queue", "replica", "shard", "I", "we", "measured", "reduced", "the")
+
+def _sessions(ai, count=60):
+    rng = random.Random(11)
+    sessions = []
+    for seed in range(count):
+        skills = rng.sample(SKILLS, rng.randint(1, 4))
+        session = InterviewSession(ai.domains[0], skills, InterviewSettings(number_of_questions=6), ai=ai,
+                                   seed=seed * 7919)
+        for _ in range(rng.randint(0, 6)):
+            follow_ups = [{"question": f"follow-up {i}", "answer": "yes"} for i in range(rng.randint(0, 3))]
+            session.submit_answer(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 120))), follow_ups)
+        sessions.append(session)
+    return sessions
+
+def _columns(sessions):
+    return ([len(session.answers) for session in sessions], [session.length_sum for session in sessions],
+            [session.follow_up_sum for session in sessions], [len(session.skills) for session in sessions],
+            [session.seed for session in sessions])
+
+@pytest.mark.parametrize("vectorized", [
+    False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="needs NumPy"))])
+def test_batch_feedback_matches_session_feedback(vectorized):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = _sessions(ai)
+    batch = score_sessions(*_columns(sessions), vectorized=vectorized,
+                           skill_adjustments=[session.skill_adjustments() for session in sessions])
+    assert len(batch) == len(sessions)
+    for index, session in enumerate(sessions):
+        assert batch.feedback(index, session.domain, session.skills, ai) == session.generate_feedback()
+
+@pytest.mark.parametrize("vectorized", [
+    False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="needs NumPy"))])
+def test_batch_scores_without_adjustments_use_the_session_jitter(vectorized):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = _sessions(ai)
+    batch = score_sessions(*_columns(sessions), vectorized=vectorized)
+    for index, session in enumerate(sessions):
+        expected = ai.feedback_from_metrics(len(session.answers), session.length_sum, session.follow_up_sum,
+                                            session.domain, session.skills,
+                                            CounterRandom(stream_seed(session.seed, "feedback")))
+        assert batch.scores[index] == expected.score
+        assert batch.skill_scores_for(index) == [skill.score for skill in expected.skill_breakdown]
+
+def test_skill_adjustment_rows_must_match_the_batch():
+    with pytest.raises(ValueError):
+        score_sessions([1], [100], [0], [2], [5], skill_adjustments=[])
@@ -0,0 +1,85 @@
+import datetime
+import struct
+
+import pytest
+
+from mock_interview_ai import Answer, InterviewSession, InterviewSettings, MockInterviewAI, get_default_ai
+
+import binary_format
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+def _answered_session(ai, seed=1, **settings):
+    session = InterviewSession(ai.domains[0], SKILLS[:3], InterviewSettings(number_of_questions=6, **settings),
+                               ai=ai, seed=seed)
+    for text in ("I would use a heap keyed on distance", "binary search over the sorted keys", "no idea"):
+        session.submit_answer(text)
+    return session
+
+def test_session_round_trip_restores_aggregates_without_analysis(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _answered_session(ai)
+    data = session.to_bytes()
+
+    def analyze(question, text):
+        raise AssertionError("decoding analyzed an answer")
+    monkeypatch.setattr(ai.analyzer, "analyze", analyze)
+    restored = InterviewSession.from_bytes(data, ai)
+    assert [question.id for question in restored.questions] == [question.id for question in session.questions]
+    assert restored.qualities == session.qualities
+    assert restored.skill_tallies == session.skill_tallies
+    assert restored.compute_feedback() == session.compute_feedback()
+
+def test_version_1_sessions_are_still_read():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _answered_session(ai)
+    data = bytearray(session.to_bytes())
+    struct.pack_into("<B", data, 2, 1)
+    del data[-(8 * len(session.answers) + 4):]  # the qualities and the empty cluster list
+    restored = InterviewSession.from_bytes(bytes(data), ai)
+    assert restored.skill_tallies == session.skill_tallies
+
+def test_unknown_format_version_is_rejected():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    data = bytearray(_answered_session(ai).to_bytes())
+    struct.pack_into("<B", data, 2, binary_format.FORMAT_VERSION + 1)
+    with pytest.raises(binary_format.FormatError):
+        InterviewSession.from_bytes(bytes(data), ai)
+
+def test_answer_and_feedback_round_trip():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _answered_session(ai, include_follow_ups=True)
+    session.end_interview_early()
+    restored = InterviewSession.from_bytes(session.to_bytes(), ai)
+    assert restored.answers == session.answers
+    assert (restored.is_ended_early, restored.end_time) == (session.is_ended_early, session.end_time)
+
+    by_id = {question.id: question for question in session.questions}
+    for answer in session.answers:
+        assert binary_format.answer_from_bytes(binary_format.answer_to_bytes(answer), by_id) == answer
+    feedback = session.generate_feedback()
+    assert binary_format.feedback_from_bytes(binary_format.feedback_to_bytes(feedback)) == feedback
+
+def test_sessions_from_a_changed_bank_resolve_only_their_own_questions(monkeypatch):
+    session = _answered_session(MockInterviewAI(registry=synthetic_registry(1000)))
+    ai = MockInterviewAI(registry=synthetic_registry(5000))  # reselecting from the seed now picks other questions
+    loaded = []
+    load = ai.question_bank.load
+    monkeypatch.setattr(ai.question_bank, "load", lambda handle: loaded.append(handle) or load(handle))
+    restored = InterviewSession.from_bytes(session.to_bytes(), ai)
+    assert [question.id for question in restored.questions] == [question.id for question in session.questions]
+    assert len(loaded) == 2 * len(session.questions)  # the reselection, then one lookup per id
+
+def test_answers_accept_the_pre_slots_constructor():
+    bank = get_default_ai().question_bank
+    question = next(question for skill in bank for question in bank[skill] if question.follow_ups)
+    timestamp = datetime.datetime(2024, 5, 1, 12, 30)
+    follow_up_answers = [{"question": question.follow_ups[0], "answer": "by measuring first"},
+                         {"question": "Anything else?", "answer": "no"}]
+    expected = Answer.create(question, "my answer", timestamp, follow_up_answers)
+    assert expected.follow_ups == ((0, "by measuring first"), ("Anything else?", "no"))
+    assert Answer(question_id=question.id, text="my answer", timestamp=timestamp,
+                  follow_up_answers=follow_up_answers) == expected
+    assert Answer(question.id, "my answer", timestamp, follow_up_answers) == expected
+    assert expected.question_id == question.id
+    assert expected.follow_up_answers == follow_up_answers
+    assert Answer.from_bytes(expected.to_bytes()) == expected
@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from mock_interview_ai import Feedback, InterviewSession, InterviewSettings, MockInterviewAI, SkillFeedback, np
+
+import columnar_export
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+DOMAINS = ("backend", "frontend", "data")
+
+def _rows(count, seed=3):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        skills = rng.sample(SKILLS, rng.randint(0, 3))
+        questions = rng.randint(0, 10)
+        rows.append(dict(
+            domain_id=rng.choice(DOMAINS),
+            feedback=Feedback(rng.randint(0, 100), (), (), "", (),
+                              tuple(SkillFeedback(skill, rng.randint(0, 100), "") for skill in skills)),
+            answers=rng.randint(0, questions),
+            questions=questions,
+            ended_early=rng.random() < 0.2,
+            length_sum=rng.randint(0, 1 << 40),
+            follow_ups=rng.randint(0, 5),
+            start=rng.randint(0, 1 << 52)
+        ))
+    return rows
+
+def _export(directory, rows, layout="npy", chunk_rows=64):
+    with columnar_export.ColumnarWriter(str(directory), chunk_rows, layout) as writer:
+        for row in rows:
+            writer.add_feedback(**row)
+
+def _expected(rows, bins=10, domain=None):
+    """Aggregates of rows computed directly"""
+    rows = [row for row in rows if domain is None or row["domain_id"] == domain]
+    histogram = [0] * bins
+    skill_scores = {}
+    for row in rows:
+        histogram[min(row["feedback"].score * bins // 100, bins - 1)] += 1
+        for skill_feedback in row["feedback"].skill_breakdown:
+            skill_scores.setdefault(skill_feedback.skill, []).append(skill_feedback.score)
+    asked = [row for row in rows if row["questions"]]
+    return dict(
+        sessions=len(rows),
+        score_histogram=histogram,
+        skill_means={skill: sum(scores) / len(scores) for skill, scores in skill_scores.items()},
+        skill_counts={skill: len(scores) for skill, scores in skill_scores.items()},
+        completion_ratio=sum(row["answers"] / row["questions"] for row in asked) / len(asked),
+        early_end_rate=sum(row["ended_early"] for row in rows) / len(rows)
+    )
+
+def _assert_aggregates(result, expected):
+    assert result.sessions == expected["sessions"]
+    assert result.score_histogram == expected["score_histogram"]
+    assert result.skill_counts == expected["skill_counts"]
+    assert result.skill_means == pytest.approx(expected["skill_means"])
+    assert result.completion_ratio == pytest.approx(expected["completion_ratio"])
+    assert result.early_end_rate == pytest.approx(expected["early_end_rate"])
+
+def _read_back(directory):
+    reader = columnar_export.ColumnarReader(str(directory))
+    tables = {}
+    for table in columnar_export.TABLES:
+        columns = tables[table] = {}
+        for chunk in reader.chunks(table):
+            for name, values in chunk.items():
+                columns.setdefault(name, []).extend(int(value) for value in values)
+    return reader, tables
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_npy_export_round_trips(tmp_path, monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(columnar_export, "np", None)
+    rows = _rows(300)
+    _export(tmp_path, rows)
+
+    reader, tables = _read_back(tmp_path)
+    assert len(reader) == 300
+    assert len(reader.chunk_sizes) == 5
+    sessions = tables["sessions"]
+    assert [reader.domains[code] for code in sessions["domain"]] == [row["domain_id"] for row in rows]
+    for name in ("answers", "questions", "length_sum", "follow_ups", "start"):
+        assert sessions[name] == [row[name] for row in rows]
+    assert sessions["score"] == [row["feedback"].score for row in rows]
+    assert sessions["ended_early"] == [int(row["ended_early"]) for row in rows]
+    skills = tables["skills"]
+    assert list(zip(skills["session"], (reader.skills[code] for code in skills["skill"]), skills["score"])) == [
+        (index, skill_feedback.skill, skill_feedback.score)
+        for index, row in enumerate(rows) for skill_feedback in row["feedback"].skill_breakdown
+    ]
+
+@pytest.mark.skipif(np is None, reason="needs NumPy")
+def test_npy_files_written_without_numpy_load_with_numpy(tmp_path, monkeypatch):
+    rows = _rows(50)
+    monkeypatch.setattr(columnar_export, "np", None)
+    _export(tmp_path / "plain", rows)
+    monkeypatch.undo()
+    _export(tmp_path / "numpy", rows)
+    for table, columns in columnar_export.TABLES.items():
+        for name, dtype in columns:
+            plain = np.load(tmp_path / "plain" / "chunk-00000" / table / f"{name}.npy")
+            assert plain.dtype == np.dtype(dtype)
+            assert plain.tolist() == np.load(tmp_path / "numpy" / "chunk-00000" / table / f"{name}.npy").tolist()
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+@pytest.mark.parametrize("domain", [None, "frontend"])
+def test_aggregate_matches_a_direct_computation(tmp_path, monkeypatch, with_numpy, domain):
+    if not with_numpy:
+        monkeypatch.setattr(columnar_export, "np", None)
+    rows = _rows(500)
+    _export(tmp_path, rows, chunk_rows=37)
+    result = columnar_export.aggregate(str(tmp_path), bins=7, domain=domain)
+    _assert_aggregates(result, _expected(rows, bins=7, domain=domain))
+    assert set(result.domain_histograms) == ({domain} if domain else set(DOMAINS))
+
+def test_aggregate_of_an_unknown_domain_is_empty(tmp_path):
+    _export(tmp_path, _rows(20))
+    result = columnar_export.aggregate(str(tmp_path), bins=4, domain="mobile")
+    assert result.sessions == 0
+    assert result.score_histogram == [0] * 4
+
+def test_export_sessions_writes_completed_sessions_only(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = [InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=2), ai=ai, seed=seed)
+                for seed in range(6)]
+    for session in sessions[:4]:
+        while session.submit_answer("a hash map gives constant time lookups"):
+            pass
+    assert columnar_export.export_sessions(sessions, str(tmp_path), chunk_rows=3) == 4
+
+    _, tables = _read_back(tmp_path)
+    assert tables["sessions"]["score"] == [session.generate_feedback().score for session in sessions[:4]]
+    assert tables["sessions"]["answers"] == [2] * 4
+
+def test_arrow_export_matches_npy(tmp_path):
+    pytest.importorskip("pyarrow")
+    rows = _rows(300)
+    _export(tmp_path / "npy", rows)
+    _export(tmp_path / "arrow", rows, layout="arrow")
+    assert _read_back(tmp_path / "arrow")[1] == _read_back(tmp_path / "npy")[1]
+
+def test_arrow_aggregate_matches_a_direct_computation(tmp_path):
+    pytest.importorskip("pyarrow")
+    rows = _rows(300)
+    _export(tmp_path, rows, layout="arrow", chunk_rows=50)
+    _assert_aggregates(columnar_export.aggregate(str(tmp_path)), _expected(rows))
+
+def test_arrow_layout_needs_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar_export, "pa", None)
+    with pytest.raises(RuntimeError):
+        columnar_export.ColumnarWriter(str(tmp_path), layout="arrow")
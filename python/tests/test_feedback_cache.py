@@ -0,0 +1,31 @@
+from dataclasses import replace
+
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI
+
+from benchmarks.synthetic import SKILLS, synthetic_registry
+from feedback_cache import FeedbackCache
+
+def _fingerprint(registry):
+    ai = MockInterviewAI(registry=registry)
+    session = InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=3), ai=ai, seed=7)
+    session.submit_answer("I would keep a hash map from key to node")
+    return session.fingerprint()
+
+def test_fingerprint_changes_with_the_registry_version():
+    registry = synthetic_registry(1000)
+    assert _fingerprint(registry) == _fingerprint(registry)
+    assert _fingerprint(registry) != _fingerprint(replace(registry, version=registry.version + 1))
+
+def test_disk_tier_evicts_least_recently_used_entries(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=3), ai=ai, seed=7)
+    feedback = session.compute_feedback()
+    cache = FeedbackCache(max_entries=1, directory=str(tmp_path), max_disk_entries=2)
+    for key in ("aa01", "bb02", "cc03"):
+        cache.put(key, feedback)
+    assert cache.stats()["disk_entries"] == 2
+    assert cache.evictions == 3  # two from memory, one from disk
+
+    reopened = FeedbackCache(directory=str(tmp_path), max_disk_entries=2)
+    assert reopened.get("aa01") is None
+    assert reopened.get("bb02") == feedback and reopened.get("cc03") == feedback
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI
+
+from benchmarks.synthetic import SKILLS, synthetic_registry
+from feedback_cache import FeedbackCache
+from feedback_executor import FeedbackExecutor
+
+def _sessions(ai, count=12):
+    sessions = []
+    for seed in range(count):
+        session = InterviewSession(ai.domains[0], SKILLS[:3], InterviewSettings(number_of_questions=4), ai=ai,
+                                   seed=seed)
+        for index in range(seed % 5):
+            session.submit_answer(f"answer {index} of session {seed}: a hash map keyed by id, evicted by age")
+        sessions.append(session)
+    return sessions
+
+def test_process_workers_score_against_the_callers_domains(tmp_path):
+    # The synthetic domain only exists in the caller's registry
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = _sessions(ai)
+    expected = [session.compute_feedback() for session in sessions]
+    marker = str(tmp_path / "initialized")
+    with FeedbackExecutor("process", max_workers=2, initializer=os.makedirs, initargs=(marker, 0o755, True),
+                          ai=ai) as executor:
+        assert executor.map(sessions, chunk_size=5) == expected
+        assert [executor.submit(session).result() for session in sessions[:3]] == expected[:3]
+    assert os.path.isdir(marker)
+
+def test_process_mode_uses_the_feedback_cache(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000), feedback_cache=FeedbackCache())
+    sessions = _sessions(ai)
+    expected = [session.compute_feedback() for session in sessions]
+    with FeedbackExecutor("process", max_workers=2, ai=ai) as executor:
+        assert executor.submit(sessions[0]).result() == expected[0]
+        assert executor.map(sessions[:6]) == expected[:6]
+        assert all(ai.feedback_cache.get(session.fingerprint()) == feedback
+                   for session, feedback in zip(sessions[:6], expected))
+
+        def submit(*args):
+            raise AssertionError("cached feedback was sent to a worker")
+        def map(function, chunks):
+            assert not list(chunks), "cached feedback was sent to a worker"
+            return []
+        monkeypatch.setattr(executor._pool, "submit", submit)
+        monkeypatch.setattr(executor._pool, "map", map)
+        assert executor.submit(sessions[1]).result() == expected[1]
+        assert executor.map(sessions[:6]) == expected[:6]
+
+@pytest.mark.parametrize("mode", ["inline", "thread"])
+def test_inline_and_thread_modes_match_session_feedback(mode):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = _sessions(ai)
+    with FeedbackExecutor(mode, max_workers=2, ai=ai) as executor:
+        assert executor.map(sessions) == [session.generate_feedback() for session in sessions]
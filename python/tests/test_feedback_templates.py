@@ -0,0 +1,105 @@
+import itertools
+
+from mock_interview_ai import MockInterviewAI, get_registry
+
+# The feedback text as it was built before the per-bucket template cache
+
+def _skill_feedback(skill, score):
+    if score >= 80:
+        return f"Excellent demonstration of {skill} knowledge with clear examples and deep understanding."
+    elif score >= 65:
+        return f"Good grasp of {skill} concepts with room for more specific examples and technical depth."
+    else:
+        return f"Basic understanding of {skill} shown. Focus on building more hands-on experience and specific examples."
+
+def _strengths(score, domain, follow_ups, avg_length, num_answers):
+    strengths = []
+    if avg_length > 200:
+        strengths.append("Provided detailed and comprehensive answers")
+    if follow_ups > 0:
+        strengths.append("Engaged well with follow-up questions, showing depth of knowledge")
+    if score >= 75:
+        strengths.append(f"Demonstrated strong understanding of {domain.title} concepts")
+    if num_answers >= 3:
+        strengths.append("Maintained professional communication throughout the interview")
+    if avg_length > 300:
+        strengths.append("Showed ability to elaborate on complex topics with specific examples")
+    if num_answers < 5:
+        strengths.append("Made efficient use of time by providing focused answers")
+    return strengths[:4]
+
+def _improvements(score, domain, avg_length, num_answers):
+    improvements = []
+    if avg_length < 150:
+        improvements.append("Provide more detailed explanations with specific examples")
+    if score < 70:
+        improvements.append("Deepen technical knowledge in core areas")
+    if num_answers < 5:
+        improvements.append("Consider completing more questions for comprehensive evaluation")
+    improvements.append("Consider using the STAR method (Situation, Task, Action, Result) for behavioral questions")
+    if avg_length < 200:
+        improvements.append("Include quantifiable results and metrics in your examples")
+    improvements.append("Practice explaining complex concepts in simpler terms")
+    return improvements[:3]
+
+def _overall_feedback(score, domain, follow_ups, avg_length, num_answers):
+    completion_note = f" You completed {num_answers} questions" + (
+        " - consider completing more questions next time for a more comprehensive evaluation."
+        if num_answers < 5 else " which provided a good assessment of your skills."
+    )
+    if score >= 85:
+        return f"Excellent performance! You demonstrated strong expertise in {domain.title} with detailed, well-structured answers.{completion_note} {'Your engagement with follow-up questions showed impressive depth of knowledge. ' if follow_ups > 0 else ''}You're well-prepared for interviews in this domain."
+    elif score >= 70:
+        return f"Good job! You showed solid understanding of {domain.title} concepts and provided thoughtful answers.{completion_note} {'Your detailed responses demonstrate good preparation. ' if avg_length > 200 else ''}With some additional practice on specific examples and technical depth, you'll be very competitive."
+    elif score >= 55:
+        return f"You're on the right track! You have a foundation in {domain.title}, but there's room for improvement.{completion_note} Focus on providing more detailed examples and deepening your technical knowledge. {'Try to engage more with follow-up questions to show your thinking process. ' if follow_ups == 0 else ''}Keep practicing!"
+    else:
+        return f"This interview highlighted areas for growth in {domain.title}.{completion_note} Focus on building stronger foundational knowledge and preparing specific examples from your experience. Consider additional study and practice before your next interview."
+
+def _next_steps(domain, skills, score):
+    steps = []
+    if score < 70:
+        steps.append(f"Review fundamental concepts in {skills[0]} and {skills[1] if len(skills) > 1 else 'core areas'}")
+    steps.append("Practice more behavioral questions using structured frameworks")
+    steps.append("Prepare 3-5 detailed examples from your experience for different question types")
+    if domain.id == "software-engineer":
+        steps.append("Practice coding problems and system design scenarios")
+    elif domain.id == "data-scientist":
+        steps.append("Work on explaining statistical concepts and ML algorithms clearly")
+    elif domain.id == "product-manager":
+        steps.append("Develop case studies showing product thinking and user empathy")
+    steps.append("Record yourself answering questions to improve delivery and confidence")
+    steps.append("Try completing a full interview session for more comprehensive feedback")
+    return steps[:5]
+
+# Values on and around every threshold the text depends on
+SCORES = (0, 54, 55, 56, 64, 65, 66, 69, 70, 71, 74, 75, 76, 79, 80, 81, 84, 85, 86, 100)
+AVG_LENGTHS = (0, 100, 149.5, 150, 150.5, 199.5, 200, 200.5, 250, 299.5, 300, 300.5, 1200)
+FOLLOW_UPS = (0, 1, 7)
+ANSWER_COUNTS = range(1, 9)
+
+def test_cached_feedback_text_matches_the_uncached_text():
+    ai = MockInterviewAI()
+    for domain in get_registry().domains:
+        for skills in (list(domain.skills[:1]), list(domain.skills[:2])):
+            for score, avg_length, follow_ups, num_answers in itertools.product(
+                    SCORES, AVG_LENGTHS, FOLLOW_UPS, ANSWER_COUNTS):
+                skill_scores = [score, 100 - score][:len(skills)]
+                feedback = ai.compose_feedback(score, skill_scores, num_answers, avg_length, follow_ups,
+                                               domain, skills)
+                assert list(feedback.strengths) == _strengths(score, domain, follow_ups, avg_length, num_answers)
+                assert list(feedback.improvements) == _improvements(score, domain, avg_length, num_answers)
+                assert feedback.overall_feedback == _overall_feedback(score, domain, follow_ups, avg_length,
+                                                                      num_answers)
+                assert list(feedback.next_steps) == _next_steps(domain, skills, score)
+                assert [(skill.skill, skill.score, skill.feedback) for skill in feedback.skill_breakdown] == [
+                    (skill, skill_score, _skill_feedback(skill, skill_score))
+                    for skill, skill_score in zip(skills, skill_scores)]
+
+def test_skill_feedback_matches_the_uncached_text_at_every_score():
+    ai = MockInterviewAI()
+    domain = get_registry().domains[0]
+    skills = list(domain.skills[:1])
+    for skill_score in range(101):
+        feedback = ai.compose_feedback(70, [skill_score], 5, 250, 1, domain, skills)
+        assert feedback.skill_breakdown[0].feedback == _skill_feedback(skills[0], skill_score)
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI, np
+
+import follow_up_index
+from benchmarks.synthetic import SKILLS, synthetic_registry
+from follow_up_index import FollowUpIndex
+
+FOLLOW_UPS = [
+    "How would you shard the database as write traffic grows?",
+    "What caching strategy would reduce read latency?",
+    "How do you monitor replication lag between replicas?",
+    "Which metrics tell you the message queue is backing up?",
+    "How would you roll back a failed deployment safely?",
+]
+
+ANSWER = "I would put a cache in front of the database to cut read latency, with a short caching TTL."
+
+def _cosine(index, answer, candidate):
+    query = dict(zip(*index.vectorize(answer)))
+    return sum(query.get(feature, 0.0) * weight for feature, weight in zip(*index.vectorize(candidate)))
+
+def test_strategies_rank_by_similarity_to_the_answer():
+    index = FollowUpIndex(FOLLOW_UPS)
+    assert index.rank(ANSWER, FOLLOW_UPS, 1, "most_relevant") == [FOLLOW_UPS[1]]
+    least = index.rank(ANSWER, FOLLOW_UPS, 2, "least_covered")
+    assert FOLLOW_UPS[1] not in least
+    scores = index.similarities(ANSWER, FOLLOW_UPS)
+    assert all(scores[FOLLOW_UPS.index(text)] == min(scores) for text in least)
+
+def test_ties_keep_candidate_order():
+    index = FollowUpIndex(FOLLOW_UPS)
+    for strategy in follow_up_index.STRATEGIES:
+        assert index.rank("no overlap whatsoever here", FOLLOW_UPS, 3, strategy) == FOLLOW_UPS[:3]
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        FollowUpIndex(FOLLOW_UPS).rank(ANSWER, FOLLOW_UPS, 1, "random")
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_similarities_are_cosines_of_the_tf_idf_vectors(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(follow_up_index, "np", None)
+    index = FollowUpIndex(FOLLOW_UPS)
+    # The last candidate is not indexed and is vectorized on first use
+    candidates = FOLLOW_UPS + ["Would a write-through cache keep the database consistent?"]
+    scores = index.similarities(ANSWER, candidates)
+    assert scores == pytest.approx([_cosine(index, ANSWER, candidate) for candidate in candidates])
+    assert all(0.0 <= score <= 1.0 + 1e-9 for score in scores)
+    assert index.similarities(ANSWER, []) == []
+    assert index.similarities("", candidates) == [0.0] * len(candidates)
+
+@pytest.mark.skipif(np is None, reason="needs NumPy")
+def test_numpy_and_python_rankings_agree(monkeypatch):
+    answers = [ANSWER, "Replication lag shows in the replica metrics", "We sharded writes by tenant id"]
+    vectorized = FollowUpIndex(FOLLOW_UPS)
+    expected = [(vectorized.similarities(answer, FOLLOW_UPS),
+                 [vectorized.rank(answer, FOLLOW_UPS, 2, strategy) for strategy in follow_up_index.STRATEGIES])
+                for answer in answers]
+    monkeypatch.setattr(follow_up_index, "np", None)
+    plain = FollowUpIndex(FOLLOW_UPS)
+    for answer, (scores, rankings) in zip(answers, expected):
+        assert plain.similarities(answer, FOLLOW_UPS) == pytest.approx(scores)
+        assert [plain.rank(answer, FOLLOW_UPS, 2, strategy) for strategy in follow_up_index.STRATEGIES] == rankings
+
+def test_idf_weighs_rare_features_higher():
+    texts = FOLLOW_UPS + ["When does the database become the bottleneck?"]
+    index = FollowUpIndex(texts)
+    common, = follow_up_index.features("database")
+    rare, = follow_up_index.features("deployment")
+    assert index.idf(rare) > index.idf(common)
+    assert index.idf(follow_up_index._feature(("unseen",))) == pytest.approx(math.log(len(texts) + 1) + 1)
+
+def test_session_follow_ups_by_answer_are_stable():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=3), ai=ai, seed=9)
+    question = session.get_current_question()
+    for strategy in follow_up_index.STRATEGIES:
+        picked = session.get_follow_up_questions(answer_text=ANSWER, strategy=strategy)
+        assert picked == session.get_follow_up_questions(answer_text=ANSWER, strategy=strategy)
+        assert picked and set(picked) <= set(question.follow_ups)
+        assert picked == ai.follow_up_index.rank(ANSWER, question.follow_ups, len(picked), strategy)
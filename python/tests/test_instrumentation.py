@@ -0,0 +1,34 @@
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI
+
+import instrumentation
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+def test_hooks_count_selected_questions_and_time_direct_feedback():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    metrics = instrumentation.enable()
+    try:
+        session = InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=4), ai=ai, seed=3)
+        session.submit_answer("an answer")
+        session.compute_feedback()
+    finally:
+        instrumentation.disable()
+    snapshot = metrics.snapshot()
+    counters = snapshot["counters"]
+    assert counters["questions_selected"] == 4
+    # two draws order the skills, two pick their first questions, the rest fill or are rejected
+    assert counters["sampler_draws"] == 2 + 2 + 2 + counters["sampler_rejections"]
+    assert snapshot["timings"]["session_compute_feedback"]["count"] == 1
+    assert not hasattr(InterviewSession.compute_feedback, "__wrapped__")  # disable() removed the hooks
+
+def test_sampler_rejections_show_the_scan_cost_of_a_small_pool():
+    ai = MockInterviewAI(registry=synthetic_registry(len(SKILLS) * 9))  # one question per key
+    metrics = instrumentation.enable()
+    try:
+        for seed in range(20):
+            ai.generate_questions(ai.domains[0], SKILLS[:1], InterviewSettings(number_of_questions=9), seed=seed)
+    finally:
+        instrumentation.disable()
+    counters = metrics.snapshot()["counters"]
+    assert counters["questions_selected"] == 20 * 9
+    assert counters["sampler_rejections"] > 0
+    assert counters["sampler_draws"] == 20 * (1 + 9) + counters["sampler_rejections"]
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+import mock_interview_ai
+from mock_interview_ai import (
+    Difficulty, InterviewDomain, InterviewSession, InterviewSettings, MockInterviewAI, Question, QuestionType,
+    build_registry, get_registry, reload_registry
+)
+
+import near_duplicates
+from benchmarks.bench_near_duplicates import GeneratedTextBank
+
+WORDS = [f"word{i}" for i in range(500)]
+
+def _bank():
+    """Ten distinct questions per skill, each with a one-word variant"""
+    bank = {}
+    for skill in ("Caching", "Queues"):
+        questions = []
+        for i in range(10):
+            text = " ".join(random.Random(f"{skill}-{i}").choices(WORDS, k=20))
+            questions.append(Question(f"{skill}-{i}", text, QuestionType.TECHNICAL, Difficulty.MEDIUM, skill, ()))
+            questions.append(Question(f"{skill}-{i}b", text + " please", QuestionType.TECHNICAL, Difficulty.MEDIUM,
+                                      skill, ()))
+        bank[skill] = questions
+    return bank
+
+DOMAIN = InterviewDomain("ops", "Operations", "", "", ("Caching", "Queues"))
+
+def _clusters_by_id(registry):
+    bank = registry.question_bank
+    return {bank.load(handle).id: bank.load(representative).id
+            for handle, representative in registry.duplicates.items()}
+
+def test_variants_cluster_with_their_original():
+    clusters = _clusters_by_id(build_registry([DOMAIN], _bank(), detect_duplicates=True))
+    for skill in ("Caching", "Queues"):
+        for i in range(10):
+            assert clusters[f"{skill}-{i}b"] == clusters[f"{skill}-{i}"]
+    assert len(set(clusters.values())) == 20
+
+def test_vectorized_detection_matches_the_pure_python_path(monkeypatch):
+    bank = GeneratedTextBank(3000, dup_every=7)
+    expected = near_duplicates.find_duplicates(bank)
+    assert expected
+    monkeypatch.setattr(near_duplicates, "np", None)
+    assert near_duplicates.find_duplicates(bank) == expected
+
+def test_signature_arrays_match_scalar_signatures():
+    if near_duplicates.np is None:
+        pytest.skip("the vectorized path needs NumPy")
+    questions = [GeneratedTextBank(200).load(handle) for handle in range(200)]
+    questions.append(Question("empty", "", QuestionType.TECHNICAL, Difficulty.EASY, "s", ("", "ok")))
+    assert near_duplicates.signatures(questions) == [near_duplicates.signature(near_duplicates.shingles(q))
+                                                     for q in questions]
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_selection_never_asks_two_questions_of_a_cluster(adaptive):
+    registry = build_registry([DOMAIN], _bank(), detect_duplicates=True)
+    ai = MockInterviewAI(registry=registry)
+    settings = InterviewSettings(number_of_questions=10, difficulty=Difficulty.MIXED, adaptive=adaptive)
+    clusters = _clusters_by_id(registry)
+    for seed in range(30):
+        session = InterviewSession(DOMAIN, ["Caching", "Queues"], settings, ai=ai, seed=seed)
+        asked = []
+        while session.get_current_question() is not None:
+            asked.append(session.get_current_question().id)
+            session.submit_answer("an answer")
+        assert len(asked) == 10
+        assert len({clusters.get(question_id, question_id) for question_id in asked}) == 10
+
+def test_reload_registry_passes_the_threshold(monkeypatch):
+    thresholds = []
+    monkeypatch.setattr(near_duplicates, "find_duplicates",
+                        lambda bank, threshold: thresholds.append(threshold) or {})
+    previous = get_registry()
+    try:
+        reload_registry(domains=[DOMAIN], question_bank=_bank(), detect_duplicates=True, duplicate_threshold=0.9)
+    finally:
+        mock_interview_ai._publish_registry(previous)
+    assert thresholds == [0.9]
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from mock_interview_ai import Difficulty, Question, QuestionBank, QuestionType
+
+from question_bank_file import JsonlQuestionBank, write_question_bank
+
+def _questions(count):
+    return [Question(f"q-{i:03d}", f"Question number {i:03d}", QuestionType.TECHNICAL, Difficulty.EASY,
+                     "AB"[i % 2], ()) for i in range(count)]
+
+def test_index_is_rebuilt_after_lines_are_reordered_in_place(tmp_path):
+    path = str(tmp_path / "bank.jsonl")
+    write_question_bank(path, _questions(20))
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        lines = f.readlines()
+    with open(path, "wb") as f:
+        f.writelines(lines[1:] + lines[:1])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # same size and mtime
+
+    with JsonlQuestionBank(path) as bank:
+        for skill in "AB":
+            assert {question.skill for question in bank[skill]} == {skill}
+
+def test_find_reads_the_id_table(tmp_path, monkeypatch):
+    path = str(tmp_path / "bank.jsonl")
+    write_question_bank(path, _questions(50))
+    with JsonlQuestionBank(path) as bank:
+        loaded = []
+        original_load = bank.load
+        monkeypatch.setattr(bank, "load", lambda handle: loaded.append(handle) or original_load(handle))
+        assert bank.find("q-037").text == "Question number 037"
+        assert len(loaded) == 1
+        with pytest.raises(KeyError):
+            bank.find("missing")
+
+def test_question_banks_must_implement_load():
+    with pytest.raises(TypeError):
+        QuestionBank()
@@ -0,0 +1,25 @@
+import pytest
+
+from mock_interview_ai import Difficulty, InterviewSettings, MockInterviewAI, build_registry, np
+
+from benchmarks.synthetic import SKILLS, SyntheticQuestionBank, synthetic_domain
+
+@pytest.mark.parametrize("difficulty", [Difficulty.MIXED, Difficulty.HARD])
+@pytest.mark.parametrize("bank_size", [100, 10 ** 4])
+def test_batch_selection_equals_scalar_selection(bank_size, difficulty):
+    domain = synthetic_domain()
+    ai = MockInterviewAI(registry=build_registry([domain], SyntheticQuestionBank(bank_size)))
+    settings = InterviewSettings(number_of_questions=8, difficulty=difficulty)
+    seeds = list(range(200)) + [2 ** 64 - 1, -5]
+    batch = ai.generate_questions_batch(domain, SKILLS[:3], settings, len(seeds), seeds)
+    assert batch == [ai.generate_questions(domain, SKILLS[:3], settings, seed=seed) for seed in seeds]
+
+@pytest.mark.skipif(np is None, reason="the vectorized path needs NumPy")
+def test_batch_selection_equals_scalar_selection_with_near_duplicates():
+    domain = synthetic_domain()
+    bank = SyntheticQuestionBank(100)
+    ai = MockInterviewAI(registry=build_registry([domain], bank, detect_duplicates=True))
+    settings = InterviewSettings(number_of_questions=8, difficulty=Difficulty.MIXED)
+    seeds = list(range(100))
+    batch = ai.generate_questions_batch(domain, SKILLS[:2], settings, len(seeds), seeds)
+    assert batch == [ai.generate_questions(domain, SKILLS[:2], settings, seed=seed) for seed in seeds]
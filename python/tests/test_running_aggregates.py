@@ -0,0 +1,37 @@
+import random
+
+from mock_interview_ai import CounterRandom, InterviewSession, InterviewSettings, MockInterviewAI, stream_seed
+
+from answer_analysis import skill_adjustments
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+WORDS = ("when", "i", "was", "at", "my", "previous", "team", "we", "reduced", "latency", "cache", "index",
+         "queue", "as", "a", "result", "the", "shard", "replica", "decided", "to", "measure")
+
+def _check_against_recompute(session):
+    ai = session.ai
+    answers = session.answers
+    assert session.length_sum == sum(len(answer.text) for answer in answers)
+    assert session.follow_up_sum == sum(len(answer.follow_ups) for answer in answers)
+    for skill in session.skills:
+        skill_answers = [answer for answer in answers if answer.question.skill == skill]
+        assert session.skill_tally(skill) == (len(skill_answers), sum(len(answer.text) for answer in skill_answers))
+    assert session.skill_adjustments() == skill_adjustments(ai.analyzer, answers, session.skills)
+    expected = ai.generate_feedback(answers, session.domain, session.skills,
+                                    CounterRandom(stream_seed(session.seed, "feedback")))
+    assert session.compute_feedback() == expected
+    if answers:
+        assert session.provisional_score() == expected.score
+
+def test_running_aggregates_match_a_full_recompute_after_every_answer():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    rng = random.Random(5)
+    for seed in range(8):
+        settings = InterviewSettings(number_of_questions=7, include_follow_ups=True, adaptive=seed % 2 == 1)
+        session = InterviewSession(ai.domains[0], rng.sample(SKILLS, rng.randint(1, 3)), settings, ai=ai, seed=seed)
+        _check_against_recompute(session)
+        while session.get_current_question() is not None:
+            follow_ups = [{"question": question, "answer": "it depends on the load"}
+                          for question in session.get_follow_up_questions()]
+            session.submit_answer(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 150))), follow_ups)
+            _check_against_recompute(session)
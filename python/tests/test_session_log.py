@@ -0,0 +1,104 @@
+import os
+import time
+
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI
+
+import session_log
+from benchmarks.synthetic import SKILLS, synthetic_registry
+
+def _session(ai, seed=1):
+    return InterviewSession(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=5), ai=ai, seed=seed)
+
+def _segment(directory):
+    return session_log._segment_path(directory, session_log._segment_numbers(directory)[-1])
+
+def test_recover_replays_events(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _session(ai)
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.record_start(session)
+        log.submit_answer(session, "first answer")
+        log.submit_answer(session, "second answer")
+        log.end_interview_early(session)
+    recovered = session_log.recover(str(tmp_path), ai)[session.session_id]
+    assert [answer.text for answer in recovered.answers] == ["first answer", "second answer"]
+    assert recovered.is_ended_early
+    assert recovered.compute_feedback() == session.compute_feedback()
+
+def test_events_after_a_torn_tail_survive_a_restart(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _session(ai)
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.record_start(session)
+        log.submit_answer(session, "first answer")
+    with open(_segment(str(tmp_path)), "ab") as f:
+        f.write(session_log.encode_record(session_log.ANSWER_SUBMITTED, {"id": session.session_id})[:-3])
+
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.submit_answer(session, "second answer")
+        log.submit_answer(session, "third answer")
+    recovered = session_log.recover(str(tmp_path), ai)[session.session_id]
+    assert [answer.text for answer in recovered.answers] == ["first answer", "second answer", "third answer"]
+
+def test_idle_log_is_fsynced_after_the_interval(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    log = session_log.SessionLog(str(tmp_path), fsync_every=1000, fsync_interval=0.05)
+    try:
+        log.record_start(_session(ai))
+        deadline = time.monotonic() + 5
+        while log._unsynced and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log._unsynced == 0
+        assert os.path.getsize(_segment(str(tmp_path))) > 0
+    finally:
+        log.close()
+
+def test_recover_restores_answer_qualities_without_analysis(tmp_path, monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _session(ai)
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.record_start(session)
+        log.submit_answer(session, "a hash map gives constant time lookups on average")
+        log.snapshot([session])
+        log.submit_answer(session, "second answer")
+
+    def analyze(question, text):
+        raise AssertionError("recovery analyzed an answer")
+    monkeypatch.setattr(ai.analyzer, "analyze", analyze)
+    recovered = session_log.recover(str(tmp_path), ai)[session.session_id]
+    assert recovered.qualities == session.qualities
+    assert recovered.skill_tallies == session.skill_tallies
+
+def test_failed_snapshot_keeps_the_log_open(tmp_path, monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    session = _session(ai)
+    with session_log.SessionLog(str(tmp_path)) as log:
+        log.record_start(session)
+        def started_body(session):
+            raise RuntimeError("disk full")
+        monkeypatch.setattr(session_log, "started_body", started_body)
+        try:
+            log.snapshot([session])
+        except RuntimeError:
+            pass
+        monkeypatch.undo()
+        log.submit_answer(session, "first answer")
+    recovered = session_log.recover(str(tmp_path), ai)[session.session_id]
+    assert [answer.text for answer in recovered.answers] == ["first answer"]
+
+def test_recover_skips_sessions_missing_from_the_bank(tmp_path, caplog):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    sessions = [_session(ai, seed) for seed in range(20)]
+    with session_log.SessionLog(str(tmp_path)) as log:
+        for session in sessions:
+            log.record_start(session)
+            log.submit_answer(session, "first answer")
+
+    smaller = MockInterviewAI(registry=synthetic_registry(100))
+    skipped = {}
+    recovered = session_log.recover(str(tmp_path), smaller, skipped)
+    missing = {session.session_id for session in sessions
+               if any(int(question.id[4:]) >= 100 for question in session.questions)}
+    assert missing and set(skipped) == missing
+    assert set(recovered) == {session.session_id for session in sessions} - missing
+    assert all(session_id in caplog.text for session_id in missing)
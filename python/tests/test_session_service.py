@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mock_interview_ai import InterviewSettings, MockInterviewAI, SessionNotFound
+
+import session_service
+from benchmarks.synthetic import SKILLS, synthetic_registry
+from feedback_cache import FeedbackCache
+from session_service import AsyncSessionManager, ServiceOverloaded
+
+SETTINGS = InterviewSettings(number_of_questions=5)
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Thread pool whose jobs wait until the gate opens"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.gate = threading.Event()
+        self.submitted = threading.Event()
+
+    def submit(self, fn, *args, **kwargs):
+        def gated():
+            self.gate.wait()
+            return fn(*args, **kwargs)
+        future = super().submit(gated)
+        self.submitted.set()
+        return future
+
+def test_answers_submitted_while_feedback_is_queued_do_not_change_it():
+    ai = MockInterviewAI(registry=synthetic_registry(1000), feedback_cache=FeedbackCache())
+    executor = GatedExecutor()
+
+    async def scenario():
+        manager = AsyncSessionManager(ai=ai, executor=executor)
+        session_id = await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS, seed=4)
+        await manager.submit_answer(session_id, "a short answer")
+        expected = manager.get_session(session_id).compute_feedback()
+        fingerprint = manager.get_session(session_id).fingerprint()
+
+        task = asyncio.create_task(manager.generate_feedback(session_id))
+        while not executor.submitted.is_set():
+            await asyncio.sleep(0.001)
+        await manager.submit_answer(session_id, "a much longer second answer about indexes, caches and queues " * 5)
+        executor.gate.set()
+        assert await task == expected
+        assert ai.feedback_cache.get(fingerprint) == expected
+        session = manager.get_session(session_id)
+        assert ai.feedback_cache.get(session.fingerprint()) is None
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+def test_session_limit_makes_room_by_expiring_idle_sessions(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    clock = FakeClock()
+    monkeypatch.setattr(session_service, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+
+    async def scenario():
+        manager = AsyncSessionManager(ai=ai, max_sessions=3, idle_timeout=60)
+        first, second, third = [await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS, seed=seed)
+                                for seed in range(3)]
+        with pytest.raises(ServiceOverloaded):
+            await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS)
+
+        clock.now += 50
+        await manager.submit_answer(second, "still here")
+        clock.now += 20  # first and third are now idle for 70 s, second for 20 s
+        fourth = await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS)
+        assert len(manager) == 2
+        with pytest.raises(SessionNotFound):
+            manager.get_session(first)
+        with pytest.raises(SessionNotFound):
+            await manager.get_current_question(third)
+        assert manager.get_session(second).answers[0].text == "still here"
+        manager.get_session(fourth)
+
+    asyncio.run(scenario())
+
+def test_expire_idle_drops_only_idle_sessions(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    clock = FakeClock()
+    monkeypatch.setattr(session_service, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+
+    async def scenario():
+        manager = AsyncSessionManager(ai=ai, idle_timeout=30)
+        session_ids = [await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS, seed=seed)
+                       for seed in range(6)]
+        clock.now += 20
+        for session_id in session_ids[::2]:
+            await manager.get_provisional_score(session_id)
+        clock.now += 20
+        assert manager.expire_idle() == 3
+        assert manager.expire_idle() == 0
+        assert len(manager) == 3
+        for session_id in session_ids[::2]:
+            manager.get_session(session_id)
+        await manager.close_session(session_ids[0])
+        with pytest.raises(SessionNotFound):
+            await manager.close_session(session_ids[0])
+
+    asyncio.run(scenario())
+
+def test_background_sweeper_expires_idle_sessions():
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+
+    async def scenario():
+        async with AsyncSessionManager(ai=ai, idle_timeout=0.02, sweep_interval=0.01) as manager:
+            await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS)
+            for _ in range(500):
+                if not len(manager):
+                    break
+                await asyncio.sleep(0.01)
+            assert len(manager) == 0
+
+    asyncio.run(scenario())
+
+def test_feedback_queue_and_concurrency_limits(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    score = ai.feedback_from_summary
+    executor = ThreadPoolExecutor(max_workers=4)
+    gate = threading.Event()
+    running = []
+    lock = threading.Lock()
+    peak = [0]
+
+    def feedback_from_summary(summary):
+        with lock:
+            running.append(summary)
+            peak[0] = max(peak[0], len(running))
+        gate.wait()
+        with lock:
+            running.remove(summary)
+        return score(summary)
+    monkeypatch.setattr(ai, "feedback_from_summary", feedback_from_summary)
+
+    async def scenario():
+        manager = AsyncSessionManager(ai=ai, executor=executor, max_feedback_concurrency=2, max_feedback_queue=2)
+        session_ids = [await manager.create_session(ai.domains[0], SKILLS[:2], SETTINGS, seed=seed)
+                       for seed in range(5)]
+        for session_id in session_ids:
+            await manager.submit_answer(session_id, "an answer")
+        tasks = [asyncio.create_task(manager.generate_feedback(session_id)) for session_id in session_ids[:4]]
+        while len(running) < 2:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.01)
+        assert manager._feedback_waiting == 2
+        with pytest.raises(ServiceOverloaded):
+            await manager.generate_feedback(session_ids[4])
+
+        gate.set()
+        results = await asyncio.gather(*tasks)
+        assert results == [manager.get_session(session_id).compute_feedback() for session_id in session_ids[:4]]
+        assert peak[0] == 2
+        assert manager._feedback_waiting == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        gate.set()
+        executor.shutdown()
@@ -0,0 +1,52 @@
+import pytest
+
+from mock_interview_ai import InterviewSession, InterviewSettings, MockInterviewAI, SessionNotFound
+
+from binary_format import FormatError
+from benchmarks.synthetic import SKILLS, synthetic_registry
+from session_store import DiskSessionStore, InMemorySessionStore, SessionStore
+
+def _create(store, ai):
+    return store.create(ai.domains[0], SKILLS[:2], InterviewSettings(number_of_questions=3), seed=5)
+
+def test_truncated_session_file_raises_and_is_kept(tmp_path):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    with DiskSessionStore(str(tmp_path), num_shards=4, ai=ai) as store:
+        session_id = _create(store, ai)
+        store.submit_answer(session_id, "an answer long enough to be analyzed")
+        path = store._path(store.shard_for(session_id), session_id)
+        with open(path, "rb") as f:
+            data = f.read()
+        for length in (len(data) - 1, len(data) // 2, 10):
+            with open(path, "wb") as f:
+                f.write(data[:length])
+            with pytest.raises(FormatError, match="Corrupt session file"):
+                store.get(session_id)
+            with pytest.raises(FormatError):
+                session_id in store
+            with pytest.raises(FormatError):
+                store.submit_answer(session_id, "another answer")
+            with open(path, "rb") as f:
+                assert f.read() == data[:length]
+        with pytest.raises(SessionNotFound):
+            store.get("missing")
+
+def test_session_store_backends_must_implement_storage():
+    with pytest.raises(TypeError):
+        SessionStore()
+
+def test_feedback_is_computed_under_the_shard_lock(monkeypatch):
+    ai = MockInterviewAI(registry=synthetic_registry(1000))
+    store = InMemorySessionStore(num_shards=4, ai=ai)
+    session_id = _create(store, ai)
+    store.submit_answer(session_id, "first answer")
+    lock = store._locks[store.shard_for(session_id)]
+    compute_feedback = InterviewSession.compute_feedback
+    held = []
+
+    def checked_compute_feedback(session):
+        held.append(lock.locked())
+        return compute_feedback(session)
+    monkeypatch.setattr(InterviewSession, "compute_feedback", checked_compute_feedback)
+    assert store.generate_feedback(session_id) == compute_feedback(store.get(session_id))
+    assert held == [True]